@@ -15,6 +15,7 @@ from uuid import uuid4
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Command
 
 from app.agents.workflow_state import WorkflowState, create_initial_state
 from app.agents.workflow_nodes import (
@@ -382,8 +383,6 @@ class AnalysisAgentLangGraph:
         Returns:
             Final workflow state
         """
-        from langgraph.types import Command
-
         logger.info(f"Resuming workflow for session {session_id}")
 
         if not self.checkpointer:
@@ -396,7 +395,8 @@ class AnalysisAgentLangGraph:
         # Add Langfuse callback with custom metadata if available
         if self.langfuse_handler and LANGFUSE_AVAILABLE:
             # Get the current state to extract query info for the trace name
-            current_state = self.get_state(session_id)
+            # (the only checkpoint read before resuming, so only when tracing)
+            current_state = await self.aget_state(session_id)
             query = current_state.get("query", "Resume") if current_state else "Resume"
             user_id = current_state.get("user_id") if current_state else None
 
@@ -480,6 +480,28 @@ class AnalysisAgentLangGraph:
             logger.error(f"Failed to get state: {e}")
             return None
 
+    async def aget_state(self, session_id: str) -> Optional[WorkflowState]:
+        """
+        Get current state for a session without blocking the event loop.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Current state or None
+        """
+        if not self.checkpointer:
+            return None
+
+        config = {"configurable": {"thread_id": session_id}}
+
+        try:
+            snapshot = await self.workflow.aget_state(config)
+            return snapshot.values if snapshot else None
+        except Exception as e:
+            logger.error(f"Failed to get state: {e}")
+            return None
+
     async def stream(
         self,
         query: str,
@@ -620,8 +642,6 @@ class AnalysisAgentLangGraph:
         Yields:
             State updates as workflow resumes
         """
-        from langgraph.types import Command
-
         logger.info(f"Resuming workflow with streaming for session {session_id}")
 
         if not self.checkpointer:
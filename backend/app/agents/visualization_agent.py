@@ -18,7 +18,7 @@ from app.agents.visualization_nodes import (
     create_plotly_figure_node,
     apply_theme_node,
     generate_insights_node,
-    route_after_theme,
+    route_after_recommendation,
 )
 from app.core.llm import LLMClient
 from app.core.config import settings
@@ -31,7 +31,8 @@ class VisualizationAgent:
     LangGraph-based Visualization Agent.
 
     Workflow:
-    START → recommend_chart → create_plotly_figure → apply_theme → [generate_insights?] → END
+    START → recommend_chart → create_plotly_figure → apply_theme → END
+                            ↘ [generate_insights?] → END   (in parallel)
 
     Features:
     - Plotly-based chart generation
@@ -69,7 +70,8 @@ class VisualizationAgent:
         - recommend_chart: Recommend best chart type
         - create_plotly_figure: Generate Plotly figure
         - apply_theme: Apply styling and branding
-        - generate_insights: (Optional) Generate AI insights
+        - generate_insights: (Optional) Generate AI insights, run in parallel
+          with create_plotly_figure since it only needs data and chart type
 
         Returns:
             Compiled StateGraph
@@ -98,18 +100,15 @@ class VisualizationAgent:
 
         # Add edges
         workflow.add_edge(START, "recommend_chart")
-        workflow.add_edge("recommend_chart", "create_plotly_figure")
-        workflow.add_edge("create_plotly_figure", "apply_theme")
 
-        # Conditional edge: insights or end?
+        # Fan out: figure creation plus (optionally) insights in the same step
         workflow.add_conditional_edges(
-            "apply_theme",
-            route_after_theme,
-            {
-                "generate_insights": "generate_insights",
-                "end": END,
-            }
+            "recommend_chart",
+            route_after_recommendation,
+            ["create_plotly_figure", "generate_insights"],
         )
+        workflow.add_edge("create_plotly_figure", "apply_theme")
+        workflow.add_edge("apply_theme", END)
         workflow.add_edge("generate_insights", END)
 
         # Compile workflow with checkpointing
@@ -5,7 +5,7 @@ LangGraph workflow nodes for VisualizationAgent.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 
 from app.agents.visualization_state import VisualizationState
@@ -156,8 +156,13 @@ async def apply_theme_node(
     2. Custom style profile (legacy)
     3. Plotly theme (fallback)
 
+    Last node of the workflow: insights (if requested) run in parallel with
+    figure creation and have finished by the time styling completes.
+
     Updates state:
     - plotly_figure (updated with styling)
+    - completed_at
+    - workflow_status: "completed"
     """
     logger.info(f"[Node: apply_theme] Applying theme: {state['plotly_theme']}")
 
@@ -277,8 +282,9 @@ async def apply_theme_node(
         logger.info("[Node: apply_theme] Theme applied successfully")
 
         return {
-            "workflow_status": "styling",
+            "workflow_status": "completed",
             "plotly_figure": plotly_figure_dict,
+            "completed_at": datetime.utcnow().isoformat(),
         }
 
     except Exception as e:
@@ -286,7 +292,8 @@ async def apply_theme_node(
         # Non-fatal error - return figure as-is
         return {
             "warnings": [f"Theme application failed: {str(e)}, using default styling"],
-            "workflow_status": "styling",
+            "workflow_status": "completed",
+            "completed_at": datetime.utcnow().isoformat(),
         }
 
 
@@ -302,11 +309,11 @@ async def generate_insights_node(
     Generate natural language insights about the visualization.
 
     Uses LLM to analyze data and chart to produce meaningful insights.
+    Only needs the data and chart type, so it runs in parallel with
+    create_plotly_figure/apply_theme and leaves workflow_status to them.
 
     Updates state:
     - chart_insights (accumulated)
-    - completed_at
-    - workflow_status: "completed"
     """
     logger.info("[Node: generate_insights] Generating chart insights")
 
@@ -324,17 +331,13 @@ async def generate_insights_node(
 
         return {
             "chart_insights": insights,
-            "workflow_status": "completed",
-            "completed_at": datetime.utcnow().isoformat(),
         }
 
     except Exception as e:
         logger.error(f"[Node: generate_insights] Failed: {e}")
-        # Non-fatal - still mark as completed
+        # Non-fatal - figure branch still completes the workflow
         return {
             "warnings": [f"Insight generation failed: {str(e)}"],
-            "workflow_status": "completed",
-            "completed_at": datetime.utcnow().isoformat(),
         }
 
 
@@ -365,16 +368,19 @@ def should_generate_insights(state: VisualizationState) -> str:
         return "end"
 
 
-def route_after_theme(state: VisualizationState) -> str:
+def route_after_recommendation(state: VisualizationState) -> List[str]:
     """
-    Route after theme application.
+    Route after chart recommendation.
 
-    Wrapper for should_generate_insights with proper state updates.
+    Figure creation always runs; insight generation (an LLM call that only
+    needs the data and chart type) is fanned out alongside it when requested.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Next node name: "generate_insights" or "end"
+        Next node names to run in parallel
     """
-    return should_generate_insights(state)
+    if should_generate_insights(state) == "generate_insights":
+        return ["create_plotly_figure", "generate_insights"]
+    return ["create_plotly_figure"]
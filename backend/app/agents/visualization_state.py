@@ -6,6 +6,7 @@ State management for VisualizationAgent workflow using LangGraph.
 
 from typing import TypedDict, Optional, Dict, Any, List, Annotated
 from operator import add
+from datetime import datetime
 
 
 class VisualizationState(TypedDict):
@@ -83,8 +84,6 @@ def create_initial_visualization_state(
     Returns:
         Initial VisualizationState
     """
-    from datetime import datetime
-
     return VisualizationState(
         # Input
         visualization_id=visualization_id,
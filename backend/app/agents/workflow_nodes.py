@@ -9,13 +9,18 @@ Each node is a function that:
 Nodes are composable and can be chained together by LangGraph.
 """
 
+import json
 import logging
+import re
 from typing import Dict, Any
 from datetime import datetime
 
+from langgraph.types import interrupt
+
 from app.agents.workflow_state import WorkflowState
 from app.core.llm import LLMClient
 from app.core.config import settings
+from app.core.errors import is_transient_error
 from app.core.prompts import PromptType, get_prompt
 from app.services.mindsdb_service import MindsDBService
 from app.services.hitl_service import HITLService
@@ -26,7 +31,8 @@ from app.tools.sql_tools import (
     execute_sql_query,
 )
 from app.tools.analysis_tools import analyze_data
-import json
+from app.tools.statistical_tools import correlation_analysis, trend_analysis
+from app.schemas.sql_schemas import SQLValidationResult, SQLValidationIssue
 
 logger = logging.getLogger(__name__)
 
@@ -167,8 +173,7 @@ async def handle_non_analysis_node(
         )
 
     # Calculate execution time
-    from datetime import datetime as dt
-    started_at = dt.fromisoformat(state["started_at"])
+    started_at = datetime.fromisoformat(state["started_at"])
     completed_at = datetime.utcnow()
     execution_time_ms = int((completed_at - started_at).total_seconds() * 1000)
 
@@ -221,6 +226,7 @@ async def explore_schema_node(
         logger.error(f"Schema exploration failed: {e}")
         return {
             "errors": [f"Schema exploration failed: {str(e)}"],
+            "dependency_error": is_transient_error(e),
             "workflow_status": "failed",
         }
 
@@ -276,6 +282,7 @@ async def generate_sql_node(
         logger.error(f"SQL generation failed: {e}")
         return {
             "errors": [f"SQL generation failed: {str(e)}"],
+            "dependency_error": is_transient_error(e),
             "workflow_status": "failed",
         }
 
@@ -285,6 +292,37 @@ async def generate_sql_node(
 # ============================================
 
 
+# Choices offered for SQL review (shared, read-only)
+REVIEW_OPTIONS = [
+    {
+        "action": "approve",
+        "label": "Execute as-is",
+        "description": "Execute the generated SQL",
+    },
+    {
+        "action": "modify",
+        "label": "Modify SQL",
+        "description": "Provide modified SQL",
+    },
+    {
+        "action": "reject",
+        "label": "Reject",
+        "description": "Reject and stop",
+    },
+]
+
+
+def _build_review_context(state: WorkflowState) -> Dict[str, Any]:
+    """Context shown to the reviewer, shared by the notification and the interrupt."""
+    return {
+        "generated_sql": state["generated_sql"],
+        "confidence": state["confidence"],
+        "explanation": state["explanation"],
+        "warnings": state["warnings"],
+        "intent": state["intent"],
+    }
+
+
 async def human_review_node(
     state: WorkflowState,
     hitl_service: HITLService,
@@ -302,22 +340,16 @@ async def human_review_node(
     Returns:
         State updates
     """
-    from langgraph.types import interrupt
-
     logger.info("[Node: human_review] Requesting approval...")
 
     try:
+        context = _build_review_context(state)
+
         # Optional: Send WebSocket notification that workflow is paused
         if hitl_service:
             await hitl_service.notify_intervention_requested(
                 session_id=state["session_id"],
-                context={
-                    "generated_sql": state["generated_sql"],
-                    "confidence": state["confidence"],
-                    "explanation": state["explanation"],
-                    "warnings": state["warnings"],
-                    "intent": state["intent"],
-                }
+                context=context,
             )
 
         # Pause workflow and wait for human input
@@ -326,30 +358,8 @@ async def human_review_node(
             "type": "human_review",
             "session_id": state["session_id"],
             "intervention_type": "approve_query",
-            "context": {
-                "generated_sql": state["generated_sql"],
-                "confidence": state["confidence"],
-                "explanation": state["explanation"],
-                "warnings": state["warnings"],
-                "intent": state["intent"],
-            },
-            "options": [
-                {
-                    "action": "approve",
-                    "label": "Execute as-is",
-                    "description": "Execute the generated SQL",
-                },
-                {
-                    "action": "modify",
-                    "label": "Modify SQL",
-                    "description": "Provide modified SQL",
-                },
-                {
-                    "action": "reject",
-                    "label": "Reject",
-                    "description": "Reject and stop",
-                },
-            ],
+            "context": context,
+            "options": REVIEW_OPTIONS,
         })
 
         # When execution resumes, human_response contains the user's decision
@@ -503,8 +513,6 @@ async def advanced_validate_sql(
     Returns:
         SQLValidationResult with issues and suggested fixes
     """
-    from app.schemas.sql_schemas import SQLValidationResult, SQLValidationIssue, SQLErrorCategory
-
     logger.info("[Advanced Validation] Analyzing query for subtle errors...")
 
     # Build comprehensive validation prompt
@@ -669,6 +677,7 @@ async def execute_query_node(
             "row_count": result.row_count,
             "execution_time_ms": result.execution_time_ms,
             "query_error": result.error,
+            "dependency_error": result.transient,
             "workflow_status": "executing" if result.success else "failed",
         }
 
@@ -677,6 +686,7 @@ async def execute_query_node(
         return {
             "query_success": False,
             "query_error": str(e),
+            "dependency_error": is_transient_error(e),
             "workflow_status": "failed",
         }
 
@@ -855,8 +865,6 @@ async def enhanced_analysis_node(
     Returns:
         State updates with enhanced_analysis results
     """
-    from app.tools.statistical_tools import correlation_analysis, trend_analysis
-
     logger.info("Enhanced analysis node: Determining additional analysis needed")
 
     try:
@@ -914,9 +922,6 @@ Examples:
         )
 
         # Parse LLM response
-        import json
-        import re
-
         # Extract JSON from response
         response_text = llm_response.content
         json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
@@ -80,6 +80,7 @@ class WorkflowState(TypedDict):
 
     # Error tracking
     errors: Annotated[List[str], operator.add]
+    dependency_error: bool  # Last failure was an unavailable LLM/MindsDB, not the query
 
     # Workflow control
     workflow_status: str  # created, analyzing, reviewing, executing, completed, failed
@@ -174,6 +175,7 @@ def create_initial_state(
 
         # Errors
         errors=[],
+        dependency_error=False,
 
         # Workflow control
         workflow_status="created",
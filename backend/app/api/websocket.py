@@ -91,6 +91,7 @@ async def websocket_endpoint(
     - stage.completed
     - agent.started
     - agent.completed
+    - stage_and_agent.started (a stage that starts by running an agent)
     - workflow.completed
     - workflow.failed
 
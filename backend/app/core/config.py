@@ -154,6 +154,31 @@ class AgentSettings(BaseSettings):
     # Cache settings
     schema_cache_ttl: int = Field(default=7200, description="Schema cache TTL in seconds (2 hours)")
     query_cache_ttl: int = Field(default=3600, description="Query cache TTL in seconds (1 hour)")
+    viz_decision_cache_ttl: int = Field(
+        default=86400,
+        description="Visualization decision cache TTL in seconds (24 hours)"
+    )
+    viz_decision_cache_size: int = Field(default=1024, description="Max cached visualization decisions")
+    viz_decision_speculation: bool = Field(
+        default=True,
+        description="Ask for the visualization decision while the analysis agent runs (keyword-ambiguous queries only)"
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive transient failures before a workflow dependency fails fast"
+    )
+    circuit_breaker_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds an open dependency circuit fails fast before a trial call"
+    )
+    execution_cache_enabled: bool = Field(
+        default=True,
+        description="Use Redis for agent subgraph results and visualization plan templates"
+    )
+    execution_cache_ttl: int = Field(
+        default=300,
+        description="Max age in seconds of subgraph results reused for requests with cache_results"
+    )
 
     # Performance limits
     max_response_time_ms: int = Field(default=5000, description="Max response time in milliseconds")
@@ -0,0 +1,93 @@
+"""
+Transient Dependency Errors
+
+Classification and retry policy, shared by the agents, services and
+workflows, for failures of the LLM provider or MindsDB transport that are
+worth retrying and that count as a dependency outage: connection failures,
+client/API timeouts, rate limits and provider 5xx responses.
+
+Errors the caller caused (bad SQL, a statement timeout inside the database,
+schema validation failures) are not transient.
+"""
+
+import random
+
+import httpx
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+# Errors (or causes of wrapped LLMError/MindsDBError) from an unavailable
+# dependency; APIConnectionError includes APITimeoutError and
+# httpx.TransportError includes client timeouts
+TRANSIENT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    httpx.TransportError,
+    APIConnectionError,
+    RateLimitError,
+    InternalServerError,
+)
+
+# Retry budget and backoff for transient errors
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY_SECONDS = 1.0
+_RETRY_MAX_DELAY_SECONDS = 30.0
+_RETRY_JITTER = 0.5  # Up to +50% per delay, so concurrent retries spread out
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check an error and its cause chain for a transient failure.
+
+    Args:
+        error: Exception that occurred
+
+    Returns:
+        True for connection failures, timeouts, rate limits and provider 5xx
+    """
+    while error is not None:
+        if isinstance(error, TRANSIENT_ERRORS):
+            return True
+        error = error.__cause__
+    return False
+
+
+class RetryPolicy:
+    """
+    Retry policies for transient errors.
+
+    Transient errors are connection failures, timeouts, rate limits and
+    provider 5xx responses, including when wrapped (raise ... from) by
+    LLMError or MindsDBError. Used by the MindsDBService retry loops.
+    """
+
+    @staticmethod
+    def should_retry(error: Exception, retry_count: int) -> bool:
+        """
+        Determine if an operation should be retried.
+
+        Args:
+            error: Exception that occurred
+            retry_count: Current retry attempt count
+
+        Returns:
+            True if should retry, False otherwise
+        """
+        return retry_count < _MAX_RETRIES and is_transient_error(error)
+
+    @staticmethod
+    def get_retry_delay(retry_count: int) -> float:
+        """
+        Calculate retry delay with jittered exponential backoff.
+
+        Args:
+            retry_count: Current retry attempt count
+
+        Returns:
+            Delay in seconds
+        """
+        # Exponential backoff: 1s, 2s, 4s, 8s, ... plus jitter, capped at 30s
+        delay = _RETRY_BASE_DELAY_SECONDS * 2 ** retry_count * (1 + random.random() * _RETRY_JITTER)
+        return min(delay, _RETRY_MAX_DELAY_SECONDS)
+
+
+retry_policy = RetryPolicy()
@@ -10,14 +10,15 @@ This module provides a production-ready wrapper around Azure OpenAI with:
 """
 
 import asyncio
+import json
 import logging
 from typing import Any, Optional, Dict, List
 from datetime import datetime
 import time
 
 from openai import AsyncAzureOpenAI, AzureOpenAI
-from openai import OpenAIError, RateLimitError, APITimeoutError
-from pydantic import BaseModel
+from openai import OpenAIError, RateLimitError, APITimeoutError, BadRequestError
+from pydantic import BaseModel, ValidationError
 
 from app.core.config import settings
 
@@ -408,9 +409,6 @@ class LLMClient:
         Raises:
             LLMError: If generation fails or response doesn't match schema
         """
-        import json
-        from pydantic import ValidationError
-
         temperature = temperature if temperature is not None else self.config.agent_temperature
         max_tokens = max_tokens if max_tokens is not None else self.config.agent_max_tokens
 
@@ -466,8 +464,7 @@ Important:
 
                     # Parse and validate the JSON response
                     try:
-                        json_data = json.loads(response.content)
-                        validated_result = schema(**json_data)
+                        validated_result = schema.model_validate_json(response.content)
 
                         logger.info(
                             f"Structured generation (LangChain+Langfuse) successful: {latency_ms}ms latency"
@@ -475,7 +472,7 @@ Important:
 
                         return validated_result
 
-                    except (json.JSONDecodeError, ValidationError) as e:
+                    except ValidationError as e:
                         logger.warning(f"Schema validation failed on attempt {attempt + 1}: {e}")
                         if attempt < self.config.agent_retry_attempts - 1:
                             continue
@@ -497,8 +494,8 @@ Important:
 
                 # Parse and validate against schema
                 try:
-                    json_data = json.loads(content)
-                    validated_result = schema(**json_data)
+                    # Parse and validate in one pass (no intermediate dict)
+                    validated_result = schema.model_validate_json(content)
 
                     logger.info(
                         f"Structured generation successful: {response.usage.total_tokens} tokens, "
@@ -507,7 +504,7 @@ Important:
 
                     return validated_result
 
-                except (json.JSONDecodeError, ValidationError) as e:
+                except ValidationError as e:
                     logger.warning(f"Schema validation failed on attempt {attempt + 1}: {e}")
                     if attempt < self.config.agent_retry_attempts - 1:
                         # Retry with more explicit instructions
@@ -544,6 +541,130 @@ Important:
 
         raise LLMError(f"Failed after {self.config.agent_retry_attempts} attempts")
 
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[BaseModel],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> BaseModel:
+        """
+        Generate output decoded by the provider's structured-output mode.
+
+        Unlike generate_with_schema, the API constrains the response to the
+        schema and returns it parsed, so there is no JSON parse/validate retry.
+        Deployments whose API version lacks structured outputs fall back to
+        generate_with_schema.
+
+        Args:
+            prompt: User prompt for generation
+            schema: Pydantic model class defining the expected structure
+            system_prompt: Optional system prompt (sent first, unchanged)
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            metadata: Additional metadata
+
+        Returns:
+            Instance of the schema model
+
+        Raises:
+            LLMError: If generation fails or the model refuses
+        """
+        temperature = temperature if temperature is not None else self.config.agent_temperature
+        max_tokens = max_tokens if max_tokens is not None else self.config.agent_max_tokens
+
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        # Attempt with retries
+        for attempt in range(self.config.agent_retry_attempts):
+            try:
+                start_time = time.time()
+
+                # Use LangChain client if Langfuse is enabled for automatic tracing
+                if self._langchain_client and self.langfuse_handler:
+                    structured_client = self._langchain_client.with_structured_output(
+                        schema, method="json_schema", strict=True
+                    )
+                    result = await structured_client.ainvoke(
+                        messages,
+                        config={
+                            "callbacks": [self.langfuse_handler],
+                            "metadata": {
+                                "schema": schema.__name__,
+                                "attempt": attempt + 1,
+                                **(metadata or {}),
+                            },
+                        },
+                    )
+                else:
+                    # Fallback to direct OpenAI client
+                    response = await self.async_client.chat.completions.parse(
+                        model=self.config.azure_openai_deployment,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        response_format=schema,
+                    )
+                    message = response.choices[0].message
+                    if message.parsed is None:
+                        raise LLMError(f"Model refused structured output: {message.refusal}")
+                    result = message.parsed
+
+                latency_ms = int((time.time() - start_time) * 1000)
+                logger.info(f"Structured generation ({schema.__name__}) successful: {latency_ms}ms latency")
+
+                return result
+
+            except BadRequestError as e:
+                # API version without structured outputs: use JSON mode instead
+                logger.warning(f"Structured outputs unavailable, falling back to JSON mode: {e}")
+                if system_prompt:
+                    prompt = f"{system_prompt}\n\n{prompt}"
+                return await self.generate_with_schema(
+                    prompt=prompt,
+                    schema=schema,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    metadata=metadata,
+                )
+
+            except RateLimitError as e:
+                logger.warning(f"Rate limit hit on attempt {attempt + 1}: {e}")
+                if attempt < self.config.agent_retry_attempts - 1:
+                    wait_time = 2 ** attempt
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise LLMError(f"Rate limit exceeded after {self.config.agent_retry_attempts} attempts") from e
+
+            except APITimeoutError as e:
+                logger.warning(f"Timeout on attempt {attempt + 1}: {e}")
+                if attempt < self.config.agent_retry_attempts - 1:
+                    wait_time = 2 ** attempt
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise LLMError(f"Request timeout after {self.config.agent_retry_attempts} attempts") from e
+
+            except OpenAIError as e:
+                logger.error(f"OpenAI API error on attempt {attempt + 1}: {e}")
+                if attempt < self.config.agent_retry_attempts - 1:
+                    wait_time = 2 ** attempt
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise LLMError(f"OpenAI API error: {str(e)}") from e
+
+            except LLMError:
+                raise
+
+            except Exception as e:
+                logger.error(f"Unexpected error during structured generation: {e}")
+                raise LLMError(f"Unexpected error: {str(e)}") from e
+
+        raise LLMError(f"Failed after {self.config.agent_retry_attempts} attempts")
+
     def close(self):
         """Close the clients and cleanup resources."""
         if self._sync_client:
@@ -0,0 +1,138 @@
+"""
+Visualization Decision Cache
+
+In-process cache for the unified workflow's "should we visualize?" LLM
+decision. The same question shapes recur heavily within a deployment, so
+decisions are keyed on a normalized form of the inputs:
+- user query (lowercased, whitespace collapsed)
+- sorted column names
+- row count bucket (order of magnitude)
+
+Plan templates (plan_template_key) drop the query text in favour of its
+keyword intent label, so a decision can be reused across workflows that ask
+the same kind of question over the same result shape.
+
+Entries expire after a TTL and the least recently used entry is evicted
+once the cache is full.
+"""
+
+import bisect
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Upper bounds of the row count buckets; counts above the last share one bucket
+_ROW_COUNT_BUCKETS = (1, 10, 100, 1000, 10000)
+
+
+def row_count_bucket(row_count: int) -> int:
+    """Map a row count to its order-of-magnitude bucket index."""
+    return bisect.bisect_left(_ROW_COUNT_BUCKETS, row_count)
+
+
+def decision_cache_key(user_query: str, columns: List[str], row_count: int) -> str:
+    """
+    Build the cache key for a visualization decision.
+
+    Args:
+        user_query: User's natural language query
+        columns: Result column names
+        row_count: Number of result rows
+
+    Returns:
+        SHA-256 hex digest of the normalized inputs
+    """
+    normalized_query = " ".join(user_query.lower().split())
+    raw = f"{normalized_query}|{','.join(sorted(columns))}|{row_count_bucket(row_count)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def plan_template_key(database: str, intent_label: str, columns: List[str], row_count: int) -> str:
+    """
+    Build the key for a visualization plan template.
+
+    Unlike decision_cache_key this ignores the query text: templates are shared
+    by all queries with the same intent label over the same result shape.
+
+    Args:
+        database: Database the query ran against
+        intent_label: Query intent label from the keyword classifier
+        columns: Result column names
+        row_count: Number of result rows
+
+    Returns:
+        "<database>:<intent_label>:<shape hash>"
+    """
+    raw = f"{','.join(sorted(columns))}|{row_count_bucket(row_count)}"
+    shape_hash = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    return f"{database}:{intent_label}:{shape_hash}"
+
+
+class VizDecisionCache:
+    """LRU cache of visualization decisions with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 86400):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached decisions
+            ttl_seconds: Time-to-live for each decision in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at monotonic seconds, decision)
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached decision.
+
+        Args:
+            key: Key from decision_cache_key
+
+        Returns:
+            Copy of the cached decision, or None if missing/expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, decision = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(decision)
+
+    def set(self, key: str, decision: Dict[str, Any]) -> None:
+        """
+        Cache a decision.
+
+        Args:
+            key: Key from decision_cache_key
+            decision: Parsed LLM decision dict
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(decision))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached decisions."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instance
+viz_decision_cache = VizDecisionCache(
+    max_entries=settings.agent.viz_decision_cache_size,
+    ttl_seconds=settings.agent.viz_decision_cache_ttl,
+)
@@ -44,6 +44,7 @@ from app.schemas.visualization_schemas import (
     VisualizationResponse,
     VisualizationListResponse,
     ChartRecommendation,
+    VizDecision,
     PlotlyFigureResponse,
     # Custom style profile schemas
     CustomStyleProfileCreate,
@@ -88,6 +89,7 @@ __all__ = [
     "VisualizationResponse",
     "VisualizationListResponse",
     "ChartRecommendation",
+    "VizDecision",
     "PlotlyFigureResponse",
     # Custom style profile schemas
     "CustomStyleProfileCreate",
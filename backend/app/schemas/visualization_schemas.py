@@ -5,7 +5,7 @@ Schemas for visualization API requests and responses.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 
 
@@ -47,6 +47,16 @@ class ChartRecommendation(BaseModel):
     data_characteristics: Dict[str, Any] = Field(default_factory=dict, description="Data analysis that led to recommendation")
 
 
+class VizDecision(BaseModel):
+    """LLM decision on whether to visualize query results."""
+
+    should_visualize: bool = Field(..., description="Whether a chart would help answer the query")
+    reasoning: str = Field(..., description="Brief explanation (1 sentence)")
+    suggested_chart_type: Optional[Literal["bar", "line", "pie", "scatter", "heatmap", "table"]] = Field(
+        None, description="Suggested chart type, or null"
+    )
+
+
 class PlotlyFigureResponse(BaseModel):
     """Plotly figure with metadata."""
 
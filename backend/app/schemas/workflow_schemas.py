@@ -81,8 +81,13 @@ class UnifiedWorkflowOptions(BaseModel):
 
     # Performance options
     cache_results: bool = Field(
-        default=True,
-        description="Enable result caching (future feature)"
+        default=False,
+        description="Reuse the result of an identical earlier request, up to "
+                    "agent.execution_cache_ttl seconds old (flagged in warnings)"
+    )
+    refresh_cache: bool = Field(
+        default=False,
+        description="Re-run the request and replace its cached result"
     )
     timeout_seconds: int = Field(
         default=30,
@@ -24,6 +24,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.repositories.hitl_repository import HITLRepository
+from app.websocket.connection_manager import connection_manager
+from app.websocket.events import create_workflow_event, WorkflowEventType
 from app.observability.hitl_tracing import (
     trace_hitl_request,
     trace_hitl_response,
@@ -143,7 +145,7 @@ class HITLService:
 
         Flow:
         1. Create intervention request (stored in DB if available)
-        2. Broadcast via WebSocket (if available)
+        2. Broadcast via WebSocket (if available), concurrently with the DB commit
         3. Wait for response with timeout
         4. Update status in DB
         5. Return outcome
@@ -174,8 +176,10 @@ class HITLService:
 
         timeout_seconds = timeout or self.default_timeout
 
-        # Convert dict options to HumanInputOption models
+        # Convert dict options to HumanInputOption models (validated), and
+        # dump them once for the DB row, the trace and the broadcast
         option_models = [HumanInputOption(**opt) for opt in options]
+        option_dicts = [opt.model_dump() for opt in option_models]
 
         # Create request (persist to DB if available)
         if self.repository:
@@ -184,14 +188,14 @@ class HITLService:
                 workflow_id=session_id,
                 intervention_type=intervention_type,
                 context=context,
-                options=[opt.model_dump() for opt in option_models],
+                options=option_dicts,
                 timeout_seconds=timeout_seconds,
                 conversation_id=conversation_id,
                 requester_user_id=requester_user_id,
                 company_id=company_id,
                 required=required,
             )
-            await self.db_session.commit()
+            # Committed below, concurrently with the WebSocket broadcast
 
             request_id = db_request.request_id
             requested_at = db_request.requested_at
@@ -236,13 +240,24 @@ class HITLService:
             workflow_id=session_id,
             intervention_type=intervention_type,
             context=context,
-            options=[opt.model_dump() for opt in option_models],
+            options=option_dicts,
             timeout_seconds=timeout_seconds,
             required=required,
         )
 
-        # Broadcast via WebSocket
-        await self._broadcast_intervention_request(request)
+        # Broadcast via WebSocket. The event only needs the request_id, which
+        # create_request already assigned, so it does not wait for the commit.
+        if self.repository:
+            try:
+                await asyncio.gather(
+                    self.db_session.commit(),
+                    self._broadcast_intervention_request(request, option_dicts),
+                )
+            except Exception:
+                self._pending_requests.pop(request_id, None)
+                raise
+        else:
+            await self._broadcast_intervention_request(request, option_dicts)
 
         # Wait for response with timeout
         try:
@@ -534,15 +549,20 @@ class HITLService:
         #     "context": context
         # })
 
-    async def _broadcast_intervention_request(self, request: HumanInputRequest):
+    async def _broadcast_intervention_request(
+        self,
+        request: HumanInputRequest,
+        option_dicts: Optional[List[Dict[str, Any]]] = None,
+    ):
         """
         Broadcast intervention request via WebSocket.
 
         Args:
             request: HumanInputRequest to broadcast
+            option_dicts: request.options already dumped to dicts, if available
         """
-        from app.websocket.connection_manager import connection_manager
-        from app.websocket.events import create_workflow_event, WorkflowEventType
+        if option_dicts is None:
+            option_dicts = [opt.model_dump() for opt in request.options]
 
         logger.info(
             f"Broadcasting HITL request {request.request_id} for workflow {request.session_id}"
@@ -558,7 +578,7 @@ class HITLService:
                 "request_id": request.request_id,
                 "intervention_type": request.intervention_type,
                 "context": request.context,
-                "options": [opt.model_dump() for opt in request.options],
+                "options": option_dicts,
                 "timeout_seconds": request.timeout_seconds,
                 "timeout_at": request.timeout_at.isoformat(),
             },
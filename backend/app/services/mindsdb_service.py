@@ -21,6 +21,7 @@ import httpx
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.errors import is_transient_error, retry_policy
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ class QueryResult(BaseModel):
     row_count: int = 0
     execution_time_ms: int = 0
     error: Optional[str] = None
+    transient: bool = False  # Failed on an unavailable MindsDB (not the query itself)
 
 
 class SchemaInfo(BaseModel):
@@ -221,34 +223,39 @@ class MindsDBService:
                     error_msg = f"HTTP {response.status_code}: {response.text}"
                     logger.warning(f"Query execution failed (attempt {attempt + 1}): {error_msg}")
 
-                    if attempt < self.max_retries - 1:
-                        await asyncio.sleep(2**attempt)  # Exponential backoff
+                    # Retry an unavailable MindsDB, not a rejected query
+                    transient = response.status_code == 429 or response.status_code >= 500
+                    if transient and attempt < self.max_retries - 1:
+                        await asyncio.sleep(retry_policy.get_retry_delay(attempt))
                         continue
 
                     return QueryResult(
                         success=False,
                         error=error_msg,
                         execution_time_ms=execution_time_ms,
+                        transient=transient,
                     )
 
             except httpx.TimeoutException:
                 logger.warning(f"Query timeout (attempt {attempt + 1})")
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
+                    await asyncio.sleep(retry_policy.get_retry_delay(attempt))
                     continue
                 return QueryResult(
                     success=False,
                     error="Query execution timeout",
+                    transient=True,
                 )
 
             except httpx.RequestError as e:
                 logger.error(f"Request error (attempt {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2**attempt)
+                if attempt < self.max_retries - 1 and retry_policy.should_retry(e, attempt):
+                    await asyncio.sleep(retry_policy.get_retry_delay(attempt))
                     continue
                 return QueryResult(
                     success=False,
                     error=f"Request error: {str(e)}",
+                    transient=is_transient_error(e),
                 )
 
             except Exception as e:
@@ -399,7 +406,8 @@ class MindsDBService:
 
     async def get_tables(self, database: str) -> List[Dict[str, Any]]:
         """
-        Retrieve list of tables from a specific database.
+        Retrieve list of tables from a specific database, retrying
+        connection errors and timeouts.
 
         Args:
             database: Database name
@@ -410,36 +418,43 @@ class MindsDBService:
         Raises:
             MindsDBError: If retrieval fails
         """
-        try:
-            client = await self._get_client()
-            # Correct MindsDB API endpoint format
-            endpoint = f"{self.api_url}/api/databases/{database}/tables"
+        for attempt in range(self.max_retries):
+            try:
+                client = await self._get_client()
+                # Correct MindsDB API endpoint format
+                endpoint = f"{self.api_url}/api/databases/{database}/tables"
 
-            response = await client.get(endpoint)
+                response = await client.get(endpoint)
 
-            if response.status_code == 200:
-                tables = response.json()
-                logger.info(f"Retrieved {len(tables)} tables from database '{database}'")
-                return tables if isinstance(tables, list) else []
+                if response.status_code == 200:
+                    tables = response.json()
+                    logger.info(f"Retrieved {len(tables)} tables from database '{database}'")
+                    return tables if isinstance(tables, list) else []
 
-            elif response.status_code == 404:
-                logger.warning(f"Database '{database}' not found")
-                return []
+                elif response.status_code == 404:
+                    logger.warning(f"Database '{database}' not found")
+                    return []
 
-            else:
-                error_msg = f"Failed to retrieve tables: HTTP {response.status_code}"
+                else:
+                    error_msg = f"Failed to retrieve tables: HTTP {response.status_code}"
+                    logger.error(error_msg)
+                    raise MindsDBError(error_msg)
+
+            except httpx.RequestError as e:
+                logger.warning(f"Request error retrieving tables (attempt {attempt + 1}): {e}")
+                if attempt < self.max_retries - 1 and retry_policy.should_retry(e, attempt):
+                    await asyncio.sleep(retry_policy.get_retry_delay(attempt))
+                    continue
+                error_msg = f"Request error retrieving tables: {e}"
                 logger.error(error_msg)
-                raise MindsDBError(error_msg)
+                raise MindsDBError(error_msg) from e
 
-        except httpx.RequestError as e:
-            error_msg = f"Request error retrieving tables: {e}"
-            logger.error(error_msg)
-            raise MindsDBError(error_msg) from e
+            except Exception as e:
+                error_msg = f"Unexpected error retrieving tables: {e}"
+                logger.error(error_msg)
+                raise MindsDBError(error_msg) from e
 
-        except Exception as e:
-            error_msg = f"Unexpected error retrieving tables: {e}"
-            logger.error(error_msg)
-            raise MindsDBError(error_msg) from e
+        raise MindsDBError(f"Failed to retrieve tables after {self.max_retries} attempts")
 
     async def get_schema(self, database: str, table: Optional[str] = None) -> Dict[str, Any]:
         """
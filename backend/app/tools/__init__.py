@@ -21,6 +21,7 @@ from app.tools.analysis_tools import (
 from app.tools.statistical_tools import (
     correlation_analysis,
     trend_analysis,
+    trend_analysis_many,
 )
 
 # Visualization Tools
@@ -42,6 +43,7 @@ __all__ = [
     # Statistical Tools
     "correlation_analysis",
     "trend_analysis",
+    "trend_analysis_many",
     # Visualization Tools
     "recommend_chart_type",
     "create_plotly_figure",
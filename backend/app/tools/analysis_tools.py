@@ -10,8 +10,8 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime
 from collections import Counter
 
+import numpy as np
 from pydantic import BaseModel, Field
-import statistics
 
 logger = logging.getLogger(__name__)
 
@@ -229,15 +229,18 @@ async def _compute_descriptive_stats(
 
             if numeric_values:
                 try:
-                    col_stats.mean = statistics.mean(numeric_values)
-                    col_stats.median = statistics.median(numeric_values)
-                    col_stats.min_value = min(numeric_values)
-                    col_stats.max_value = max(numeric_values)
+                    values_array = np.asarray(numeric_values, dtype=np.float64)
+                    col_stats.mean = float(values_array.mean())
+                    col_stats.median = float(np.median(values_array))
+                    col_stats.min_value = float(values_array.min())
+                    col_stats.max_value = float(values_array.max())
 
                     if len(numeric_values) > 1:
-                        col_stats.std_dev = statistics.stdev(numeric_values)
-                        col_stats.q25 = statistics.quantiles(numeric_values, n=4)[0]
-                        col_stats.q75 = statistics.quantiles(numeric_values, n=4)[2]
+                        col_stats.std_dev = float(values_array.std(ddof=1))
+                        # 'weibull' matches statistics.quantiles' default (exclusive) method
+                        q25, q75 = np.percentile(values_array, [25, 75], method="weibull")
+                        col_stats.q25 = float(q25)
+                        col_stats.q75 = float(q75)
                 except Exception as e:
                     logger.warning(f"Error computing numeric stats for {col}: {e}")
 
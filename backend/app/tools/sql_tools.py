@@ -16,6 +16,7 @@ import time
 
 from pydantic import BaseModel, Field
 
+from app.core.errors import is_transient_error
 from app.core.llm import LLMClient
 from app.core.prompts import PromptType, get_prompt
 from app.services.mindsdb_service import MindsDBService, QueryResult
@@ -57,6 +58,7 @@ class QueryExecutionResult(BaseModel):
     row_count: int = 0
     execution_time_ms: int = 0
     error: Optional[str] = None
+    transient: bool = False  # Failed on an unavailable dependency, not the query
 
 
 class ValidationResult(BaseModel):
@@ -279,6 +281,7 @@ async def execute_sql_query(
             row_count=result.row_count,
             execution_time_ms=result.execution_time_ms,
             error=result.error,
+            transient=result.transient,
         )
 
         if execution_result.success:
@@ -296,6 +299,7 @@ async def execute_sql_query(
         return QueryExecutionResult(
             success=False,
             error=f"Execution error: {str(e)}",
+            transient=is_transient_error(e),
         )
 
 
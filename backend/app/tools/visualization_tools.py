@@ -4,18 +4,53 @@ Visualization Tools
 Plotly-based tools for chart generation and styling.
 """
 
+import copy
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from app.core.llm import LLMClient
 from app.schemas.visualization_schemas import ChartRecommendation
 
 logger = logging.getLogger(__name__)
 
+# Extracts the outermost JSON object from an LLM response
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Column types and summary stats for chart recommendation only need a sample
+_CHARACTERISTICS_SAMPLE_ROWS = 200
+
+# Recently analyzed result sets, keyed by _data_fingerprint (LRU)
+_CHARACTERISTICS_CACHE_SIZE = 128
+_characteristics_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+# Chart input: row dicts, column name -> values, or a ready DataFrame
+ChartData = Union[List[Dict[str, Any]], Dict[str, List[Any]], pd.DataFrame]
+
+# Logo anchor coordinates (normalized 0-1 paper space); read-only
+_LOGO_POSITIONS: Dict[str, Dict[str, Any]] = {
+    "top-left": {"x": 0.02, "y": 0.98, "xanchor": "left", "yanchor": "top"},
+    "top-right": {"x": 0.98, "y": 0.98, "xanchor": "right", "yanchor": "top"},
+    "bottom-left": {"x": 0.02, "y": 0.02, "xanchor": "left", "yanchor": "bottom"},
+    "bottom-right": {"x": 0.98, "y": 0.02, "xanchor": "right", "yanchor": "bottom"},
+}
+
 
 # ============================================
 # Tool 1: Recommend Chart Type
@@ -48,7 +83,7 @@ async def recommend_chart_type(
 
     try:
         if not data:
-            return ChartRecommendation(
+            return ChartRecommendation.model_construct(
                 recommended_type="table",
                 reasoning="No data available, defaulting to table view",
                 confidence=1.0,
@@ -56,9 +91,13 @@ async def recommend_chart_type(
                 data_characteristics={"row_count": 0}
             )
 
-        # Analyze data characteristics
-        df = pd.DataFrame(data)
-        characteristics = _analyze_data_characteristics(df)
+        # Analyze data characteristics (cached per result set)
+        characteristics = _get_data_characteristics(data)
+        sample_note = (
+            f" (from first {characteristics['sampled_rows']} rows)"
+            if characteristics["sampled_rows"] < characteristics["row_count"]
+            else ""
+        )
 
         # Build prompt for LLM
         prompt = f"""You are a data visualization expert. Recommend the best chart type for this data.
@@ -66,9 +105,9 @@ async def recommend_chart_type(
 User's question: "{user_query}"
 
 Data characteristics:
-- Rows: {len(df)}
-- Columns: {len(df.columns)}
-- Column details: {characteristics['columns_summary']}
+- Rows: {characteristics['row_count']}
+- Columns: {characteristics['column_count']}
+- Column details{sample_note}: {characteristics['columns_summary']}
 - Numeric columns: {characteristics['numeric_columns']}
 - Categorical columns: {characteristics['categorical_columns']}
 - Temporal columns: {characteristics['temporal_columns']}
@@ -106,13 +145,11 @@ Consider:
         )
 
         # Parse LLM response
-        import json
-        import re
         response_text = response.content if hasattr(response, 'content') else str(response)
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(response_text)
 
         if json_match:
-            recommendation_data = json.loads(json_match.group(0))
+            recommendation_data = _loads_json(json_match.group(0))
 
             return ChartRecommendation(
                 recommended_type=recommendation_data.get("recommended_type", "bar"),
@@ -123,12 +160,12 @@ Consider:
             )
         else:
             # Fallback to rule-based recommendation
-            return _rule_based_recommendation(df, user_query, characteristics)
+            return _rule_based_recommendation(user_query, characteristics)
 
     except Exception as e:
         logger.error(f"Chart recommendation failed: {e}")
         # Fallback to safe default
-        return ChartRecommendation(
+        return ChartRecommendation.model_construct(
             recommended_type="bar",
             reasoning=f"Error in recommendation: {str(e)}, defaulting to bar chart",
             confidence=0.5,
@@ -137,6 +174,53 @@ Consider:
         )
 
 
+def _loads_json(text: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _data_fingerprint(data: List[Dict[str, Any]]) -> Tuple[int, str]:
+    """
+    Identity for a result set: row count plus a hash of every sampled row.
+
+    Characteristics depend only on the sample and the row count, so the
+    key covers exactly those inputs.
+    """
+    sample = data[:_CHARACTERISTICS_SAMPLE_ROWS]
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(sample, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        raw = json.dumps(sample, default=str, separators=(",", ":")).encode("utf-8")
+    return len(data), hashlib.sha256(raw).hexdigest()
+
+
+def _get_data_characteristics(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Return data characteristics for recommendation, memoized per result set.
+
+    Characteristics are computed on a row sample; row_count is always exact.
+    A copy is returned so callers can't mutate the cached entry.
+    """
+    key = _data_fingerprint(data)
+    characteristics = _characteristics_cache.get(key)
+
+    if characteristics is None:
+        df = pd.DataFrame(data[:_CHARACTERISTICS_SAMPLE_ROWS])
+        characteristics = _analyze_data_characteristics(df)
+        characteristics["row_count"] = len(data)
+        characteristics["sampled_rows"] = len(df)
+
+        _characteristics_cache[key] = characteristics
+        if len(_characteristics_cache) > _CHARACTERISTICS_CACHE_SIZE:
+            _characteristics_cache.popitem(last=False)
+    else:
+        _characteristics_cache.move_to_end(key)
+
+    return copy.deepcopy(characteristics)
+
+
 def _analyze_data_characteristics(df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze DataFrame to extract characteristics for recommendation."""
     characteristics = {
@@ -148,30 +232,37 @@ def _analyze_data_characteristics(df: pd.DataFrame) -> Dict[str, Any]:
         "columns_summary": {}
     }
 
-    for col in df.columns:
-        col_data = df[col].dropna()
-        if len(col_data) == 0:
+    # Column-wide reductions computed once for the whole frame
+    dtypes = df.dtypes
+    non_null_counts = df.count()
+    unique_counts = df.nunique()
+    numeric_cols = [col for col, dtype in dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
+    numeric_mins = df[numeric_cols].min()
+    numeric_maxs = df[numeric_cols].max()
+
+    for col, dtype in dtypes.items():
+        if non_null_counts[col] == 0:
             continue
 
         # Determine column type
-        if pd.api.types.is_numeric_dtype(col_data):
+        if pd.api.types.is_numeric_dtype(dtype):
             characteristics["numeric_columns"].append(col)
             characteristics["columns_summary"][col] = {
                 "type": "numeric",
-                "unique_count": col_data.nunique(),
-                "min": float(col_data.min()) if len(col_data) > 0 else None,
-                "max": float(col_data.max()) if len(col_data) > 0 else None,
+                "unique_count": int(unique_counts[col]),
+                "min": float(numeric_mins[col]),
+                "max": float(numeric_maxs[col]),
             }
-        elif pd.api.types.is_datetime64_any_dtype(col_data):
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
             characteristics["temporal_columns"].append(col)
             characteristics["columns_summary"][col] = {
                 "type": "temporal",
-                "unique_count": col_data.nunique(),
+                "unique_count": int(unique_counts[col]),
             }
         else:
             # Categorical
             characteristics["categorical_columns"].append(col)
-            unique_count = col_data.nunique()
+            unique_count = int(unique_counts[col])
             characteristics["columns_summary"][col] = {
                 "type": "categorical",
                 "unique_count": unique_count,
@@ -182,18 +273,22 @@ def _analyze_data_characteristics(df: pd.DataFrame) -> Dict[str, Any]:
 
 
 def _rule_based_recommendation(
-    df: pd.DataFrame,
     user_query: str,
     characteristics: Dict[str, Any]
 ) -> ChartRecommendation:
-    """Fallback rule-based chart recommendation."""
+    """
+    Fallback rule-based chart recommendation.
+
+    Recommendations are built from fixed, known-valid values, so they are
+    constructed without Pydantic validation.
+    """
     num_numeric = len(characteristics["numeric_columns"])
     num_categorical = len(characteristics["categorical_columns"])
     num_temporal = len(characteristics["temporal_columns"])
 
     # Rule 1: Time series data -> line chart
     if num_temporal >= 1 and num_numeric >= 1:
-        return ChartRecommendation(
+        return ChartRecommendation.model_construct(
             recommended_type="line",
             reasoning="Temporal data detected, line chart shows trends well",
             confidence=0.85,
@@ -203,7 +298,7 @@ def _rule_based_recommendation(
 
     # Rule 2: Two numeric columns -> scatter plot
     if num_numeric >= 2 and "correlation" in user_query.lower():
-        return ChartRecommendation(
+        return ChartRecommendation.model_construct(
             recommended_type="scatter",
             reasoning="Two numeric columns with correlation query, scatter plot shows relationships",
             confidence=0.9,
@@ -213,7 +308,7 @@ def _rule_based_recommendation(
 
     # Rule 3: One categorical, one numeric -> bar chart
     if num_categorical >= 1 and num_numeric >= 1:
-        return ChartRecommendation(
+        return ChartRecommendation.model_construct(
             recommended_type="bar",
             reasoning="Categorical and numeric data, bar chart for comparisons",
             confidence=0.8,
@@ -223,7 +318,7 @@ def _rule_based_recommendation(
 
     # Rule 4: Distribution query -> histogram
     if "distribution" in user_query.lower() and num_numeric >= 1:
-        return ChartRecommendation(
+        return ChartRecommendation.model_construct(
             recommended_type="histogram",
             reasoning="Distribution analysis requested, histogram shows frequency distribution",
             confidence=0.85,
@@ -232,7 +327,7 @@ def _rule_based_recommendation(
         )
 
     # Default: bar chart
-    return ChartRecommendation(
+    return ChartRecommendation.model_construct(
         recommended_type="bar",
         reasoning="General purpose bar chart for comparisons",
         confidence=0.6,
@@ -246,7 +341,7 @@ def _rule_based_recommendation(
 # ============================================
 
 async def create_plotly_figure(
-    data: List[Dict[str, Any]],
+    data: ChartData,
     chart_type: str,
     user_query: str,
     analysis_results: Optional[Dict[str, Any]] = None,
@@ -258,7 +353,7 @@ async def create_plotly_figure(
     Supports multiple chart types with intelligent column mapping.
 
     Args:
-        data: Query results as list of dicts
+        data: Query results as list of dicts, column-oriented dict or DataFrame
         chart_type: Chart type to create
         user_query: Original user query for context
         analysis_results: Optional analysis results
@@ -270,151 +365,310 @@ async def create_plotly_figure(
     Raises:
         ValueError: If chart type is unsupported or data is invalid
     """
-    logger.info(f"Creating {chart_type} chart for {len(data)} rows")
+    row_count = _row_count(data)
+    logger.info(f"Creating {chart_type} chart for {row_count} rows")
 
     try:
-        if not data:
+        if not row_count:
             raise ValueError("No data provided for visualization")
 
-        # Convert to pandas DataFrame
-        df = pd.DataFrame(data)
-
         # Generate chart title from user query
         title = _generate_chart_title(user_query)
 
-        # Determine column mappings (x, y, color, etc.)
-        mappings = _determine_column_mappings(df, chart_type, user_query)
+        if chart_type == "table":
+            # Tables read cells straight from the input; no DataFrame needed
+            fig = _create_table_figure(data, title)
+        else:
+            # Convert to pandas DataFrame
+            df = _to_dataframe(data)
 
-        # Create appropriate Plotly figure
-        if chart_type == "bar":
-            fig = px.bar(
-                df,
-                x=mappings["x"],
-                y=mappings["y"],
-                color=mappings.get("color"),
-                title=title,
-                barmode=mappings.get("barmode", "group")
-            )
+            # Classify columns once; shared by mapping and chart building
+            partition = _partition_columns(df)
+            _downcast_numeric_columns(df, partition.numeric)
 
-        elif chart_type == "line":
-            fig = px.line(
-                df,
-                x=mappings["x"],
-                y=mappings["y"],
-                color=mappings.get("color"),
-                title=title,
-            )
+            # Determine column mappings (x, y, color, etc.)
+            mappings = _determine_column_mappings(df, chart_type, user_query, partition)
 
-        elif chart_type == "pie":
-            fig = px.pie(
-                df,
-                names=mappings["x"],
-                values=mappings["y"],
-                title=title,
-            )
+            fig = _create_chart_figure(df, chart_type, title, mappings, partition)
+
+        # Configure default interactivity
+        fig.update_layout(
+            hovermode='closest',
+            dragmode='zoom',
+        )
+
+        logger.info(f"Successfully created {chart_type} chart")
+        return fig
+
+    except Exception as e:
+        logger.error(f"Failed to create Plotly figure: {e}")
+        raise
+
+
+def _row_count(data: ChartData) -> int:
+    """Number of rows in any supported chart input shape."""
+    if isinstance(data, dict):
+        return len(next(iter(data.values()), ()))
+    return len(data)
+
+
+def _to_dataframe(data: ChartData) -> pd.DataFrame:
+    """
+    Build a DataFrame from chart input.
+
+    DataFrames are reused through a shallow copy (column data is shared, but
+    replacing columns never touches the caller's frame). Column-oriented
+    dicts go straight to the constructor, skipping per-row dict iteration,
+    and row dicts go through from_records.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data.copy(deep=False)
+    if isinstance(data, dict):
+        return pd.DataFrame(data)
+    return pd.DataFrame.from_records(data)
+
+
+def _create_table_figure(data: ChartData, title: str) -> go.Figure:
+    """Build a Plotly table directly from the input rows or columns."""
+    if isinstance(data, pd.DataFrame):
+        columns = data.columns.tolist()
+        cell_values = [data[col].tolist() for col in columns]
+    elif isinstance(data, dict):
+        columns = list(data)
+        cell_values = [list(values) for values in data.values()]
+    else:
+        columns = list(dict.fromkeys(key for row in data for key in row))
+        cell_values = [[row.get(col) for row in data] for col in columns]
+
+    fig = go.Figure(data=[go.Table(
+        header=dict(
+            values=columns,
+            fill_color='paleturquoise',
+            align='left',
+            font=dict(size=12, color='black')
+        ),
+        cells=dict(
+            values=cell_values,
+            fill_color='lavender',
+            align='left',
+            font=dict(size=11)
+        )
+    )])
+    fig.update_layout(title=title)
+    return fig
+
+
+def _create_chart_figure(
+    df: pd.DataFrame,
+    chart_type: str,
+    title: str,
+    mappings: Dict[str, Any],
+    partition: "DtypePartition",
+) -> go.Figure:
+    """
+    Create the Plotly Express figure for a DataFrame-backed chart type.
+
+    Args:
+        df: DataFrame with data
+        chart_type: Type of chart being created
+        title: Chart title
+        mappings: Column mappings from _determine_column_mappings
+        partition: Column dtype groups from _partition_columns
+
+    Returns:
+        Plotly figure object
 
-        elif chart_type == "scatter":
-            fig = px.scatter(
-                df,
-                x=mappings["x"],
-                y=mappings["y"],
-                color=mappings.get("color"),
-                size=mappings.get("size"),
+    Raises:
+        ValueError: If chart type is unsupported or data is invalid
+    """
+    if chart_type == "bar":
+        fig = px.bar(
+            df,
+            x=mappings["x"],
+            y=mappings["y"],
+            color=mappings.get("color"),
+            title=title,
+            barmode=mappings.get("barmode", "group")
+        )
+
+    elif chart_type == "line":
+        fig = px.line(
+            df,
+            x=mappings["x"],
+            y=mappings["y"],
+            color=mappings.get("color"),
+            title=title,
+        )
+
+    elif chart_type == "pie":
+        fig = px.pie(
+            df,
+            names=mappings["x"],
+            values=mappings["y"],
+            title=title,
+        )
+
+    elif chart_type == "scatter":
+        fig = px.scatter(
+            df,
+            x=mappings["x"],
+            y=mappings["y"],
+            color=mappings.get("color"),
+            size=mappings.get("size"),
+            title=title,
+        )
+
+    elif chart_type == "heatmap":
+        # Heatmap requires pivot or matrix data
+        if mappings.get("pivot_index") and mappings.get("pivot_columns"):
+            pivot, row_labels, col_labels = _pivot_mean(
+                df, mappings["pivot_index"], mappings["pivot_columns"], mappings["y"]
+            )
+            fig = px.imshow(
+                pivot,
+                x=col_labels,
+                y=row_labels,
                 title=title,
+                labels=dict(x=mappings["pivot_columns"], y=mappings["pivot_index"], color=mappings["y"])
             )
-
-        elif chart_type == "heatmap":
-            # Heatmap requires pivot or matrix data
-            if mappings.get("pivot_index") and mappings.get("pivot_columns"):
-                pivot_df = df.pivot_table(
-                    values=mappings["y"],
-                    index=mappings["pivot_index"],
-                    columns=mappings["pivot_columns"],
-                    fill_value=0
-                )
+        else:
+            # Correlation heatmap
+            # Constant (or all-NaN) columns only contribute NaN rows, so skip them
+            stds = df[partition.numeric].std()
+            numeric_cols = stds.index[stds > 0].tolist()
+            if len(numeric_cols) >= 2:
+                numeric_df = df[numeric_cols]
+                if numeric_df.notna().all().all():
+                    # No missing values: one matrix product instead of pairwise loops
+                    arr = numeric_df.to_numpy(dtype=np.float64, copy=False)
+                    corr_matrix = np.corrcoef(arr, rowvar=False)
+                else:
+                    # pandas handles NaN with pairwise-complete observations
+                    corr_matrix = numeric_df.corr().to_numpy()
                 fig = px.imshow(
-                    pivot_df,
-                    title=title,
-                    labels=dict(x=mappings["pivot_columns"], y=mappings["pivot_index"], color=mappings["y"])
+                    corr_matrix,
+                    x=numeric_cols,
+                    y=numeric_cols,
+                    title=title + " - Correlation Matrix",
+                    labels=dict(color="Correlation")
                 )
             else:
-                # Correlation heatmap
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                if len(numeric_cols) >= 2:
-                    corr_matrix = df[numeric_cols].corr()
-                    fig = px.imshow(
-                        corr_matrix,
-                        title=title + " - Correlation Matrix",
-                        labels=dict(color="Correlation")
-                    )
-                else:
-                    raise ValueError("Heatmap requires at least 2 numeric columns or pivot configuration")
+                raise ValueError("Heatmap requires at least 2 varying numeric columns or pivot configuration")
+
+    elif chart_type == "histogram":
+        fig = px.histogram(
+            df,
+            x=mappings["x"],
+            color=mappings.get("color"),
+            title=title,
+        )
 
-        elif chart_type == "histogram":
-            fig = px.histogram(
-                df,
-                x=mappings["x"],
-                color=mappings.get("color"),
-                title=title,
-            )
+    elif chart_type == "box":
+        fig = px.box(
+            df,
+            x=mappings.get("x"),
+            y=mappings["y"],
+            color=mappings.get("color"),
+            title=title,
+        )
 
-        elif chart_type == "box":
-            fig = px.box(
-                df,
-                x=mappings.get("x"),
-                y=mappings["y"],
-                color=mappings.get("color"),
-                title=title,
-            )
+    elif chart_type == "area":
+        fig = px.area(
+            df,
+            x=mappings["x"],
+            y=mappings["y"],
+            color=mappings.get("color"),
+            title=title,
+        )
 
-        elif chart_type == "area":
-            fig = px.area(
-                df,
-                x=mappings["x"],
-                y=mappings["y"],
-                color=mappings.get("color"),
-                title=title,
-            )
+    else:
+        raise ValueError(f"Unsupported chart type: {chart_type}")
 
-        elif chart_type == "table":
-            # Create table visualization
-            fig = go.Figure(data=[go.Table(
-                header=dict(
-                    values=list(df.columns),
-                    fill_color='paleturquoise',
-                    align='left',
-                    font=dict(size=12, color='black')
-                ),
-                cells=dict(
-                    values=[df[col] for col in df.columns],
-                    fill_color='lavender',
-                    align='left',
-                    font=dict(size=11)
-                )
-            )])
-            fig.update_layout(title=title)
+    return fig
 
-        else:
-            raise ValueError(f"Unsupported chart type: {chart_type}")
 
-        # Configure default interactivity
-        fig.update_layout(
-            hovermode='closest',
-            dragmode='zoom',
-        )
+def _pivot_mean(
+    df: pd.DataFrame,
+    index: str,
+    columns: str,
+    values: str,
+) -> Tuple[np.ndarray, List[Any], List[Any]]:
+    """
+    Mean-aggregate values into an index x columns grid in one pass.
 
-        logger.info(f"Successfully created {chart_type} chart")
-        return fig
+    Same result as df.pivot_table(values, index, columns, fill_value=0),
+    built from factorized keys and np.add.at instead of groupby + unstack.
 
-    except Exception as e:
-        logger.error(f"Failed to create Plotly figure: {e}")
-        raise
+    Returns:
+        Tuple of (grid, row labels, column labels)
+    """
+    rows = df[[index, columns, values]].dropna()
+    row_codes, row_labels = pd.factorize(rows[index], sort=True)
+    col_codes, col_labels = pd.factorize(rows[columns], sort=True)
+    shape = (len(row_labels), len(col_labels))
+
+    sums = np.zeros(shape)
+    counts = np.zeros(shape)
+    np.add.at(sums, (row_codes, col_codes), rows[values].to_numpy(dtype=np.float64))
+    np.add.at(counts, (row_codes, col_codes), 1)
+
+    grid = np.divide(sums, counts, out=np.zeros(shape), where=counts > 0)
+    return grid, row_labels.tolist(), col_labels.tolist()
+
+
+class DtypePartition(NamedTuple):
+    """DataFrame columns grouped by dtype kind."""
+
+    numeric: List[str]
+    categorical: List[str]
+    datetime: List[str]
+
+
+def _partition_columns(df: pd.DataFrame) -> DtypePartition:
+    """
+    Split DataFrame columns into numeric, categorical and datetime groups.
+
+    Single pass over df.dtypes, equivalent to select_dtypes with
+    'number', ['object', 'category'] and 'datetime64'. Only column-level
+    dtype metadata is read, so the cost is independent of row count and
+    large result sets need no sampling here.
+    """
+    numeric, categorical, datetime_cols = [], [], []
+    for col, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype) or dtype.kind == "O":
+            categorical.append(col)
+        elif dtype.kind in "iufc":
+            numeric.append(col)
+        elif dtype.kind == "M":
+            datetime_cols.append(col)
+    return DtypePartition(numeric, categorical, datetime_cols)
+
+
+def _downcast_numeric_columns(df: pd.DataFrame, numeric_cols: List[str]) -> None:
+    """
+    Shrink numeric columns to the smallest dtype that holds them exactly.
+
+    Integers always downcast losslessly. Floats are only narrowed when every
+    value round-trips through float32, so plotted and hovered values are
+    unchanged. Modifies df in place.
+    """
+    for col in numeric_cols:
+        series = df[col]
+        if series.dtype.itemsize <= 4:
+            continue
+        if series.dtype.kind in "iu":
+            df[col] = pd.to_numeric(series, downcast="integer")
+        elif series.dtype.kind == "f":
+            narrowed = pd.to_numeric(series, downcast="float")
+            if narrowed.dtype != series.dtype and narrowed.astype(series.dtype).equals(series):
+                df[col] = narrowed
 
 
 def _determine_column_mappings(
     df: pd.DataFrame,
     chart_type: str,
-    user_query: str
+    user_query: str,
+    partition: Optional[DtypePartition] = None,
 ) -> Dict[str, Any]:
     """
     Determine best column mappings for chart axes.
@@ -425,13 +679,16 @@ def _determine_column_mappings(
         df: DataFrame with data
         chart_type: Type of chart being created
         user_query: User's question for hints
+        partition: Precomputed column dtype groups (computed if omitted)
 
     Returns:
         Dictionary with column mappings
     """
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-    datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+    if partition is None:
+        partition = _partition_columns(df)
+    numeric_cols, categorical_cols, datetime_cols = partition
+    cols = df.columns.tolist()
+    ncols = len(cols)
 
     mappings = {}
 
@@ -442,13 +699,13 @@ def _determine_column_mappings(
         elif categorical_cols:
             mappings["x"] = categorical_cols[0]
         else:
-            mappings["x"] = df.columns[0]
+            mappings["x"] = cols[0]
 
         # Y-axis: prefer numeric columns
         if numeric_cols:
             mappings["y"] = numeric_cols[0]
         else:
-            mappings["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            mappings["y"] = cols[1] if ncols > 1 else cols[0]
 
         # Color: use second categorical if available
         if len(categorical_cols) > 1:
@@ -459,13 +716,13 @@ def _determine_column_mappings(
         if categorical_cols:
             mappings["x"] = categorical_cols[0]
         else:
-            mappings["x"] = df.columns[0]
+            mappings["x"] = cols[0]
 
         # Values: numeric or second column
         if numeric_cols:
             mappings["y"] = numeric_cols[0]
         else:
-            mappings["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            mappings["y"] = cols[1] if ncols > 1 else cols[0]
 
     elif chart_type == "scatter":
         # X and Y: first two numeric columns
@@ -475,8 +732,8 @@ def _determine_column_mappings(
             if len(numeric_cols) >= 3:
                 mappings["size"] = numeric_cols[2]
         else:
-            mappings["x"] = df.columns[0]
-            mappings["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            mappings["x"] = cols[0]
+            mappings["y"] = cols[1] if ncols > 1 else cols[0]
 
         # Color: categorical if available
         if categorical_cols:
@@ -495,8 +752,8 @@ def _determine_column_mappings(
             mappings["x"] = numeric_cols[0]
             mappings["y"] = numeric_cols[0]
         else:
-            mappings["x"] = df.columns[0]
-            mappings["y"] = df.columns[0]
+            mappings["x"] = cols[0]
+            mappings["y"] = cols[0]
 
         # Color by categorical
         if categorical_cols:
@@ -505,6 +762,7 @@ def _determine_column_mappings(
     return mappings
 
 
+@lru_cache(maxsize=512)
 def _generate_chart_title(user_query: str) -> str:
     """Generate appropriate chart title from user query."""
     # Simple heuristic: capitalize first letter and ensure it's a reasonable length
@@ -546,30 +804,32 @@ async def apply_plotly_theme(
     logger.info(f"Applying theme: {theme}, custom_profile: {custom_profile is not None}")
 
     try:
+        # Layout properties are collected here and applied in one update_layout
+        # call; nested dicts merge in order, like successive updates would
+        layout: Dict[str, Any] = {}
+
         # Step 1: Apply base Plotly theme
         base_theme = theme
         if custom_profile:
             base_theme = custom_profile.get("base_theme", theme)
-        fig.update_layout(template=base_theme)
+        layout["template"] = base_theme
 
         # Step 2: Apply custom profile styling (if provided)
         if custom_profile:
             # Color palette
             if custom_profile.get("color_palette"):
-                fig.update_layout(colorway=custom_profile["color_palette"])
+                layout["colorway"] = custom_profile["color_palette"]
 
             # Background colors
             if custom_profile.get("background_color"):
-                fig.update_layout(
-                    plot_bgcolor=custom_profile["background_color"],
-                    paper_bgcolor=custom_profile["background_color"]
-                )
+                layout["plot_bgcolor"] = custom_profile["background_color"]
+                layout["paper_bgcolor"] = custom_profile["background_color"]
 
             # Text color
             if custom_profile.get("text_color"):
-                fig.update_layout(font_color=custom_profile["text_color"])
+                layout["font_color"] = custom_profile["text_color"]
 
-            # Grid color
+            # Grid color (applies to every axis, so kept as axis updates)
             if custom_profile.get("grid_color"):
                 fig.update_xaxes(gridcolor=custom_profile["grid_color"])
                 fig.update_yaxes(gridcolor=custom_profile["grid_color"])
@@ -581,15 +841,15 @@ async def apply_plotly_theme(
             if custom_profile.get("font_size"):
                 font_config["size"] = custom_profile["font_size"]
             if font_config:
-                fig.update_layout(font=font_config)
+                _merge_layout(layout, font=font_config)
 
             # Title font size
             if custom_profile.get("title_font_size"):
-                fig.update_layout(title_font_size=custom_profile["title_font_size"])
+                layout["title_font_size"] = custom_profile["title_font_size"]
 
             # Margins
             if custom_profile.get("margin_config"):
-                fig.update_layout(margin=custom_profile["margin_config"])
+                _merge_layout(layout, margin=custom_profile["margin_config"])
 
             # Logo
             if custom_profile.get("logo_url"):
@@ -609,25 +869,29 @@ async def apply_plotly_theme(
 
             # Advanced config
             if custom_profile.get("advanced_config"):
-                fig.update_layout(**custom_profile["advanced_config"])
+                _merge_layout(layout, **custom_profile["advanced_config"])
 
         # Step 3: Apply ad-hoc customizations (override everything)
         if customizations:
             if "colors" in customizations:
-                fig.update_layout(colorway=customizations["colors"])
+                layout["colorway"] = customizations["colors"]
             if "font_family" in customizations or "font_size" in customizations:
-                fig.update_layout(
+                _merge_layout(
+                    layout,
                     font=dict(
                         family=customizations.get("font_family"),
                         size=customizations.get("font_size", 12),
                     )
                 )
             if "margin" in customizations:
-                fig.update_layout(margin=customizations["margin"])
+                _merge_layout(layout, margin=customizations["margin"])
             # Apply any other layout customizations
-            for key, value in customizations.items():
-                if key not in ["colors", "font_family", "font_size", "margin"]:
-                    fig.update_layout(**{key: value})
+            _merge_layout(layout, **{
+                key: value for key, value in customizations.items()
+                if key not in ["colors", "font_family", "font_size", "margin"]
+            })
+
+        fig.update_layout(**layout)
 
         logger.info("Theme applied successfully")
         return fig
@@ -638,6 +902,16 @@ async def apply_plotly_theme(
         return fig
 
 
+def _merge_layout(layout: Dict[str, Any], **updates: Any) -> None:
+    """Merge layout updates into layout, combining nested dicts one level deep."""
+    for key, value in updates.items():
+        current = layout.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            layout[key] = {**current, **value}
+        else:
+            layout[key] = value
+
+
 def _add_logo_to_figure(
     fig: go.Figure,
     logo_url: str,
@@ -648,15 +922,7 @@ def _add_logo_to_figure(
     if size is None:
         size = {"width": 100, "height": 50}
 
-    # Position coordinates (normalized 0-1)
-    position_map = {
-        "top-left": {"x": 0.02, "y": 0.98, "xanchor": "left", "yanchor": "top"},
-        "top-right": {"x": 0.98, "y": 0.98, "xanchor": "right", "yanchor": "top"},
-        "bottom-left": {"x": 0.02, "y": 0.02, "xanchor": "left", "yanchor": "bottom"},
-        "bottom-right": {"x": 0.98, "y": 0.02, "xanchor": "right", "yanchor": "bottom"},
-    }
-
-    pos_config = position_map.get(position, position_map["top-right"])
+    pos_config = _LOGO_POSITIONS.get(position, _LOGO_POSITIONS["top-right"])
 
     # Add logo as layout image
     fig.add_layout_image(
@@ -693,7 +959,7 @@ def _add_watermark_to_figure(
 # ============================================
 
 async def generate_chart_insights(
-    data: List[Dict[str, Any]],
+    data: ChartData,
     chart_type: str,
     chart_config: Dict[str, Any],
     analysis_results: Optional[Dict[str, Any]],
@@ -706,7 +972,7 @@ async def generate_chart_insights(
     meaningful insights that help users understand what the chart shows.
 
     Args:
-        data: Query results
+        data: Query results as list of dicts, column-oriented dict or DataFrame
         chart_type: Type of chart created
         chart_config: Chart configuration details
         analysis_results: Optional analysis results
@@ -716,21 +982,26 @@ async def generate_chart_insights(
         List of insight strings
     """
     logger.info(f"Generating insights for {chart_type} chart")
+    row_count = _row_count(data)
 
     try:
-        if not data:
+        if not row_count:
             return ["No data available for analysis"]
 
-        df = pd.DataFrame(data)
+        # Build prompt for LLM (row dicts are summarized directly; no DataFrame needed)
+        if isinstance(data, list):
+            columns, sample_rows = list(data[0].keys()), data[:3]
+        else:
+            sample_df = _to_dataframe(data)
+            columns, sample_rows = sample_df.columns.tolist(), sample_df.head(3).to_dict("records")
 
-        # Build prompt for LLM
         prompt = f"""Generate 2-4 concise insights about this visualization.
 
 Chart type: {chart_type}
 Data summary:
-- Rows: {len(df)}
-- Columns: {list(df.columns)}
-- Sample data: {df.head(3).to_dict('records')}
+- Rows: {row_count}
+- Columns: {columns}
+- Sample data: {sample_rows}
 
 Focus on:
 1. Key patterns or trends visible in the chart
@@ -751,38 +1022,38 @@ Keep insights concise (1-2 sentences each) and actionable.
         )
 
         # Parse response
-        import json
-        import re
         response_text = response.content if hasattr(response, 'content') else str(response)
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(response_text)
 
         if json_match:
-            insights_data = json.loads(json_match.group(0))
+            insights_data = _loads_json(json_match.group(0))
             insights = insights_data.get("insights", [])
             if insights:
                 logger.info(f"Generated {len(insights)} insights")
                 return insights
 
         # Fallback to basic statistical insights
-        return _generate_basic_insights(df, chart_type)
+        return _generate_basic_insights(data, chart_type)
 
     except Exception as e:
         logger.error(f"Failed to generate insights: {e}")
-        return [f"Visualization shows {len(data)} data points"]
+        return [f"Visualization shows {row_count} data points"]
 
 
-def _generate_basic_insights(df: pd.DataFrame, chart_type: str) -> List[str]:
+def _generate_basic_insights(data: ChartData, chart_type: str) -> List[str]:
     """Generate basic statistical insights without LLM."""
     insights = []
+    df = _to_dataframe(data)
 
-    numeric_cols = df.select_dtypes(include=['number']).columns
+    numeric_cols = _partition_columns(df).numeric[:2]  # Limit to first 2 numeric columns
 
-    if len(numeric_cols) > 0:
-        # Find column with highest value
-        for col in numeric_cols[:2]:  # Limit to first 2 numeric columns
-            max_val = df[col].max()
-            min_val = df[col].min()
-            insights.append(f"{col} ranges from {min_val:.2f} to {max_val:.2f}")
+    if numeric_cols:
+        # Value range per column (min and max in one aggregation)
+        ranges = df[numeric_cols].agg(["min", "max"])
+        for col in numeric_cols:
+            insights.append(
+                f"{col} ranges from {ranges.at['min', col]:.2f} to {ranges.at['max', col]:.2f}"
+            )
 
     insights.append(f"Chart displays {len(df)} data points")
 
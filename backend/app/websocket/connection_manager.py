@@ -4,13 +4,35 @@ WebSocket connection manager for real-time workflow updates.
 Manages WebSocket connections, subscriptions, and event broadcasting.
 """
 
-from typing import Dict, Set
+import asyncio
+import json
+from typing import Any, Dict, List, Set
 from fastapi import WebSocket
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _serialize_message(message: Dict[str, Any]) -> str:
+    """Serialize a broadcast message to JSON text once for all recipients."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+async def _send_texts(websocket: WebSocket, payloads: List[str]) -> None:
+    """Send payloads to one client in order."""
+    for payload in payloads:
+        await websocket.send_text(payload)
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections for real-time workflow updates.
@@ -22,6 +44,8 @@ class ConnectionManager:
     - Automatic cleanup of stale connections
     """
 
+    __slots__ = ("active_connections", "workflow_subscriptions", "_ws_workflows")
+
     def __init__(self):
         # user_id -> Set[WebSocket]
         self.active_connections: Dict[str, Set[WebSocket]] = {}
@@ -29,6 +53,9 @@ class ConnectionManager:
         # workflow_id -> Set[WebSocket] (for targeted broadcasting)
         self.workflow_subscriptions: Dict[str, Set[WebSocket]] = {}
 
+        # WebSocket -> Set[workflow_id] (reverse index for disconnect cleanup)
+        self._ws_workflows: Dict[WebSocket, Set[str]] = {}
+
     async def connect(self, websocket: WebSocket, user_id: str):
         """
         Accept and register a new WebSocket connection.
@@ -45,8 +72,8 @@ class ConnectionManager:
         self.active_connections[user_id].add(websocket)
 
         logger.info(
-            f"[WebSocket] User {user_id} connected. "
-            f"Total connections: {len(self.active_connections[user_id])}"
+            "[WebSocket] User %s connected. Total connections: %d",
+            user_id, len(self.active_connections[user_id]),
         )
 
     def disconnect(self, websocket: WebSocket, user_id: str):
@@ -64,13 +91,16 @@ class ConnectionManager:
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
 
-        # Remove from workflow subscriptions
-        for workflow_id in list(self.workflow_subscriptions.keys()):
-            self.workflow_subscriptions[workflow_id].discard(websocket)
-            if not self.workflow_subscriptions[workflow_id]:
+        # Remove from this connection's workflow subscriptions
+        for workflow_id in self._ws_workflows.pop(websocket, ()):
+            subscribers = self.workflow_subscriptions.get(workflow_id)
+            if subscribers is None:
+                continue
+            subscribers.discard(websocket)
+            if not subscribers:
                 del self.workflow_subscriptions[workflow_id]
 
-        logger.info(f"[WebSocket] User {user_id} disconnected")
+        logger.info("[WebSocket] User %s disconnected", user_id)
 
     def subscribe_to_workflow(self, websocket: WebSocket, workflow_id: str):
         """
@@ -84,10 +114,11 @@ class ConnectionManager:
             self.workflow_subscriptions[workflow_id] = set()
 
         self.workflow_subscriptions[workflow_id].add(websocket)
+        self._ws_workflows.setdefault(websocket, set()).add(workflow_id)
 
         logger.info(
-            f"[WebSocket] Client subscribed to workflow {workflow_id}. "
-            f"Total subscribers: {len(self.workflow_subscriptions[workflow_id])}"
+            "[WebSocket] Client subscribed to workflow %s. Total subscribers: %d",
+            workflow_id, len(self.workflow_subscriptions[workflow_id]),
         )
 
     async def broadcast_to_workflow(self, workflow_id: str, message: dict):
@@ -98,32 +129,68 @@ class ConnectionManager:
             workflow_id: Target workflow
             message: Message to broadcast
         """
+        await self.broadcast_many_to_workflow(workflow_id, [message])
+
+    async def broadcast_many_to_workflow(self, workflow_id: str, messages: List[dict]):
+        """
+        Broadcast messages, in order, to all clients subscribed to a workflow.
+
+        Subscribers are looked up once for the whole batch; each client gets
+        the messages in order, and clients are sent to concurrently.
+
+        Args:
+            workflow_id: Target workflow
+            messages: Messages to broadcast
+        """
+        event_types = ", ".join(str(message.get("event_type")) for message in messages)
         if workflow_id not in self.workflow_subscriptions:
             logger.warning(
-                f"[ConnectionManager] No subscribers for workflow_id={workflow_id}. "
-                f"Event type={message.get('event_type')} will be dropped."
+                "[ConnectionManager] No subscribers for workflow_id=%s. "
+                "Event type=%s will be dropped.",
+                workflow_id, event_types,
             )
             return
 
         subscriber_count = len(self.workflow_subscriptions[workflow_id])
         logger.info(
-            f"[ConnectionManager] Broadcasting {message.get('event_type')} "
-            f"to {subscriber_count} subscriber(s) for workflow_id={workflow_id}"
+            "[ConnectionManager] Broadcasting %s to %d subscriber(s) for workflow_id=%s",
+            event_types, subscriber_count, workflow_id,
+        )
+
+        # Serialize once, then send to all subscribers concurrently
+        # (snapshot: the set may change while awaiting)
+        payloads = [_serialize_message(message) for message in messages]
+        websockets = list(self.workflow_subscriptions[workflow_id])
+        results = await asyncio.gather(
+            *(_send_texts(websocket, payloads) for websocket in websockets),
+            return_exceptions=True,
         )
 
-        disconnected = []
+        disconnected = set()
+
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                logger.error("[WebSocket] Failed to send to client: %s", result)
+                disconnected.add(websocket)
+
+        logger.debug(
+            "[ConnectionManager] Successfully sent event to %d subscriber(s)",
+            len(websockets) - len(disconnected),
+        )
 
-        for websocket in self.workflow_subscriptions[workflow_id]:
-            try:
-                await websocket.send_json(message)
-                logger.debug(f"[ConnectionManager] Successfully sent event to subscriber")
-            except Exception as e:
-                logger.error(f"[WebSocket] Failed to send to client: {e}")
-                disconnected.append(websocket)
+        # Cleanup failed connections (and empty sets, as in disconnect)
+        subscribers = self.workflow_subscriptions.get(workflow_id)
+        if disconnected and subscribers is not None:
+            subscribers.difference_update(disconnected)
+            if not subscribers:
+                del self.workflow_subscriptions[workflow_id]
 
-        # Cleanup failed connections
         for ws in disconnected:
-            self.workflow_subscriptions[workflow_id].discard(ws)
+            workflow_ids = self._ws_workflows.get(ws)
+            if workflow_ids is not None:
+                workflow_ids.discard(workflow_id)
+                if not workflow_ids:
+                    del self._ws_workflows[ws]
 
     async def broadcast_to_user(self, user_id: str, message: dict):
         """
@@ -136,18 +203,28 @@ class ConnectionManager:
         if user_id not in self.active_connections:
             return
 
-        disconnected = []
+        # Serialize once, then send to all connections concurrently
+        # (snapshot: the set may change while awaiting)
+        payload = _serialize_message(message)
+        websockets = list(self.active_connections[user_id])
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in websockets),
+            return_exceptions=True,
+        )
+
+        disconnected = set()
 
-        for websocket in self.active_connections[user_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"[WebSocket] Failed to send to user {user_id}: {e}")
-                disconnected.append(websocket)
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, Exception):
+                logger.error("[WebSocket] Failed to send to user %s: %s", user_id, result)
+                disconnected.add(websocket)
 
-        # Cleanup failed connections
-        for ws in disconnected:
-            self.active_connections[user_id].discard(ws)
+        # Cleanup failed connections (and empty sets, as in disconnect)
+        connections = self.active_connections.get(user_id)
+        if disconnected and connections is not None:
+            connections.difference_update(disconnected)
+            if not connections:
+                del self.active_connections[user_id]
 
 
 # Singleton instance
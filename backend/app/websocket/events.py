@@ -4,10 +4,24 @@ WebSocket event types and schemas for workflow updates.
 Defines event types and message formats for real-time communication.
 """
 
+import time
 from enum import Enum
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Last formatted UTC timestamp, refreshed when the wall-clock second changes
+_TS_CACHE: Dict[str, Any] = {"sec": -1, "iso": ""}
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string at second resolution."""
+    sec = int(time.time())
+    cache = _TS_CACHE
+    if cache["sec"] != sec:
+        cache["iso"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        cache["sec"] = sec
+    return cache["iso"]
 
 
 class WorkflowEventType(str, Enum):
@@ -31,6 +45,7 @@ class WorkflowEventType(str, Enum):
     # Agent events
     AGENT_STARTED = "agent.started"
     AGENT_COMPLETED = "agent.completed"
+    STAGE_AND_AGENT_STARTED = "stage_and_agent.started"  # stage.started + agent.started in one event
 
     # HITL events
     HUMAN_INPUT_REQUIRED = "human_input.required"
@@ -46,13 +61,16 @@ class WorkflowEvent(BaseModel):
     """
     Workflow event message.
 
-    Sent to clients via WebSocket.
+    Sent to clients via WebSocket. Kept as the schema of record; the hot
+    emit path builds the equivalent dict directly (see create_workflow_event).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     event_type: WorkflowEventType
     workflow_id: str
     conversation_id: Optional[str] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=_now_iso)
 
     # Event-specific data
     stage: Optional[str] = None  # analysis, deciding, visualizing, finalizing
@@ -65,6 +83,15 @@ class WorkflowEvent(BaseModel):
     error: Optional[str] = None
 
 
+# WorkflowEvent fields with their defaults, in schema order
+_EVENT_DEFAULTS: Dict[str, Any] = {
+    name: field.default for name, field in WorkflowEvent.model_fields.items()
+}
+
+# Fields callers may set through create_workflow_event kwargs
+_OPTIONAL_EVENT_FIELDS = frozenset(_EVENT_DEFAULTS) - {"event_type", "workflow_id", "timestamp"}
+
+
 def create_workflow_event(
     event_type: WorkflowEventType, workflow_id: str, **kwargs
 ) -> Dict[str, Any]:
@@ -79,5 +106,11 @@ def create_workflow_event(
     Returns:
         Event dictionary ready for JSON serialization
     """
-    event = WorkflowEvent(event_type=event_type, workflow_id=workflow_id, **kwargs)
-    return event.model_dump()
+    # Internal callers are trusted, so skip model validation and build the
+    # same dict WorkflowEvent.model_dump() would produce
+    event = dict(_EVENT_DEFAULTS)
+    event["event_type"] = event_type.value
+    event["workflow_id"] = workflow_id
+    event["timestamp"] = _now_iso()
+    event.update((key, value) for key, value in kwargs.items() if key in _OPTIONAL_EVENT_FIELDS)
+    return event
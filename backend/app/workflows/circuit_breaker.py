@@ -0,0 +1,145 @@
+"""
+Circuit breakers for workflow dependencies (LLM, database).
+
+During a sustained outage every workflow would otherwise wait out its full
+timeout (and retries) before failing. A breaker counts consecutive
+transient failures per dependency; once open, callers fail fast (or use
+their fallback) until the reset period has passed. Then a single trial call
+is let through: success closes the breaker, failure re-opens it.
+
+Breakers are process-wide and keyed by dependency name, e.g.
+"llm:viz_decision" or "analysis".
+"""
+
+import contextlib
+import logging
+import time
+from typing import Dict, Iterator, Optional
+
+from app.core.config import settings
+from app.core.errors import is_transient_error
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one dependency."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_after_seconds: float = 30.0):
+        """
+        Initialize breaker.
+
+        Args:
+            name: Dependency name (for logs)
+            failure_threshold: Consecutive failures that open the circuit
+            reset_after_seconds: Time before an open circuit allows a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after_seconds = reset_after_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None  # monotonic seconds
+        self._half_open = False
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._half_open else "open"
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go to the dependency.
+
+        Returns:
+            True when closed, or for the trial call once the reset period passed
+        """
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_after_seconds:
+            return False
+        # Restart the timer, so a trial that never reports back (e.g. a
+        # cancelled workflow) cannot keep the circuit half-open forever
+        self._opened_at = now
+        self._half_open = True
+        return True
+
+    def check(self) -> None:
+        """
+        Fail fast instead of calling the dependency while the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} unavailable after repeated failures, try again shortly")
+
+    def record_success(self) -> None:
+        """Record a successful call; closes the circuit."""
+        if self._opened_at is not None:
+            logger.info("[CircuitBreaker] %s closed", self.name)
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        """Record a failed call; opens the circuit at the threshold or on a failed trial."""
+        self._failures += 1
+        if self._half_open or (self._opened_at is None and self._failures >= self.failure_threshold):
+            logger.warning(
+                "[CircuitBreaker] %s open after %d failures, failing fast for %ss",
+                self.name, self._failures, self.reset_after_seconds,
+            )
+            self._opened_at = time.monotonic()
+            self._half_open = False
+
+    @contextlib.contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Guard a dependency call (the body may await).
+
+        Only transient errors count as failures; any other outcome shows
+        the dependency is reachable.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self.check()
+        try:
+            yield
+        except Exception as e:
+            if is_transient_error(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    Get the process-wide breaker for a dependency, creating it on first use.
+
+    Args:
+        name: Dependency name
+
+    Returns:
+        CircuitBreaker configured from settings.agent
+    """
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(
+            name,
+            failure_threshold=settings.agent.circuit_breaker_failure_threshold,
+            reset_after_seconds=settings.agent.circuit_breaker_reset_seconds,
+        )
+    return breaker
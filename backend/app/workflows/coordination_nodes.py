@@ -11,17 +11,345 @@ Key architectural principle: Use subgraph invocation (workflow.ainvoke),
 NOT Python method calls, for true LangGraph orchestration.
 """
 
+import asyncio
+import contextlib
+import itertools
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
-
-from app.workflows.unified_state import UnifiedWorkflowState
+import re
+import time
+import uuid
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+from datetime import datetime, timezone
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from app.agents.analysis_agent_langgraph import AnalysisAgentLangGraph
+from app.agents.visualization_agent import VisualizationAgent
+from app.agents.visualization_state import create_initial_visualization_state
+from app.agents.workflow_state import create_initial_state
+from app.workflows.unified_state import MONOTONIC_CLOCK_ID, UnifiedWorkflowState
+from app.core.config import settings
+from app.core.errors import is_transient_error
 from app.core.llm import LLMClient
+from app.schemas.visualization_schemas import VizDecision
+from app.core.viz_decision_cache import decision_cache_key, plan_template_key, viz_decision_cache
+from app.workflows.circuit_breaker import circuit_breaker
 from app.workflows.event_emitter import event_emitter
+from app.workflows.execution_cache import (
+    CACHED_AT_KEY,
+    execution_cache,
+    execution_cached,
+    execution_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# === Agent pool ===
+
+# Agents are stateless apart from their checkpointer, so one compiled agent per
+# dependency set is reused instead of rebuilding its graph on every invocation.
+_AGENT_POOL_SIZE = 8
+
+# (kind, factory id, dependency ids) -> (factory, dependencies, agent)
+# Entries hold strong references to the factory and dependencies, so the ids in
+# a key cannot be reused by other objects while the entry exists.
+_agent_pool: "OrderedDict[Tuple[Any, ...], Tuple[Callable[..., Any], Tuple[Any, ...], Any]]" = OrderedDict()
+
+
+def _pooled_agent(kind: str, factory: Callable[..., Any], **deps: Any) -> Any:
+    """
+    Get a pooled agent for the given dependencies, creating it on a miss.
+
+    Args:
+        kind: Agent kind (e.g. "analysis", "visualization")
+        factory: Agent class or factory called with deps
+        **deps: Agent constructor arguments (pooled by identity)
+
+    Returns:
+        Agent instance
+    """
+    key = (kind, id(factory)) + tuple((name, id(dep)) for name, dep in sorted(deps.items()))
+    entry = _agent_pool.get(key)
+    if entry is not None:
+        _agent_pool.move_to_end(key)
+        return entry[2]
+
+    agent = factory(**deps)
+    _agent_pool[key] = (factory, tuple(deps.values()), agent)
+    if len(_agent_pool) > _AGENT_POOL_SIZE:
+        _agent_pool.popitem(last=False)
+    return agent
+
+
+def _get_analysis_agent(
+    llm_client: LLMClient,
+    mindsdb_service: Any = None,
+    hitl_service: Any = None,
+    langfuse_handler: Any = None,
+) -> Any:
+    """Get the pooled AnalysisAgentLangGraph for these dependencies."""
+    return _pooled_agent(
+        "analysis",
+        AnalysisAgentLangGraph,
+        llm_client=llm_client,
+        mindsdb_service=mindsdb_service,
+        hitl_service=hitl_service,
+        langfuse_handler=langfuse_handler,
+    )
+
+
+def _get_visualization_agent(llm_client: LLMClient, langfuse_handler: Any = None) -> Any:
+    """Get the pooled VisualizationAgent for these dependencies."""
+    return _pooled_agent(
+        "visualization",
+        VisualizationAgent,
+        llm_client=llm_client,
+        langfuse_handler=langfuse_handler,
+    )
+
+
+async def _release_checkpoint_thread(agent: Any, config: Dict[str, Any]) -> None:
+    """Drop a finished subgraph run's checkpoints from a pooled agent's saver."""
+    checkpointer = getattr(agent.workflow, "checkpointer", None)
+    if not isinstance(checkpointer, BaseCheckpointSaver):
+        return
+    try:
+        await checkpointer.adelete_thread(config["configurable"]["thread_id"])
+    except Exception as e:
+        logger.warning(f"[UnifiedWorkflow] Failed to release checkpoint thread: {e}")
+
+
+# === Workflow options ===
+
+# Shared read-only default for workflows without options
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _options(state: UnifiedWorkflowState) -> Mapping[str, Any]:
+    """Workflow options (read-only default when unset)."""
+    return state.get("options") or _EMPTY_OPTIONS
+
+
+# === Subgraph execution cache ===
+
+# Options that control caching itself rather than the result
+_CACHE_CONTROL_OPTIONS = frozenset({"cache_results", "refresh_cache", "cache_ttl"})
+
+
+def _cache_ttl(state: UnifiedWorkflowState) -> int:
+    """
+    Result cache TTL in seconds for this workflow (0 disables).
+
+    Caching is opt-in per request (options["cache_results"]); options["cache_ttl"]
+    overrides settings.agent.execution_cache_ttl.
+    """
+    options = _options(state)
+    if not (options.get("cache_results") or options.get("refresh_cache")):
+        return 0
+    return options.get("cache_ttl", settings.agent.execution_cache_ttl)
+
+
+def _refresh_cache(state: UnifiedWorkflowState, *args) -> bool:
+    """Whether to skip the cached result and store a fresh one."""
+    return bool(_options(state).get("refresh_cache"))
+
+
+def _cache_options(state: UnifiedWorkflowState) -> Dict[str, Any]:
+    """Workflow options that affect results (everything but cache control)."""
+    return {k: v for k, v in _options(state).items() if k not in _CACHE_CONTROL_OPTIONS}
+
+
+def _analysis_cache_key(state: UnifiedWorkflowState, *args) -> Optional[Tuple[str, int]]:
+    ttl = _cache_ttl(state)
+    if not ttl:
+        return None
+    fingerprint = execution_fingerprint(
+        " ".join(state["user_query"].split()),
+        state["database"],
+        state.get("user_id"),
+        state.get("company_id"),
+        _cache_options(state),
+    )
+    return fingerprint, ttl
+
+
+def _visualization_cache_key(state: UnifiedWorkflowState, *args) -> Optional[Tuple[str, int]]:
+    ttl = _cache_ttl(state)
+    if not ttl:
+        return None
+    # The rows are identified by the SQL that produced them and their shape,
+    # instead of hashing every row on each call
+    fingerprint = execution_fingerprint(
+        " ".join(state["user_query"].split()),
+        state["database"],
+        state.get("user_id"),
+        state.get("company_id"),
+        state.get("generated_sql"),
+        state.get("query_schema"),
+        state.get("recommended_chart_type"),
+        _cache_options(state),
+    )
+    return fingerprint, ttl
+
+
+# AnalysisAgent nodes whose failure leaves nothing for later nodes to do
+# (no SQL generated, or SQL rejected in human review)
+_ANALYSIS_FATAL_NODES = frozenset({"generate_sql", "human_review"})
+
+# Circuit breaker name for the AnalysisAgent's dependencies (LLM, MindsDB)
+ANALYSIS_CIRCUIT = "analysis"
+
+
+def _transient_analysis_failure(analysis_result: Mapping[str, Any]) -> bool:
+    """
+    Check whether an AnalysisAgent run failed on an unavailable dependency.
+
+    Args:
+        analysis_result: Subgraph state after the run
+
+    Returns:
+        True if the query did not succeed and the failing node classified its
+        error as an LLM/MindsDB outage (errors caused by the query itself,
+        such as a statement timeout, are not)
+    """
+    return not analysis_result.get("query_success") and bool(analysis_result.get("dependency_error"))
+
+
+@execution_cached(
+    "analysis",
+    key_fn=_analysis_cache_key,
+    refresh=_refresh_cache,
+    should_cache=lambda result: bool(result.get("query_success")) and not result.get("errors"),
+)
+async def _invoke_analysis_subgraph(
+    state: UnifiedWorkflowState,
+    analysis_agent: Any,
+    analysis_input: Dict[str, Any],
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Run the AnalysisAgent subgraph (cached per query, database, user and options).
+
+    Streams the run and stops right after a node in _ANALYSIS_FATAL_NODES
+    fails, instead of running validation/execution with no usable SQL.
+
+    Returns:
+        Subgraph state after the last executed step
+    """
+    result: Dict[str, Any] = {}
+    stop = False
+    try:
+        stream = analysis_agent.workflow.astream(
+            analysis_input, config=config, stream_mode=["updates", "values"]
+        )
+        async with contextlib.aclosing(stream):
+            async for mode, chunk in stream:
+                if mode == "values":
+                    # Full state after each step (values follow that step's updates)
+                    result = chunk
+                    if stop:
+                        break
+                elif any(
+                    node in _ANALYSIS_FATAL_NODES
+                    and isinstance(update, dict)
+                    and update.get("workflow_status") == "failed"
+                    for node, update in chunk.items()
+                ):
+                    logger.warning(
+                        f"[UnifiedWorkflow:run_analysis] Stopping AnalysisAgent after fatal "
+                        f"failure in {', '.join(chunk)}"
+                    )
+                    stop = True
+        return result
+    finally:
+        await _release_checkpoint_thread(analysis_agent, config)
+
+
+@execution_cached(
+    "viz",
+    key_fn=_visualization_cache_key,
+    refresh=_refresh_cache,
+    should_cache=lambda result: bool(result.get("plotly_figure")) and not result.get("errors"),
+)
+async def _invoke_visualization_subgraph(
+    state: UnifiedWorkflowState,
+    viz_agent: Any,
+    visualization_input: Dict[str, Any],
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Run the VisualizationAgent subgraph (cached per query, data and chart options)."""
+    try:
+        return await viz_agent.workflow.ainvoke(visualization_input, config=config)
+    finally:
+        await _release_checkpoint_thread(viz_agent, config)
+
+
+def _query_schema(query_data: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Summarize query result shape so later nodes need not scan the rows.
+
+    Args:
+        query_data: Query result rows
+
+    Returns:
+        Dict with columns, row_count and per-column dtypes (from each
+        column's first non-NULL value; "NoneType" if all are NULL)
+    """
+    if not query_data:
+        return {"columns": [], "row_count": 0, "dtypes": {}}
+    # Columns reuse the dtypes' key order (first row); rows are only scanned
+    # past the first while some column has had nothing but NULLs
+    dtypes = {col: type(value).__name__ for col, value in query_data[0].items()}
+    unresolved = [col for col, value in query_data[0].items() if value is None]
+    for row in itertools.islice(query_data, 1, None):
+        if not unresolved:
+            break
+        for col in [col for col in unresolved if row.get(col) is not None]:
+            dtypes[col] = type(row[col]).__name__
+            unresolved.remove(col)
+    return {
+        "columns": list(dtypes),
+        "row_count": len(query_data),
+        "dtypes": dtypes,
+    }
+
+
+def _subgraph_config(
+    state: UnifiedWorkflowState,
+    thread_id: str,
+    agent: str,
+    run_name: str,
+    langfuse_handler: Any = None,
+) -> Dict[str, Any]:
+    """
+    Build the RunnableConfig for an agent subgraph invocation.
+
+    Args:
+        state: UnifiedWorkflowState from parent workflow
+        thread_id: Checkpoint thread for the subgraph run
+        agent: Agent name for Langfuse metadata/tags (e.g. "analysis")
+        run_name: Langfuse run name prefix (e.g. "AnalysisAgent")
+        langfuse_handler: Langfuse callback handler
+
+    Returns:
+        Config dict with Langfuse callbacks, metadata and tags when tracing
+    """
+    config = {"configurable": {"thread_id": thread_id}}
+    if langfuse_handler:
+        config["callbacks"] = [langfuse_handler]
+        config["run_name"] = f"{run_name}: {state.get('user_query_preview') or state['user_query'][:50]}"
+        config["metadata"] = {
+            "workflow_id": state["workflow_id"],
+            "workflow_type": "unified",
+            "agent": agent,
+        }
+        config["tags"] = ["unified-workflow", f"{agent}-agent"]
+    return config
+
+
 async def run_analysis_adapter_node(
     state: UnifiedWorkflowState,
     llm_client: LLMClient,
@@ -48,27 +376,27 @@ async def run_analysis_adapter_node(
     Returns:
         State updates for UnifiedWorkflowState
     """
+    workflow_id = state["workflow_id"]
+
     logger.info(
         f"[UnifiedWorkflow:run_analysis] Invoking AnalysisAgent subgraph "
-        f"for workflow {state['workflow_id']}"
+        f"for workflow {workflow_id}"
     )
 
-    # Emit stage started event
-    await event_emitter.emit_stage_started(
-        workflow_id=state["workflow_id"],
+    # Emit stage started event (the stage starts by running the agent)
+    await event_emitter.emit_stage_and_agent_started(
+        workflow_id=workflow_id,
         stage="analysis",
+        agent="analysis",
         message="Analyzing query and generating SQL...",
-        progress=0.1,
+        progress=0.15,
     )
 
+    speculation: Optional[asyncio.Task] = None
     try:
-        # Import AnalysisAgent and its state helper
-        from app.agents.analysis_agent_langgraph import AnalysisAgentLangGraph
-        from app.agents.workflow_state import create_initial_state
-
-        # Create AnalysisAgent instance
-        # Note: Fresh instance per invocation avoids stale state
-        analysis_agent = AnalysisAgentLangGraph(
+        # Get AnalysisAgent instance (pooled per dependency set; each run's
+        # checkpoint thread is released afterwards, so no state carries over)
+        analysis_agent = _get_analysis_agent(
             llm_client=llm_client,
             mindsdb_service=mindsdb_service,
             hitl_service=hitl_service,
@@ -78,7 +406,7 @@ async def run_analysis_adapter_node(
         # Transform UnifiedWorkflowState → AnalysisAgent's WorkflowState input
         # IMPORTANT: Use create_initial_state to ensure all required fields are present
         analysis_input = create_initial_state(
-            session_id=state["workflow_id"],  # Reuse workflow_id as session_id
+            session_id=workflow_id,  # Reuse workflow_id as session_id
             query=state["user_query"],
             database=state["database"],
             user_id=state.get("user_id"),
@@ -87,39 +415,45 @@ async def run_analysis_adapter_node(
         )
 
         # Configure Langfuse for subgraph
-        config = {
-            "configurable": {"thread_id": state["workflow_id"]}
-        }
-        if langfuse_handler:
-            config["callbacks"] = [langfuse_handler]
-            config["run_name"] = f"AnalysisAgent: {state['user_query'][:50]}"
-            config["metadata"] = {
-                "workflow_id": state["workflow_id"],
-                "workflow_type": "unified",
-                "agent": "analysis",
-            }
-            config["tags"] = ["unified-workflow", "analysis-agent"]
-
-        # Emit agent started event
-        await event_emitter.emit_agent_started(
-            workflow_id=state["workflow_id"],
-            agent="analysis",
-            progress=0.15,
+        config = _subgraph_config(
+            state, workflow_id, "analysis", "AnalysisAgent", langfuse_handler
         )
 
+        # Fails fast (CircuitOpenError) while the analysis dependencies are down
+        analysis_circuit = circuit_breaker(ANALYSIS_CIRCUIT)
+        analysis_circuit.check()
+
+        # Overlap the visualization decision's LLM call with the analysis
+        # (cancelled below when this node returns, whatever the outcome)
+        if _should_speculate(state):
+            speculation = asyncio.create_task(
+                _speculative_decision(llm_client, state["user_query"])
+            )
+
         # CRITICAL: Invoke AnalysisAgent's compiled workflow (subgraph)
         # This is the LangGraph subgraph pattern, not a Python method call
         logger.info(
             f"[UnifiedWorkflow:run_analysis] Executing AnalysisAgent.workflow.ainvoke()"
         )
-        analysis_result = await analysis_agent.workflow.ainvoke(
-            analysis_input,
-            config=config
-        )
+        try:
+            analysis_result = await _invoke_analysis_subgraph(
+                state, analysis_agent, analysis_input, config
+            )
+        except Exception as e:
+            if is_transient_error(e):
+                analysis_circuit.record_failure()
+            raise
+
+        # AnalysisAgent nodes report LLM/MindsDB failures in state, not by
+        # raising; a cached result made no calls, so it tells us nothing
+        if _transient_analysis_failure(analysis_result):
+            analysis_circuit.record_failure()
+        elif not analysis_result.get(CACHED_AT_KEY):
+            analysis_circuit.record_success()
 
         # Emit agent completed event
         await event_emitter.emit_agent_completed(
-            workflow_id=state["workflow_id"],
+            workflow_id=workflow_id,
             agent="analysis",
             progress=0.35,
         )
@@ -131,11 +465,12 @@ async def run_analysis_adapter_node(
         )
 
         # Transform AnalysisAgent output → UnifiedWorkflowState updates
+        query_data = analysis_result.get("query_data")
         updates = {
             "workflow_status": "analyzed",
             "workflow_stage": "analyzed",
             "current_agent": "analysis",
-            "analysis_session_id": state["workflow_id"],
+            "analysis_session_id": workflow_id,
             "query_intent": analysis_result.get("query_intent"),
             "intent_rejection": analysis_result.get("intent_rejection", False),
             "final_message": analysis_result.get("final_message"),
@@ -143,20 +478,40 @@ async def run_analysis_adapter_node(
             "generated_sql": analysis_result.get("generated_sql"),
             "sql_confidence": analysis_result.get("confidence"),
             "query_success": analysis_result.get("query_success", False),
-            "query_data": analysis_result.get("query_data"),
+            "query_data": query_data,
+            "query_schema": _query_schema(query_data),
             "analysis_results": analysis_result.get("analysis_results"),
             "enhanced_analysis": analysis_result.get("enhanced_analysis"),
             "insights": analysis_result.get("insights", []),
             "recommendations": analysis_result.get("recommendations", []),
-            "agents_executed": ["analysis"],
+            "agents_executed": ("analysis",),
         }
 
         # Accumulate any warnings or errors
         if analysis_result.get("warnings"):
             updates["warnings"] = analysis_result["warnings"]
+        if analysis_result.get(CACHED_AT_KEY):
+            updates["warnings"] = [
+                *updates.get("warnings", []),
+                f"Results reused from an identical request at {analysis_result[CACHED_AT_KEY]}; "
+                f"set refresh_cache to re-run the query",
+            ]
         if analysis_result.get("errors"):
             updates["errors"] = analysis_result["errors"]
 
+        # Hand the speculation to decide_visualization only if it would
+        # otherwise ask the LLM (state keeps it checkpointable)
+        if (
+            speculation is not None
+            and updates["query_success"]
+            and _needs_llm_decision(state["user_query"], updates["query_schema"])
+        ):
+            decision = await _await_speculative_decision(
+                speculation, state["user_query"], updates["query_schema"]
+            )
+            if decision is not None:
+                updates["speculative_viz_decision"] = decision.model_dump()
+
         return updates
 
     except Exception as e:
@@ -168,6 +523,10 @@ async def run_analysis_adapter_node(
             "partial_success": False,
         }
 
+    finally:
+        if speculation is not None:
+            speculation.cancel()
+
 
 async def decide_visualization_node(
     state: UnifiedWorkflowState,
@@ -177,8 +536,13 @@ async def decide_visualization_node(
     Decide if visualization should be created.
 
     Uses hybrid approach:
-    1. Rule-based checks (fast filtering)
-    2. LLM-based decision (intelligent analysis)
+    1. Rule-based checks (fast filtering; an explicit options["chart_type"]
+       means the caller already decided to visualize)
+    2. Keyword and result-shape heuristics (clear-cut scores skip the LLM)
+    3. Cached decision for the same query shape (skips the LLM)
+    4. Speculative decision the analysis adapter got during the analysis
+    5. Plan template for the same database, intent and columns (skips the LLM)
+    6. LLM-based decision (only when the caller defers and nothing above decides)
 
     This implements the "Routing" pattern from LangGraph:
     - Classifies the situation
@@ -191,14 +555,17 @@ async def decide_visualization_node(
     Returns:
         State updates with should_visualize flag
     """
+    workflow_id = state["workflow_id"]
+    user_query = state["user_query"]
+
     logger.info(
         f"[UnifiedWorkflow:decide_visualization] Evaluating visualization need "
-        f"for workflow {state['workflow_id']}"
+        f"for workflow {workflow_id}"
     )
 
     # Emit stage started event
     await event_emitter.emit_stage_started(
-        workflow_id=state["workflow_id"],
+        workflow_id=workflow_id,
         stage="deciding",
         message="Deciding if visualization is needed...",
         progress=0.4,
@@ -215,9 +582,13 @@ async def decide_visualization_node(
             "workflow_stage": "deciding",
         }
 
+    # Result shape from the analysis adapter (rows are not re-scanned here)
+    query_schema = state.get("query_schema") or _query_schema(state.get("query_data"))
+    row_count = query_schema["row_count"]
+    columns = query_schema["columns"]
+
     # Rule 2: If no data returned, don't visualize
-    query_data = state.get("query_data")
-    if not query_data or len(query_data) == 0:
+    if row_count == 0:
         logger.info("[decide_visualization] Skipping: no data to visualize")
         return {
             "should_visualize": False,
@@ -225,8 +596,10 @@ async def decide_visualization_node(
             "workflow_stage": "deciding",
         }
 
+    options = _options(state)
+
     # Rule 3: If user explicitly disabled auto-visualization
-    if not state.get("options", {}).get("auto_visualize", True):
+    if not options.get("auto_visualize", True):
         logger.info("[decide_visualization] Skipping: auto-visualization disabled by user")
         return {
             "should_visualize": False,
@@ -235,7 +608,7 @@ async def decide_visualization_node(
         }
 
     # Rule 4: If only 1 row and 1 column (single scalar value), probably don't visualize
-    if len(query_data) == 1 and len(query_data[0]) == 1:
+    if row_count == 1 and len(columns) == 1:
         logger.info("[decide_visualization] Skipping: single scalar value")
         return {
             "should_visualize": False,
@@ -243,59 +616,45 @@ async def decide_visualization_node(
             "workflow_stage": "deciding",
         }
 
+    # Rule 5: Caller already chose a chart type
+    explicit_chart_type = options.get("chart_type")
+    if explicit_chart_type:
+        logger.info(f"[decide_visualization] Visualizing: user-specified chart type {explicit_chart_type}")
+        return {
+            "should_visualize": True,
+            "recommended_chart_type": explicit_chart_type,
+            "visualization_reasoning": "User-specified chart type",
+            "workflow_stage": "deciding",
+        }
+
     # === LLM-based decision (intelligent analysis) ===
 
     try:
-        # Extract data characteristics
-        row_count = len(query_data)
-        columns = list(query_data[0].keys()) if query_data else []
         column_count = len(columns)
 
-        # Build prompt for LLM
-        prompt = f"""Analyze if a visualization would help answer the user's question.
-
-User Query: "{state['user_query']}"
-
-Data Characteristics:
-- Rows: {row_count}
-- Columns: {column_count}
-- Column names: {', '.join(columns[:10])}{'...' if len(columns) > 10 else ''}
-
-Analysis Summary: {state.get('analysis_results', {}).get('summary', 'N/A')}
-
-Guidelines:
-- Visualize if: trends, comparisons, distributions, patterns, or relationships would be clearer in a chart
-- Visualize if: query contains keywords like "show", "compare", "trend", "over time", "by region", etc.
-- Don't visualize if: simple data lookup, metadata query, single aggregation (e.g., "count of X")
-- Don't visualize if: data is too sparse or unsuitable for charts
-
-Respond with JSON only:
-{{
-    "should_visualize": true/false,
-    "reasoning": "Brief explanation (1 sentence)",
-    "suggested_chart_type": "bar/line/pie/scatter/heatmap/table or null"
-}}
-"""
-
-        # Call LLM for decision
-        logger.info("[decide_visualization] Calling LLM for intelligent decision")
-        response = await llm_client.generate_text(
-            prompt=prompt,
-            system_prompt="You are a data visualization expert. Determine if a visualization would add value.",
-            temperature=0.3,
-            response_format="json_object",
-        )
-
-        # Parse LLM response
-        import json
-        decision = json.loads(response)
-
-        should_visualize = decision.get("should_visualize", True)  # Default to True (bias toward visualizing)
-        reasoning = decision.get("reasoning", "Visualization recommended")
-        suggested_chart = decision.get("suggested_chart_type")
+        decision = _heuristic_visualization_decision(user_query, query_schema)
+        cache_key = decision_cache_key(user_query, columns, row_count)
+        cached = viz_decision_cache.get(cache_key) if decision is None else None
+        if decision is not None:
+            logger.info("[decide_visualization] Decided by query and result heuristics")
+        elif cached is not None:
+            logger.info("[decide_visualization] Using cached decision")
+            decision = VizDecision(**cached)
+        elif state.get("speculative_viz_decision"):
+            logger.info("[decide_visualization] Using speculative decision")
+            decision = VizDecision(**state["speculative_viz_decision"])
+        else:
+            decision = await _plan_template_decision(
+                state, llm_client, row_count, columns, column_count
+            )
+            viz_decision_cache.set(cache_key, decision.model_dump())
+
+        should_visualize = decision.should_visualize
+        reasoning = decision.reasoning
+        suggested_chart = decision.suggested_chart_type
 
         logger.info(
-            f"[decide_visualization] LLM decision: visualize={should_visualize}, "
+            f"[decide_visualization] Decision: visualize={should_visualize}, "
             f"reason={reasoning}"
         )
 
@@ -328,6 +687,334 @@ Respond with JSON only:
         }
 
 
+# Keyword signals from the decision guidelines, scored before asking the LLM
+VIZ_POSITIVE = re.compile(
+    r"\b(show|display|plot|chart|graph|visuali[sz]e|compare|trend|over time"
+    r"|by (region|day|month|year|category)|distribut\w*|breakdown|top \d+)\b",
+    re.IGNORECASE,
+)
+VIZ_NEGATIVE = re.compile(
+    r"\b(how many|count of|what is the|list the|average|sum|minimum|maximum)\b",
+    re.IGNORECASE,
+)
+
+# Result dtypes (from _query_schema) that can be plotted as measures
+_NUMERIC_DTYPES = frozenset({
+    "int", "float", "Decimal", "int32", "int64", "float32", "float64",
+})
+
+# Scores outside this band are decided without the LLM
+_HEURISTIC_SKIP_BELOW = 35
+_HEURISTIC_VISUALIZE_ABOVE = 65
+
+# Row counts above this make lookup keywords inconclusive
+_HEURISTIC_MANY_ROWS = 10
+
+# Keyword weight: outweighs the shape signals, so a positive-only query
+# always scores above the band (50 + 35 - 15) and a negative-only query
+# with few rows always below it (50 - 35 + 10)
+_HEURISTIC_KEYWORD_WEIGHT = 35
+
+
+def _score_visualization(user_query: str, query_schema: Dict[str, Any]) -> Tuple[int, List[str]]:
+    """
+    Score how much a chart would help, from query keywords and result shape.
+
+    Args:
+        user_query: User's natural language query
+        query_schema: Result header from _query_schema
+
+    Returns:
+        (score from 0 to 100, reasons behind the score)
+    """
+    score = 50
+    reasons = []
+
+    positive = VIZ_POSITIVE.search(user_query)
+    if positive:
+        score += _HEURISTIC_KEYWORD_WEIGHT
+        reasons.append(f"query asks for a visual comparison or pattern (keyword: '{positive.group(0)}')")
+    negative = VIZ_NEGATIVE.search(user_query)
+    if negative:
+        score -= _HEURISTIC_KEYWORD_WEIGHT
+        reasons.append(f"simple lookup or aggregation query (keyword: '{negative.group(0)}')")
+
+    dtypes = query_schema.get("dtypes") or {}
+    if dtypes:
+        numeric = sum(dtype in _NUMERIC_DTYPES for dtype in dtypes.values())
+        if numeric == 0:
+            score -= 15
+            reasons.append("no numeric columns to plot")
+        elif numeric < len(dtypes):
+            score += 10
+            reasons.append("categories paired with numeric measures")
+
+    if query_schema["row_count"] > _HEURISTIC_MANY_ROWS:
+        score += 10
+        reasons.append(f"{query_schema['row_count']} rows")
+
+    return score, reasons
+
+
+def _heuristic_visualization_decision(
+    user_query: str,
+    query_schema: Dict[str, Any],
+) -> Optional[VizDecision]:
+    """
+    Decide clear-cut cases from query keywords and result shape, without an LLM call.
+
+    Args:
+        user_query: User's natural language query
+        query_schema: Result header from _query_schema
+
+    Returns:
+        VizDecision, or None when the score is ambiguous (ask the LLM)
+    """
+    score, reasons = _score_visualization(user_query, query_schema)
+    if _HEURISTIC_SKIP_BELOW <= score <= _HEURISTIC_VISUALIZE_ABOVE:
+        return None
+
+    reasoning = "; ".join(reasons)
+    return VizDecision(
+        should_visualize=score > _HEURISTIC_VISUALIZE_ABOVE,
+        reasoning=reasoning[:1].upper() + reasoning[1:],
+    )
+
+
+def _query_intent_label(user_query: str) -> str:
+    """
+    Label a query by the decision keywords it contains.
+
+    Args:
+        user_query: User's natural language query
+
+    Returns:
+        Sorted matched keywords joined by "+", or "generic" if none match
+    """
+    keywords = {
+        "_".join(match.group(0).lower().split())
+        for pattern in (VIZ_POSITIVE, VIZ_NEGATIVE)
+        for match in pattern.finditer(user_query)
+    }
+    return "+".join(sorted(keywords)) or "generic"
+
+
+# Redis namespace for plan templates (entries are shared across workflows)
+PLAN_TEMPLATE_NAMESPACE = "viztpl"
+
+
+async def _plan_template_decision(
+    state: UnifiedWorkflowState,
+    llm_client: LLMClient,
+    row_count: int,
+    columns: List[str],
+    column_count: int,
+) -> VizDecision:
+    """
+    Decide from the plan template for this database, intent and result shape.
+
+    On a template miss the LLM decides and its decision is written through as
+    the template for later workflows.
+
+    Args:
+        state: UnifiedWorkflowState
+        llm_client: LLM client
+        row_count: Number of result rows
+        columns: Result column names
+        column_count: Number of result columns
+
+    Returns:
+        VizDecision from the template or the LLM
+    """
+    intent_label = _query_intent_label(state["user_query"])
+    template_key = plan_template_key(state["database"], intent_label, columns, row_count)
+
+    template = await execution_cache.get(PLAN_TEMPLATE_NAMESPACE, template_key)
+    if template is not None:
+        logger.info(f"[decide_visualization] Using plan template for intent '{intent_label}'")
+        return VizDecision(
+            reasoning=f"Same decision as earlier '{intent_label}' queries over these columns",
+            **template,
+        )
+
+    decision = await _llm_visualization_decision(
+        state, llm_client, row_count, columns, column_count
+    )
+    await execution_cache.set(
+        PLAN_TEMPLATE_NAMESPACE,
+        template_key,
+        decision.model_dump(include={"should_visualize", "suggested_chart_type"}),
+        settings.agent.viz_decision_cache_ttl,
+    )
+    return decision
+
+
+# Static system prompt for the visualization decision (role and guidelines;
+# the response schema is VizDecision). Kept constant so the prompt prefix is cacheable.
+VIZ_DECISION_SYSTEM_PREFIX = """You are a data visualization expert. Determine if a visualization would add value to the answer for the user's question.
+
+The user message gives the user query, the result row and column counts, the column names and an analysis summary.
+
+Guidelines:
+- Visualize if: trends, comparisons, distributions, patterns, or relationships would be clearer in a chart
+- Visualize if: query contains keywords like "show", "compare", "trend", "over time", "by region", etc.
+- Don't visualize if: simple data lookup, metadata query, single aggregation (e.g., "count of X")
+- Don't visualize if: data is too sparse or unsuitable for charts
+
+Give a one-sentence reasoning and, if visualizing, the best chart type."""
+
+
+# === Speculative visualization decision ===
+
+# How long the analysis adapter waits for an unfinished speculative decision
+_SPECULATION_WAIT_SECONDS = 5.0
+
+
+def _should_speculate(state: UnifiedWorkflowState) -> bool:
+    """
+    Whether to ask for the visualization decision before the result exists.
+
+    Only queries whose keywords leave the decision open are worth it; the
+    others are settled by the heuristics without an LLM call.
+    """
+    options = _options(state)
+    if not settings.agent.viz_decision_speculation:
+        return False
+    if circuit_breaker(VIZ_DECISION_CIRCUIT).state != "closed":
+        return False
+    if not options.get("auto_visualize", True) or options.get("chart_type"):
+        return False
+    keyword_score, _ = _score_visualization(state["user_query"], {"row_count": 0})
+    return keyword_score == 50
+
+
+async def _speculative_decision(llm_client: LLMClient, user_query: str) -> Optional[VizDecision]:
+    """
+    Ask the LLM for the visualization decision from the query alone.
+
+    Returns:
+        VizDecision, or None if the call failed (decide_visualization then
+        takes its usual path)
+    """
+    prompt = (
+        f"Query: {user_query}\n"
+        f"Rows: unknown (query still running)\n"
+        f"Columns: unknown\n"
+        f"Summary: N/A"
+    )
+    try:
+        with circuit_breaker(VIZ_DECISION_CIRCUIT).guard():
+            return await llm_client.generate_structured(
+                prompt=prompt,
+                schema=VizDecision,
+                system_prompt=VIZ_DECISION_SYSTEM_PREFIX,
+                temperature=0.3,
+            )
+    except Exception as e:
+        logger.warning(f"[UnifiedWorkflow:run_analysis] Speculative decision failed: {e!r}")
+        return None
+
+
+def _needs_llm_decision(user_query: str, query_schema: Dict[str, Any]) -> bool:
+    """
+    Whether decide_visualization would reach its LLM step for this result.
+
+    Mirrors its cheap paths: empty and scalar results, the heuristics and
+    the decision cache.
+    """
+    row_count = query_schema["row_count"]
+    columns = query_schema["columns"]
+    if row_count == 0 or (row_count == 1 and len(columns) == 1):
+        return False
+    if _heuristic_visualization_decision(user_query, query_schema) is not None:
+        return False
+    return viz_decision_cache.get(decision_cache_key(user_query, columns, row_count)) is None
+
+
+async def _await_speculative_decision(
+    task: "asyncio.Task[Optional[VizDecision]]",
+    user_query: str,
+    query_schema: Dict[str, Any],
+) -> Optional[VizDecision]:
+    """
+    Wait for the speculative decision and check it against the actual result.
+
+    Args:
+        task: Task running _speculative_decision
+        user_query: User's natural language query
+        query_schema: Actual result header from _query_schema
+
+    Returns:
+        VizDecision, or None if it failed, took too long, or the result shape
+        points the other way
+    """
+    try:
+        decision = await asyncio.wait_for(task, _SPECULATION_WAIT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("[UnifiedWorkflow:run_analysis] Speculative decision timed out")
+        return None
+    if decision is None:
+        return None
+
+    # The speculation saw only the query; reject it if the result shape leans the other way
+    score, _ = _score_visualization(user_query, query_schema)
+    if (decision.should_visualize and score < 50) or (not decision.should_visualize and score > 50):
+        logger.info("[UnifiedWorkflow:run_analysis] Speculative decision contradicted by result shape")
+        return None
+    return decision
+
+
+# Max analysis summary characters in the visualization decision prompt
+_DECISION_SUMMARY_MAX_CHARS = 500
+
+# Circuit breaker name for the visualization decision LLM call
+VIZ_DECISION_CIRCUIT = "llm:viz_decision"
+
+
+async def _llm_visualization_decision(
+    state: UnifiedWorkflowState,
+    llm_client: LLMClient,
+    row_count: int,
+    columns: List[str],
+    column_count: int,
+) -> VizDecision:
+    """
+    Ask the LLM whether a visualization would help answer the query.
+
+    Args:
+        state: UnifiedWorkflowState
+        llm_client: LLM client
+        row_count: Number of result rows
+        columns: Result column names
+        column_count: Number of result columns
+
+    Returns:
+        VizDecision decoded by the provider's structured-output mode
+    """
+    # Dynamic part only; the static instructions are VIZ_DECISION_SYSTEM_PREFIX.
+    # The summary is capped so verbose analyses do not inflate the prompt.
+    summary = str((state.get("analysis_results") or {}).get("summary") or "N/A")
+    if len(summary) > _DECISION_SUMMARY_MAX_CHARS:
+        summary = summary[:_DECISION_SUMMARY_MAX_CHARS] + "..."
+    prompt = (
+        f"Query: {state['user_query']}\n"
+        f"Rows: {row_count}\n"
+        f"Columns ({column_count}): {', '.join(columns[:10])}{'...' if len(columns) > 10 else ''}\n"
+        f"Summary: {summary}"
+    )
+
+    # Call LLM for decision (raises CircuitOpenError during an LLM outage,
+    # so the node falls back to its default decision right away)
+    logger.info("[decide_visualization] Calling LLM for intelligent decision")
+    with circuit_breaker(VIZ_DECISION_CIRCUIT).guard():
+        return await llm_client.generate_structured(
+            prompt=prompt,
+            schema=VizDecision,
+            system_prompt=VIZ_DECISION_SYSTEM_PREFIX,
+            temperature=0.3,
+        )
+
+
 async def run_visualization_adapter_node(
     state: UnifiedWorkflowState,
     llm_client: LLMClient,
@@ -349,33 +1036,32 @@ async def run_visualization_adapter_node(
     Returns:
         State updates for UnifiedWorkflowState
     """
+    workflow_id = state["workflow_id"]
+
     logger.info(
         f"[UnifiedWorkflow:run_visualization] Invoking VisualizationAgent subgraph "
-        f"for workflow {state['workflow_id']}"
+        f"for workflow {workflow_id}"
     )
 
-    # Emit stage started event
-    await event_emitter.emit_stage_started(
-        workflow_id=state["workflow_id"],
+    # Emit stage started event (the stage starts by running the agent)
+    await event_emitter.emit_stage_and_agent_started(
+        workflow_id=workflow_id,
         stage="visualizing",
+        agent="visualization",
         message="Creating visualization...",
-        progress=0.5,
+        progress=0.55,
     )
 
     try:
-        # Import VisualizationAgent and its state helper
-        from app.agents.visualization_agent import VisualizationAgent
-        from app.agents.visualization_state import create_initial_visualization_state
-        import uuid
-
-        # Create VisualizationAgent instance
-        viz_agent = VisualizationAgent(
+        # Get VisualizationAgent instance (pooled per dependency set)
+        viz_agent = _get_visualization_agent(
             llm_client=llm_client,
             langfuse_handler=langfuse_handler,
         )
 
         # Generate unique visualization ID
-        viz_id = str(uuid.uuid4())
+        viz_id = uuid.uuid4().hex
+        options = _options(state)
 
         # Transform UnifiedWorkflowState → VisualizationAgent's VisualizationState input
         # IMPORTANT: Use create_initial_visualization_state to ensure all required fields
@@ -383,52 +1069,35 @@ async def run_visualization_adapter_node(
             visualization_id=viz_id,
             session_id=state["analysis_session_id"],
             user_query=state["user_query"],
-            data=state["query_data"],
+            data=state.get("query_data"),
             analysis_results=state.get("analysis_results"),
             # Allow user to override chart type
-            chart_type=state.get("options", {}).get("chart_type") or state.get("recommended_chart_type"),
-            plotly_theme=state.get("options", {}).get("plotly_theme", "plotly"),
-            custom_style_profile_id=state.get("options", {}).get("custom_style_profile_id"),
+            chart_type=options.get("chart_type") or state.get("recommended_chart_type"),
+            plotly_theme=options.get("plotly_theme", "plotly"),
+            custom_style_profile_id=options.get("custom_style_profile_id"),
             options={
-                "include_insights": state.get("options", {}).get("include_insights", True),
+                "include_insights": options.get("include_insights", True),
             },
             # Pass user's chart template from preferences
-            user_chart_template=state.get("options", {}).get("user_chart_template"),
+            user_chart_template=options.get("user_chart_template"),
         )
 
         # Configure Langfuse for subgraph
-        config = {
-            "configurable": {"thread_id": viz_id}
-        }
-        if langfuse_handler:
-            config["callbacks"] = [langfuse_handler]
-            config["run_name"] = f"VisualizationAgent: {state['user_query'][:50]}"
-            config["metadata"] = {
-                "workflow_id": state["workflow_id"],
-                "workflow_type": "unified",
-                "agent": "visualization",
-            }
-            config["tags"] = ["unified-workflow", "visualization-agent"]
-
-        # Emit agent started event
-        await event_emitter.emit_agent_started(
-            workflow_id=state["workflow_id"],
-            agent="visualization",
-            progress=0.55,
+        config = _subgraph_config(
+            state, viz_id, "visualization", "VisualizationAgent", langfuse_handler
         )
 
         # CRITICAL: Invoke VisualizationAgent's compiled workflow (subgraph)
         logger.info(
             f"[UnifiedWorkflow:run_visualization] Executing VisualizationAgent.workflow.ainvoke()"
         )
-        viz_result = await viz_agent.workflow.ainvoke(
-            visualization_input,
-            config=config
+        viz_result = await _invoke_visualization_subgraph(
+            state, viz_agent, visualization_input, config
         )
 
         # Emit agent completed event
         await event_emitter.emit_agent_completed(
-            workflow_id=state["workflow_id"],
+            workflow_id=workflow_id,
             agent="visualization",
             progress=0.85,
         )
@@ -448,7 +1117,7 @@ async def run_visualization_adapter_node(
             "chart_type": viz_result.get("chart_type"),
             "plotly_figure": viz_result.get("plotly_figure"),
             "chart_insights": viz_result.get("chart_insights", []),
-            "agents_executed": ["visualization"],
+            "agents_executed": ("visualization",),
         }
 
         # Accumulate any warnings or errors
@@ -491,27 +1160,30 @@ async def aggregate_results_node(
     Returns:
         Final state updates
     """
-    logger.info(
-        f"[UnifiedWorkflow:aggregate_results] Finalizing workflow {state['workflow_id']}"
-    )
+    workflow_id = state["workflow_id"]
 
-    # Emit finalizing stage event
-    await event_emitter.emit_stage_started(
-        workflow_id=state["workflow_id"],
-        stage="finalizing",
-        message="Finalizing results...",
-        progress=0.9,
+    logger.info(
+        f"[UnifiedWorkflow:aggregate_results] Finalizing workflow {workflow_id}"
     )
 
-    # Calculate total execution time
-    created_at = datetime.fromisoformat(state["created_at"])
-    completed_at = datetime.utcnow()
-    execution_time_ms = int((completed_at - created_at).total_seconds() * 1000)
-
-    # Aggregate all insights
-    all_insights = list(state.get("insights", []))
-    if state.get("chart_insights"):
-        all_insights.extend(state["chart_insights"])
+    # Calculate total execution time (monotonic: immune to wall-clock changes)
+    start_ns = state.get("start_monotonic_ns")
+    now = datetime.now(timezone.utc)
+    completed_at = now.isoformat()
+    if start_ns is not None and state.get("start_clock_id") == MONOTONIC_CLOCK_ID:
+        execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+    else:
+        # Monotonic start missing (older checkpoints) or recorded by another
+        # process (resumed checkpoint): only the wall clock is comparable
+        created_at = datetime.fromisoformat(state["created_at"])
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        execution_time_ms = int((now - created_at).total_seconds() * 1000)
+
+    # Aggregate all insights: "insights" uses an add reducer, so only the
+    # chart insights are returned and appended (no copy of the existing list)
+    chart_insights = state.get("chart_insights") or []
+    insight_count = len(state.get("insights") or []) + len(chart_insights)
 
     # Determine final status
     has_errors = len(state.get("errors", [])) > 0
@@ -525,30 +1197,33 @@ async def aggregate_results_node(
         final_status = "completed"
 
     logger.info(
-        f"[aggregate_results] Workflow {state['workflow_id']} completed: "
+        f"[aggregate_results] Workflow {workflow_id} completed: "
         f"status={final_status}, time={execution_time_ms}ms, "
         f"agents={state.get('agents_executed', [])}, "
-        f"insights={len(all_insights)}"
+        f"insights={insight_count}"
     )
 
-    # Emit workflow completion event (or failure event)
+    # Emit finalizing stage and workflow completion (or failure) events in
+    # one broadcast; nothing between them does I/O
     if final_status == "failed":
-        await event_emitter.emit_workflow_failed(
-            workflow_id=state["workflow_id"],
-            error=", ".join(state.get("errors", [])),
+        final_event = event_emitter.workflow_failed_event(
+            workflow_id, ", ".join(state.get("errors", []))
         )
     else:
-        await event_emitter.emit_workflow_completed(
-            workflow_id=state["workflow_id"],
-            conversation_id=state.get("conversation_id"),
+        final_event = event_emitter.workflow_completed_event(
+            workflow_id, state.get("conversation_id")
         )
+    await event_emitter.emit_many(workflow_id, [
+        event_emitter.stage_started_event(workflow_id, "finalizing", "Finalizing results...", 0.9),
+        final_event,
+    ])
 
     return {
         "workflow_status": final_status,
         "workflow_stage": "completed",
-        "completed_at": completed_at.isoformat(),
+        "completed_at": completed_at,
         "execution_time_ms": execution_time_ms,
-        "insights": all_insights,
+        "insights": chart_insights,
     }
 
 
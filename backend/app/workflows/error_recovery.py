@@ -9,7 +9,8 @@ Key Strategies:
 1. Partial Success: Return analysis results even if visualization fails
 2. Graceful Degradation: Fall back to simpler operations when advanced ones fail
 3. Informative Errors: Provide actionable error messages
-4. Retry Logic: (Future) Implement retry with exponential backoff for transient errors
+4. Retry Logic: Retry transient errors (connection drops, timeouts, rate limits)
+   with jittered exponential backoff
 
 Design Philosophy:
 - Analysis failure = workflow failure (cannot proceed without data)
@@ -17,12 +18,66 @@ Design Philosophy:
 - LLM failures = graceful degradation (use rule-based fallbacks)
 """
 
+import functools
 import logging
+import re
+import time
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Retry policy lives with the LLM/MindsDB call sites; re-exported here
+from app.core.errors import RetryPolicy, retry_policy
 
 logger = logging.getLogger(__name__)
 
+# Error classification: one case-insensitive scan per message, guidance
+# picked by the index of the matching group (first keyword wins)
+_ANALYSIS_ERROR_PATTERN = re.compile(r"(connection)|(sql|syntax)|(timeout)", re.IGNORECASE)
+_ANALYSIS_GUIDANCE = (
+    "Database connection failed. Check database availability and credentials.",
+    "SQL generation or execution failed. Try rephrasing your query.",
+    "Query timed out. Try querying less data or simplifying the request.",
+)
+_ANALYSIS_DEFAULT_GUIDANCE = "Analysis failed. Please check your query and try again."
+
+_VISUALIZATION_ERROR_PATTERN = re.compile(r"(data)|(chart|plotly)", re.IGNORECASE)
+_VISUALIZATION_GUIDANCE = (
+    "Data format incompatible with visualization. Analysis results available.",
+    "Chart generation failed. You can view the raw data results.",
+)
+_VISUALIZATION_DEFAULT_GUIDANCE = "Visualization unavailable. Analysis results are still available."
+
+# Fixed fields of each failure response; handlers merge in the per-error fields
+_ANALYSIS_FAILURE_BASE = MappingProxyType({
+    "workflow_status": "failed",
+    "workflow_stage": "failed",
+    "partial_success": False,
+})
+_VISUALIZATION_FAILURE_BASE = MappingProxyType({
+    "workflow_status": "partial_success",
+    "workflow_stage": "visualized",  # Reached viz stage, even if failed
+    "partial_success": True,
+    # No visualization_id, to indicate it didn't complete
+})
+_ERROR_RESPONSE_BASE = MappingProxyType({
+    "workflow_status": "failed",
+    "workflow_stage": "failed",
+    "query_success": False,
+    "partial_success": False,
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO timestamp as an aware datetime (naive values are taken as UTC).
+
+    Cached: a workflow's created_at recurs across its error responses.
+    """
+    parsed = datetime.fromisoformat(timestamp)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
 
 class ErrorRecoveryStrategy:
     """
@@ -53,27 +108,19 @@ class ErrorRecoveryStrategy:
             Error state updates
         """
         logger.error(
-            f"[ErrorRecovery] AnalysisAgent failed for workflow {workflow_id}: {error}"
+            "[ErrorRecovery] AnalysisAgent failed for workflow %s: %s", workflow_id, error
         )
 
         error_message = str(error)
 
         # Provide specific guidance based on error type
-        if "connection" in error_message.lower():
-            guidance = "Database connection failed. Check database availability and credentials."
-        elif "sql" in error_message.lower() or "syntax" in error_message.lower():
-            guidance = "SQL generation or execution failed. Try rephrasing your query."
-        elif "timeout" in error_message.lower():
-            guidance = "Query timed out. Try querying less data or simplifying the request."
-        else:
-            guidance = "Analysis failed. Please check your query and try again."
+        match = _ANALYSIS_ERROR_PATTERN.search(error_message)
+        guidance = _ANALYSIS_GUIDANCE[match.lastindex - 1] if match else _ANALYSIS_DEFAULT_GUIDANCE
 
         return {
-            "workflow_status": "failed",
-            "workflow_stage": "failed",
+            **_ANALYSIS_FAILURE_BASE,
             "errors": [f"Analysis failed: {error_message}"],
             "recommendations": [guidance],
-            "partial_success": False,
         }
 
     @staticmethod
@@ -97,27 +144,22 @@ class ErrorRecoveryStrategy:
             Partial success state updates
         """
         logger.warning(
-            f"[ErrorRecovery] VisualizationAgent failed for workflow {workflow_id}: {error}. "
-            f"Returning analysis results without visualization."
+            "[ErrorRecovery] VisualizationAgent failed for workflow %s: %s. "
+            "Returning analysis results without visualization.",
+            workflow_id,
+            error,
         )
 
         error_message = str(error)
 
         # Provide specific guidance
-        if "data" in error_message.lower():
-            guidance = "Data format incompatible with visualization. Analysis results available."
-        elif "chart" in error_message.lower() or "plotly" in error_message.lower():
-            guidance = "Chart generation failed. You can view the raw data results."
-        else:
-            guidance = "Visualization unavailable. Analysis results are still available."
+        match = _VISUALIZATION_ERROR_PATTERN.search(error_message)
+        guidance = _VISUALIZATION_GUIDANCE[match.lastindex - 1] if match else _VISUALIZATION_DEFAULT_GUIDANCE
 
         return {
-            "workflow_status": "partial_success",
-            "workflow_stage": "visualized",  # Reached viz stage, even if failed
+            **_VISUALIZATION_FAILURE_BASE,
             "warnings": [f"Visualization failed: {error_message}"],
             "recommendations": [guidance],
-            "partial_success": True,
-            # Don't set visualization_id to indicate it didn't complete
         }
 
     @staticmethod
@@ -141,8 +183,11 @@ class ErrorRecoveryStrategy:
             State updates with default decision
         """
         logger.warning(
-            f"[ErrorRecovery] Visualization decision failed for workflow {workflow_id}: {error}. "
-            f"Using default decision: {default_decision}"
+            "[ErrorRecovery] Visualization decision failed for workflow %s: %s. "
+            "Using default decision: %s",
+            workflow_id,
+            error,
+            default_decision,
         )
 
         return {
@@ -157,6 +202,7 @@ class ErrorRecoveryStrategy:
         error_message: str,
         created_at: Optional[str] = None,
         agents_executed: Optional[list] = None,
+        start_monotonic_ns: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Create a standardized error response.
@@ -166,77 +212,36 @@ class ErrorRecoveryStrategy:
             error_message: Error message
             created_at: When workflow started
             agents_executed: List of agents that executed before failure
+            start_monotonic_ns: time.monotonic_ns() at workflow start, recorded
+                in this process (only pass it when state["start_clock_id"]
+                is MONOTONIC_CLOCK_ID); when given, execution time is measured
+                from it instead of created_at
 
         Returns:
             Complete error response
         """
-        completed_at = datetime.utcnow().isoformat()
+        now = datetime.now(timezone.utc)
+        completed_at = now.isoformat()
         execution_time_ms = 0
 
-        if created_at:
+        if start_monotonic_ns is not None:
+            execution_time_ms = (time.monotonic_ns() - start_monotonic_ns) // 1_000_000
+        elif created_at:
             try:
-                created = datetime.fromisoformat(created_at)
-                completed = datetime.fromisoformat(completed_at)
-                execution_time_ms = int((completed - created).total_seconds() * 1000)
+                execution_time_ms = int((now - _parse_iso(created_at)).total_seconds() * 1000)
             except Exception:
                 pass
 
         return {
+            **_ERROR_RESPONSE_BASE,
             "workflow_id": workflow_id,
-            "workflow_status": "failed",
-            "workflow_stage": "failed",
             "errors": [error_message],
-            "created_at": created_at or datetime.utcnow().isoformat(),
+            "created_at": created_at or completed_at,
             "completed_at": completed_at,
             "execution_time_ms": execution_time_ms,
             "agents_executed": agents_executed or [],
-            "query_success": False,
-            "partial_success": False,
         }
 
 
-class RetryPolicy:
-    """
-    Retry policies for transient errors.
-
-    Future enhancement: Implement exponential backoff retry logic
-    for database connection errors, LLM timeouts, etc.
-
-    For initial implementation, we'll handle retries within each agent.
-    This class is a placeholder for future enhancements.
-    """
-
-    @staticmethod
-    def should_retry(error: Exception, retry_count: int) -> bool:
-        """
-        Determine if an operation should be retried.
-
-        Args:
-            error: Exception that occurred
-            retry_count: Current retry attempt count
-
-        Returns:
-            True if should retry, False otherwise
-        """
-        # For now, no automatic retries at workflow level
-        # Individual agents handle their own retries
-        return False
-
-    @staticmethod
-    def get_retry_delay(retry_count: int) -> float:
-        """
-        Calculate retry delay with exponential backoff.
-
-        Args:
-            retry_count: Current retry attempt count
-
-        Returns:
-            Delay in seconds
-        """
-        # Exponential backoff: 1s, 2s, 4s, 8s, ...
-        return min(2 ** retry_count, 30)  # Cap at 30 seconds
-
-
 # Singleton instances for easy access
 error_recovery = ErrorRecoveryStrategy()
-retry_policy = RetryPolicy()
@@ -2,16 +2,64 @@
 Workflow event emitter for real-time progress updates.
 
 Emits workflow events to WebSocket clients during workflow execution.
+
+Events are informational, so emitting never waits on WebSocket IO: each
+broadcast runs as a background task chained after the workflow's previous
+one, which keeps clients seeing events in emission order. Call drain()
+before reporting a workflow as finished.
 """
 
 import asyncio
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from app.websocket.connection_manager import connection_manager
 from app.websocket.events import create_workflow_event, WorkflowEventType
 import logging
 
 logger = logging.getLogger(__name__)
 
+# workflow_id -> last scheduled broadcast task
+_emit_tails: Dict[str, asyncio.Task] = {}
+
+
+async def _broadcast_after(
+    previous: Optional[asyncio.Task],
+    broadcast: Callable[..., Awaitable[None]],
+    workflow_id: str,
+    payload: Any,
+) -> None:
+    """Run one broadcast once the workflow's previous broadcast has finished."""
+    if previous is not None:
+        await asyncio.wait([previous])
+    try:
+        await broadcast(workflow_id, payload)
+    except Exception as e:
+        logger.error("[EventEmitter] Broadcast failed for workflow_id=%s: %s", workflow_id, e)
+
+
+def _forget_tail(workflow_id: str, task: asyncio.Task) -> None:
+    if _emit_tails.get(workflow_id) is task:
+        del _emit_tails[workflow_id]
+
+
+def _schedule_broadcast(
+    workflow_id: str,
+    broadcast: Callable[..., Awaitable[None]],
+    payload: Any,
+) -> None:
+    """
+    Schedule a broadcast in the background, after the workflow's pending ones.
+
+    Args:
+        workflow_id: Target workflow
+        broadcast: connection_manager broadcast method
+        payload: Event (or list of events) to pass to it
+    """
+    task = asyncio.create_task(
+        _broadcast_after(_emit_tails.get(workflow_id), broadcast, workflow_id, payload)
+    )
+    _emit_tails[workflow_id] = task
+    task.add_done_callback(lambda done: _forget_tail(workflow_id, done))
+
 
 class WorkflowEventEmitter:
     """
@@ -24,21 +72,38 @@ class WorkflowEventEmitter:
     async def emit_workflow_started(
         workflow_id: str,
         conversation_id: Optional[str] = None,
-        user_query: Optional[str] = None,
+        query_preview: Optional[str] = None,
     ):
-        """Emit workflow started event."""
-        logger.info(f"[EventEmitter] Emitting workflow.started for workflow_id={workflow_id}")
-        await connection_manager.broadcast_to_workflow(
+        """Emit workflow started event (query_preview: the already shortened user query)."""
+        logger.info("[EventEmitter] Emitting workflow.started for workflow_id=%s", workflow_id)
+        _schedule_broadcast(
             workflow_id,
+            connection_manager.broadcast_to_workflow,
             create_workflow_event(
                 WorkflowEventType.WORKFLOW_STARTED,
                 workflow_id=workflow_id,
                 conversation_id=conversation_id,
-                message=f"Processing: {user_query[:50] if user_query else 'query'}",
+                message=f"Processing: {query_preview or 'query'}",
                 progress=0.0,
             ),
         )
 
+    @staticmethod
+    def stage_started_event(
+        workflow_id: str,
+        stage: str,
+        message: str,
+        progress: float,
+    ) -> Dict[str, Any]:
+        """Build stage started event."""
+        return create_workflow_event(
+            WorkflowEventType.STAGE_STARTED,
+            workflow_id=workflow_id,
+            stage=stage,
+            message=message,
+            progress=progress,
+        )
+
     @staticmethod
     async def emit_stage_started(
         workflow_id: str,
@@ -47,16 +112,11 @@ class WorkflowEventEmitter:
         progress: float,
     ):
         """Emit stage started event."""
-        logger.info(f"[EventEmitter] Emitting stage.started (stage={stage}) for workflow_id={workflow_id}")
-        await connection_manager.broadcast_to_workflow(
+        logger.info("[EventEmitter] Emitting stage.started (stage=%s) for workflow_id=%s", stage, workflow_id)
+        _schedule_broadcast(
             workflow_id,
-            create_workflow_event(
-                WorkflowEventType.STAGE_STARTED,
-                workflow_id=workflow_id,
-                stage=stage,
-                message=message,
-                progress=progress,
-            ),
+            connection_manager.broadcast_to_workflow,
+            WorkflowEventEmitter.stage_started_event(workflow_id, stage, message, progress),
         )
 
     @staticmethod
@@ -67,8 +127,9 @@ class WorkflowEventEmitter:
         progress: float,
     ):
         """Emit stage completed event."""
-        await connection_manager.broadcast_to_workflow(
+        _schedule_broadcast(
             workflow_id,
+            connection_manager.broadcast_to_workflow,
             create_workflow_event(
                 WorkflowEventType.STAGE_COMPLETED,
                 workflow_id=workflow_id,
@@ -78,6 +139,21 @@ class WorkflowEventEmitter:
             ),
         )
 
+    @staticmethod
+    def agent_started_event(
+        workflow_id: str,
+        agent: str,
+        progress: float,
+    ) -> Dict[str, Any]:
+        """Build agent started event."""
+        return create_workflow_event(
+            WorkflowEventType.AGENT_STARTED,
+            workflow_id=workflow_id,
+            agent=agent,
+            message=f"{agent.capitalize()} agent processing...",
+            progress=progress,
+        )
+
     @staticmethod
     async def emit_agent_started(
         workflow_id: str,
@@ -85,13 +161,36 @@ class WorkflowEventEmitter:
         progress: float,
     ):
         """Emit agent started event."""
-        await connection_manager.broadcast_to_workflow(
+        _schedule_broadcast(
+            workflow_id,
+            connection_manager.broadcast_to_workflow,
+            WorkflowEventEmitter.agent_started_event(workflow_id, agent, progress),
+        )
+
+    @staticmethod
+    async def emit_stage_and_agent_started(
+        workflow_id: str,
+        stage: str,
+        agent: str,
+        message: str,
+        progress: float,
+    ):
+        """Emit one event for a stage that starts by running an agent."""
+        logger.info(
+            "[EventEmitter] Emitting stage_and_agent.started (stage=%s, agent=%s) for workflow_id=%s",
+            stage,
+            agent,
             workflow_id,
+        )
+        _schedule_broadcast(
+            workflow_id,
+            connection_manager.broadcast_to_workflow,
             create_workflow_event(
-                WorkflowEventType.AGENT_STARTED,
+                WorkflowEventType.STAGE_AND_AGENT_STARTED,
                 workflow_id=workflow_id,
+                stage=stage,
                 agent=agent,
-                message=f"{agent.capitalize()} agent processing...",
+                message=message,
                 progress=progress,
             ),
         )
@@ -103,8 +202,9 @@ class WorkflowEventEmitter:
         progress: float,
     ):
         """Emit agent completed event."""
-        await connection_manager.broadcast_to_workflow(
+        _schedule_broadcast(
             workflow_id,
+            connection_manager.broadcast_to_workflow,
             create_workflow_event(
                 WorkflowEventType.AGENT_COMPLETED,
                 workflow_id=workflow_id,
@@ -114,21 +214,44 @@ class WorkflowEventEmitter:
             ),
         )
 
+    @staticmethod
+    def workflow_completed_event(
+        workflow_id: str,
+        conversation_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build workflow completed event."""
+        return create_workflow_event(
+            WorkflowEventType.WORKFLOW_COMPLETED,
+            workflow_id=workflow_id,
+            conversation_id=conversation_id,
+            message="Workflow completed successfully",
+            progress=1.0,
+        )
+
     @staticmethod
     async def emit_workflow_completed(
         workflow_id: str,
         conversation_id: Optional[str] = None,
     ):
         """Emit workflow completed event."""
-        await connection_manager.broadcast_to_workflow(
+        _schedule_broadcast(
             workflow_id,
-            create_workflow_event(
-                WorkflowEventType.WORKFLOW_COMPLETED,
-                workflow_id=workflow_id,
-                conversation_id=conversation_id,
-                message="Workflow completed successfully",
-                progress=1.0,
-            ),
+            connection_manager.broadcast_to_workflow,
+            WorkflowEventEmitter.workflow_completed_event(workflow_id, conversation_id),
+        )
+
+    @staticmethod
+    def workflow_failed_event(
+        workflow_id: str,
+        error: str,
+    ) -> Dict[str, Any]:
+        """Build workflow failed event."""
+        return create_workflow_event(
+            WorkflowEventType.WORKFLOW_FAILED,
+            workflow_id=workflow_id,
+            error=error,
+            message=f"Workflow failed: {error}",
+            progress=0.0,
         )
 
     @staticmethod
@@ -137,17 +260,38 @@ class WorkflowEventEmitter:
         error: str,
     ):
         """Emit workflow failed event."""
-        await connection_manager.broadcast_to_workflow(
+        _schedule_broadcast(
             workflow_id,
-            create_workflow_event(
-                WorkflowEventType.WORKFLOW_FAILED,
-                workflow_id=workflow_id,
-                error=error,
-                message=f"Workflow failed: {error}",
-                progress=0.0,
-            ),
+            connection_manager.broadcast_to_workflow,
+            WorkflowEventEmitter.workflow_failed_event(workflow_id, error),
         )
 
+    @staticmethod
+    async def emit_many(
+        workflow_id: str,
+        events: List[Dict[str, Any]],
+    ):
+        """
+        Emit several events (from the *_event builders) in one broadcast.
+
+        Events are delivered in order; use this for events emitted back to
+        back, without work in between that the client should see first.
+        """
+        logger.info("[EventEmitter] Emitting %d events for workflow_id=%s", len(events), workflow_id)
+        _schedule_broadcast(workflow_id, connection_manager.broadcast_many_to_workflow, events)
+
+    @staticmethod
+    async def drain(workflow_id: str):
+        """
+        Wait until every event emitted so far for a workflow has been broadcast.
+
+        Args:
+            workflow_id: Workflow whose pending broadcasts to wait for
+        """
+        tail = _emit_tails.get(workflow_id)
+        if tail is not None:
+            await asyncio.wait([tail])
+
 
 # Singleton instance
 event_emitter = WorkflowEventEmitter()
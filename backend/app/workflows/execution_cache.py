@@ -0,0 +1,270 @@
+"""
+Execution cache for agent subgraph results.
+
+Identical requests (same query, database, user context and options) produce
+the same subgraph result, so adapter nodes can return a stored result instead
+of re-running the agent workflow and its LLM calls.
+
+Results are stored as JSON in Redis under "<namespace>:<fingerprint>" keys
+with a TTL. Values JSON cannot represent (Decimal, datetime, date, time,
+UUID) are tagged on write and rebuilt on read; results holding any other
+type are not stored. Nothing is unpickled, so write access to Redis does
+not mean code execution in the API process. Redis is optional: if the
+client is missing or the server is unreachable every lookup is a miss and
+nothing is stored.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timezone
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    aioredis = None
+    RedisError = Exception
+
+logger = logging.getLogger(__name__)
+
+# Seconds to stop trying Redis after a connection failure
+_RETRY_AFTER_FAILURE_SECONDS = 60
+
+# Added to results served from the cache: ISO time the result was computed
+CACHED_AT_KEY = "cached_at"
+
+# Key marking a tagged (non-JSON) value in stored results
+_TYPE_TAG = "__cache_type__"
+
+# Tagged types: tag -> (type, encode to str, decode from str).
+# datetime precedes date (datetime is a date subclass).
+_TAGGED_TYPES = {
+    "decimal": (Decimal, str, Decimal),
+    "datetime": (datetime, datetime.isoformat, datetime.fromisoformat),
+    "date": (date, date.isoformat, date.fromisoformat),
+    "time": (dt_time, dt_time.isoformat, dt_time.fromisoformat),
+    "uuid": (uuid.UUID, str, uuid.UUID),
+}
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON default hook: tag rebuildable values, reject anything else."""
+    for tag, (value_type, encode, _) in _TAGGED_TYPES.items():
+        if isinstance(value, value_type):
+            return {_TYPE_TAG: tag, "value": encode(value)}
+    if NUMPY_AVAILABLE and isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    """Rebuild tagged values in a decoded JSON document."""
+    if isinstance(value, dict):
+        tag = value.get(_TYPE_TAG)
+        if tag is not None and len(value) == 2:
+            return _TAGGED_TYPES[tag][2](value["value"])
+        return {k: _decode_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode_value(v) for v in value]
+    return value
+
+
+def _dump_result(result: Dict[str, Any]) -> bytes:
+    """Serialize a result to JSON bytes (TypeError for unsupported values)."""
+    if ORJSON_AVAILABLE:
+        # Route datetimes through _encode_value so they come back as datetimes
+        return orjson.dumps(result, default=_encode_value, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(result, default=_encode_value, separators=(",", ":")).encode("utf-8")
+
+
+def _load_result(payload: bytes) -> Dict[str, Any]:
+    """Deserialize a result written by _dump_result."""
+    data = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+    return _decode_value(data)
+
+
+def execution_fingerprint(*parts: Any) -> str:
+    """
+    Build a stable fingerprint for an execution's inputs.
+
+    Args:
+        *parts: JSON-serializable inputs (non-JSON values are stringified)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    if ORJSON_AVAILABLE:
+        # Parts include full query result rows, so serialization speed matters
+        raw = orjson.dumps(
+            parts,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    else:
+        raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+class ExecutionCache:
+    """Redis-backed store for subgraph results."""
+
+    def __init__(self, redis_url: str, enabled: bool = True):
+        """
+        Initialize cache.
+
+        Args:
+            redis_url: Redis connection URL
+            enabled: When False, every lookup misses and nothing is stored
+        """
+        self.redis_url = redis_url
+        self.enabled = enabled
+        self._client = None
+        self._disabled_until = 0.0
+
+    def _get_client(self):
+        """Get the Redis client, or None while Redis is unavailable."""
+        if not (self.enabled and REDIS_AVAILABLE) or time.monotonic() < self._disabled_until:
+            return None
+        if self._client is None:
+            self._client = aioredis.from_url(
+                self.redis_url,
+                socket_connect_timeout=0.5,
+                socket_timeout=0.5,
+            )
+        return self._client
+
+    def _mark_unavailable(self, error: Exception) -> None:
+        logger.warning(f"[ExecutionCache] Redis unavailable, bypassing cache: {error}")
+        self._disabled_until = time.monotonic() + _RETRY_AFTER_FAILURE_SECONDS
+
+    async def get(self, namespace: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored result.
+
+        Args:
+            namespace: Result kind (e.g. "analysis", "viz")
+            fingerprint: Key from execution_fingerprint
+
+        Returns:
+            Stored result, or None on miss or when Redis is unavailable
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(f"{namespace}:{fingerprint}")
+        except (RedisError, OSError) as e:
+            self._mark_unavailable(e)
+            return None
+        if payload is None:
+            return None
+        try:
+            return _load_result(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"[ExecutionCache] Ignoring unreadable entry {namespace}:{fingerprint}: {e}")
+            return None
+
+    async def set(
+        self,
+        namespace: str,
+        fingerprint: str,
+        result: Dict[str, Any],
+        ttl_seconds: int,
+    ) -> None:
+        """
+        Store a result.
+
+        Args:
+            namespace: Result kind (e.g. "analysis", "viz")
+            fingerprint: Key from execution_fingerprint
+            result: Subgraph result to store
+            ttl_seconds: Expiry in seconds
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            payload = _dump_result(result)
+        except TypeError as e:
+            logger.warning(f"[ExecutionCache] Not caching {namespace} result: {e}")
+            return
+        try:
+            await client.setex(f"{namespace}:{fingerprint}", ttl_seconds, payload)
+        except (RedisError, OSError) as e:
+            self._mark_unavailable(e)
+
+
+# Global cache instance
+execution_cache = ExecutionCache(settings.redis.url, enabled=settings.agent.execution_cache_enabled)
+
+
+def execution_cached(
+    namespace: str,
+    key_fn: Callable[..., Optional[Tuple[str, int]]],
+    should_cache: Callable[[Dict[str, Any]], bool] = lambda result: True,
+    refresh: Callable[..., bool] = lambda *args, **kwargs: False,
+):
+    """
+    Cache an async function's result in the execution cache.
+
+    Args:
+        namespace: Key namespace for stored results
+        key_fn: Called with the function's arguments; returns
+            (fingerprint, ttl_seconds), or None to bypass the cache
+        should_cache: Predicate deciding whether a fresh result is stored
+        refresh: Called with the function's arguments; True skips the
+            lookup and replaces the stored result
+
+    Returns:
+        Decorator for an async function returning a dict
+    """
+    def decorator(func: Callable[..., Awaitable[Dict[str, Any]]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            key = key_fn(*args, **kwargs)
+            if key is None:
+                return await func(*args, **kwargs)
+
+            fingerprint, ttl_seconds = key
+            if refresh(*args, **kwargs):
+                logger.info(f"[ExecutionCache] {namespace} refresh requested")
+            else:
+                cached = await execution_cache.get(namespace, fingerprint)
+                if cached is not None:
+                    logger.info(f"[ExecutionCache] {namespace} cache hit")
+                    return cached
+
+            result = await func(*args, **kwargs)
+            if should_cache(result):
+                # Served results carry the time they were computed
+                stored = {**result, CACHED_AT_KEY: datetime.now(timezone.utc).isoformat()}
+                await execution_cache.set(namespace, fingerprint, stored, ttl_seconds)
+            return result
+
+        return wrapper
+
+    return decorator
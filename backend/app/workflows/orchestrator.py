@@ -13,14 +13,15 @@ Key architectural principle: SUBGRAPH PATTERN
 """
 
 import logging
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 
-from app.workflows.unified_state import UnifiedWorkflowState
+from app.workflows.unified_state import MONOTONIC_CLOCK_ID, UnifiedWorkflowState
 from app.workflows.coordination_nodes import (
     run_analysis_adapter_node,
     decide_visualization_node,
@@ -79,7 +80,7 @@ class UnifiedWorkflowOrchestrator:
         Initialize unified workflow orchestrator.
 
         Note: Agents are NOT stored as instance variables.
-        They are created fresh in adapter nodes to avoid stale state.
+        Adapter nodes get them from a pool keyed by these dependencies.
 
         Args:
             llm_client: LLM client for all agents
@@ -245,6 +246,8 @@ class UnifiedWorkflowOrchestrator:
                 - custom_style_profile_id: str - custom style profile ID
                 - include_insights: bool (default True) - generate insights
                 - limit_rows: int (default 1000) - query result limit
+                - cache_results: bool (default False) - reuse an identical request's result
+                - refresh_cache: bool (default False) - re-run and replace the cached result
 
         Returns:
             Complete workflow results:
@@ -293,12 +296,16 @@ class UnifiedWorkflowOrchestrator:
             f"query='{user_query}', database='{database}'"
         )
 
+        # Shortened once for trace names and progress messages
+        user_query_preview = f"{user_query[:50]}..." if len(user_query) > 50 else user_query
+
         # Create initial state for unified workflow
         initial_state = {
             # Request
             "workflow_id": workflow_id,
             "conversation_id": conversation_id,
             "user_query": user_query,
+            "user_query_preview": user_query_preview,
             "database": database,
             "options": options or {},
 
@@ -321,6 +328,7 @@ class UnifiedWorkflowOrchestrator:
             "sql_confidence": None,
             "query_success": False,
             "query_data": None,
+            "query_schema": None,
             "analysis_results": None,
             "enhanced_analysis": None,
 
@@ -328,6 +336,7 @@ class UnifiedWorkflowOrchestrator:
             "should_visualize": False,
             "visualization_reasoning": None,
             "skip_visualization_reason": None,
+            "speculative_viz_decision": None,
 
             # Visualization state (will be populated by VisualizationAgent if visualized)
             "visualization_id": None,
@@ -346,10 +355,12 @@ class UnifiedWorkflowOrchestrator:
             "partial_success": False,
 
             # Metadata
-            "created_at": datetime.utcnow().isoformat(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "start_monotonic_ns": time.monotonic_ns(),
+            "start_clock_id": MONOTONIC_CLOCK_ID,
             "completed_at": None,
             "execution_time_ms": None,
-            "agents_executed": [],
+            "agents_executed": (),
         }
 
         # Configure Langfuse for unified workflow
@@ -364,7 +375,7 @@ class UnifiedWorkflowOrchestrator:
             trace_handler = CallbackHandler()
 
             config["callbacks"] = [trace_handler]
-            config["run_name"] = f"Unified: {user_query[:50]}{'...' if len(user_query) > 50 else ''}"
+            config["run_name"] = f"Unified: {user_query_preview}"
             config["metadata"] = {
                 "workflow_id": workflow_id,
                 "conversation_id": conversation_id,
@@ -381,7 +392,7 @@ class UnifiedWorkflowOrchestrator:
             await event_emitter.emit_workflow_started(
                 workflow_id=workflow_id,
                 conversation_id=conversation_id,
-                user_query=user_query,
+                query_preview=user_query_preview,
             )
 
             # Execute unified workflow
@@ -390,6 +401,9 @@ class UnifiedWorkflowOrchestrator:
 
             final_state = await self.workflow.ainvoke(initial_state, config=config)
 
+            # Progress events are broadcast in the background; deliver them before the result
+            await event_emitter.drain(workflow_id)
+
             logger.info(
                 f"[Orchestrator] Workflow {workflow_id} completed: "
                 f"status={final_state.get('workflow_status')}, "
@@ -405,6 +419,7 @@ class UnifiedWorkflowOrchestrator:
                 f"[Orchestrator] Workflow {workflow_id} failed catastrophically: {e}",
                 exc_info=True
             )
+            await event_emitter.drain(workflow_id)
 
             # Return error state
             return {
@@ -413,11 +428,9 @@ class UnifiedWorkflowOrchestrator:
                 "workflow_status": "failed",
                 "errors": [f"Workflow execution failed: {str(e)}"],
                 "created_at": initial_state["created_at"],
-                "completed_at": datetime.utcnow().isoformat(),
-                "execution_time_ms": int(
-                    (datetime.utcnow() - datetime.fromisoformat(initial_state["created_at"])).total_seconds() * 1000
-                ),
-                "agents_executed": [],
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "execution_time_ms": (time.monotonic_ns() - initial_state["start_monotonic_ns"]) // 1_000_000,
+                "agents_executed": (),
             }
 
     async def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
@@ -5,9 +5,24 @@ This module defines the state structure for unified workflows that
 coordinate multiple agents (AnalysisAgent, VisualizationAgent).
 """
 
-from typing import TypedDict, Optional, Dict, Any, List, Annotated
+import uuid
+from typing import TypedDict, Optional, Dict, Any, List, Annotated, Iterable, Tuple
 from operator import add
 
+# Identifies this process's monotonic clock. start_monotonic_ns is only
+# comparable to time.monotonic_ns() in the process that recorded it, so a
+# state resumed elsewhere (other worker, restart) falls back to created_at.
+MONOTONIC_CLOCK_ID = uuid.uuid4().hex
+
+
+def append_agents(left: Iterable[str], right: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Reducer for agents_executed: concatenate into one immutable tuple.
+
+    Accepts lists too, since checkpoint serialization restores tuples as lists.
+    """
+    return (*left, *right)
+
 
 class UnifiedWorkflowState(TypedDict):
     """
@@ -24,12 +39,18 @@ class UnifiedWorkflowState(TypedDict):
 
     Annotated fields with `add` operator accumulate values across nodes
     (e.g., insights from multiple agents are concatenated).
+
+    Kept as a TypedDict: LangGraph stores each field in its own channel and
+    hands nodes a plain dict, so a slotted class would add a conversion per
+    node rather than remove dict lookups. Query rows are kept in the state
+    so a checkpoint alone is enough to resume the workflow.
     """
 
     # === Request ===
     workflow_id: str  # Unique per execution
     conversation_id: str  # Persistent across conversation (thread_id for checkpointer)
     user_query: str
+    user_query_preview: str  # First 50 characters of user_query, for trace names and progress messages
     database: str
     options: Dict[str, Any]
 
@@ -52,6 +73,7 @@ class UnifiedWorkflowState(TypedDict):
     sql_confidence: Optional[float]
     query_success: bool
     query_data: Optional[List[Dict[str, Any]]]
+    query_schema: Optional[Dict[str, Any]]  # {"columns", "row_count", "dtypes"} of query_data
     analysis_results: Optional[Dict[str, Any]]
     enhanced_analysis: Optional[Dict[str, Any]]
 
@@ -59,6 +81,7 @@ class UnifiedWorkflowState(TypedDict):
     should_visualize: bool
     visualization_reasoning: Optional[str]
     skip_visualization_reason: Optional[str]
+    speculative_viz_decision: Optional[Dict[str, Any]]  # VizDecision asked for during analysis
 
     # === VisualizationAgent State (embedded) ===
     visualization_id: Optional[str]
@@ -78,6 +101,8 @@ class UnifiedWorkflowState(TypedDict):
 
     # === Metadata ===
     created_at: str
+    start_monotonic_ns: Optional[int]  # time.monotonic_ns() at start, for execution_time_ms
+    start_clock_id: Optional[str]  # MONOTONIC_CLOCK_ID of the process that set start_monotonic_ns
     completed_at: Optional[str]
     execution_time_ms: Optional[int]
-    agents_executed: Annotated[List[str], add]
+    agents_executed: Annotated[Tuple[str, ...], append_agents]
@@ -0,0 +1,13 @@
+"""
+Shared test configuration.
+"""
+
+import pytest
+
+from app.workflows.execution_cache import execution_cache
+
+
+@pytest.fixture(autouse=True)
+def disable_execution_cache(monkeypatch):
+    """Keep unit tests independent of any Redis reachable from the test host."""
+    monkeypatch.setattr(execution_cache, "enabled", False)
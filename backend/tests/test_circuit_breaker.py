@@ -0,0 +1,68 @@
+"""
+Unit tests for workflow dependency circuit breakers.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.workflows.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def clock():
+    """Controllable time.monotonic for the breaker module."""
+    now = [1000.0]
+    with patch("app.workflows.circuit_breaker.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_opens_after_threshold_and_recovers(clock):
+    """Test closed -> open -> half-open -> closed."""
+    breaker = CircuitBreaker("llm:test", failure_threshold=3, reset_after_seconds=30)
+
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock[0] += 30
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()  # Only one trial call
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens(clock):
+    """Test that a failed half-open trial re-opens the circuit."""
+    breaker = CircuitBreaker("db:test", failure_threshold=1, reset_after_seconds=10)
+    breaker.record_failure()
+
+    clock[0] += 10
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_guard_counts_only_transient_errors(clock):
+    """Test that guard records transient errors and fails fast once open."""
+    breaker = CircuitBreaker("llm:test", failure_threshold=2, reset_after_seconds=30)
+
+    with pytest.raises(ValueError):
+        with breaker.guard():
+            raise ValueError("bad request")
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            with breaker.guard():
+                raise TimeoutError("no response")
+
+    with pytest.raises(CircuitOpenError):
+        with breaker.guard():
+            pytest.fail("guarded call should not run while open")
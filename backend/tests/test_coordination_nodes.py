@@ -5,9 +5,11 @@ Tests the adapter nodes that coordinate between the unified workflow
 and individual agent subgraphs.
 """
 
+import asyncio
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 from app.workflows.coordination_nodes import (
     run_analysis_adapter_node,
@@ -15,15 +17,76 @@ from app.workflows.coordination_nodes import (
     run_visualization_adapter_node,
     aggregate_results_node,
     should_visualize_router,
+    _agent_pool,
+    _get_visualization_agent,
+    _release_checkpoint_thread,
+    _query_schema,
+    _heuristic_visualization_decision,
+    _score_visualization,
+    _query_intent_label,
+    _subgraph_config,
+    _invoke_analysis_subgraph,
+    _cache_ttl,
+    _visualization_cache_key,
+    _should_speculate,
+    ANALYSIS_CIRCUIT,
+    VIZ_DECISION_CIRCUIT,
+    VIZ_DECISION_SYSTEM_PREFIX,
 )
-from app.workflows.unified_state import UnifiedWorkflowState
+from app.core.config import settings
+from app.workflows.circuit_breaker import _breakers, circuit_breaker
+from app.workflows.unified_state import MONOTONIC_CLOCK_ID, UnifiedWorkflowState, append_agents
+from app.schemas.visualization_schemas import VizDecision
+from app.core.viz_decision_cache import viz_decision_cache, decision_cache_key
+from app.workflows.execution_cache import execution_cache
+
+
+def stream_of(*outcomes):
+    """Mock CompiledStateGraph.astream: each call streams one final state (or raises)."""
+    remaining = iter(outcomes)
+
+    def astream(*args, **kwargs):
+        outcome = next(remaining)
+
+        async def run():
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield "values", outcome
+
+        return run()
+
+    return MagicMock(side_effect=astream)
+
+
+@pytest.fixture(autouse=True)
+def clear_viz_decision_cache():
+    """Keep cached visualization decisions from leaking between tests."""
+    viz_decision_cache.clear()
+    yield
+    viz_decision_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_pool():
+    """Keep pooled agents (and their mocked dependencies) out of other tests."""
+    _agent_pool.clear()
+    yield
+    _agent_pool.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Start every test with closed circuits."""
+    _breakers.clear()
+    yield
+    _breakers.clear()
 
 
 @pytest.fixture
 def mock_llm_client():
     """Create mock LLM client."""
     client = MagicMock()
-    client.generate_text = AsyncMock()
+    client.generate_structured = AsyncMock()
     return client
 
 
@@ -92,7 +155,7 @@ class TestRunAnalysisAdapterNode:
         with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
             # Setup mock
             mock_agent_instance = MagicMock()
-            mock_agent_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_agent_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAgent.return_value = mock_agent_instance
 
             # Execute node
@@ -107,17 +170,57 @@ class TestRunAnalysisAdapterNode:
             assert result["query_success"] is True
             assert result["generated_sql"] == "SELECT * FROM sales"
             assert result["sql_confidence"] == 0.95
-            assert len(result["query_data"]) == 1
+            assert result["query_data"] == mock_analysis_result["query_data"]
+            assert result["query_schema"]["row_count"] == 1
             assert "analysis" in result["agents_executed"]
 
+    @pytest.mark.asyncio
+    async def test_analysis_stops_after_fatal_node_failure(self, base_unified_state):
+        """Test that nodes after a failed SQL generation are not run."""
+        from typing import Annotated, List, TypedDict
+        from operator import add
+        from langgraph.graph import StateGraph, START, END
+
+        class AnalysisState(TypedDict):
+            workflow_status: str
+            errors: Annotated[List[str], add]
+
+        executed = []
+
+        def generate_sql(state):
+            return {"workflow_status": "failed", "errors": ["SQL generation failed"]}
+
+        def validate_sql(state):
+            executed.append("validate_sql")
+            return {}
+
+        graph = StateGraph(AnalysisState)
+        graph.add_node("generate_sql", generate_sql)
+        graph.add_node("validate_sql", validate_sql)
+        graph.add_edge(START, "generate_sql")
+        graph.add_edge("generate_sql", "validate_sql")
+        graph.add_edge("validate_sql", END)
+        agent = MagicMock()
+        agent.workflow = graph.compile()
+
+        result = await _invoke_analysis_subgraph(
+            base_unified_state,
+            agent,
+            {"workflow_status": "pending", "errors": []},
+            {"configurable": {"thread_id": "test-workflow-123"}},
+        )
+
+        assert result == {"workflow_status": "failed", "errors": ["SQL generation failed"]}
+        assert executed == []
+
     @pytest.mark.asyncio
     async def test_analysis_failure(self, mock_llm_client, base_unified_state):
         """Test analysis failure handling."""
         with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
             # Setup mock to raise exception
             mock_agent_instance = MagicMock()
-            mock_agent_instance.workflow.ainvoke = AsyncMock(
-                side_effect=Exception("Database connection failed")
+            mock_agent_instance.workflow.astream = stream_of(
+                Exception("Database connection failed")
             )
             MockAgent.return_value = mock_agent_instance
 
@@ -133,6 +236,61 @@ class TestRunAnalysisAdapterNode:
             assert "Database connection failed" in result["errors"][0]
 
 
+    @pytest.mark.asyncio
+    async def test_transient_failure_state_opens_circuit(self, mock_llm_client, base_unified_state):
+        """Test that outages reported in the subgraph state open the analysis circuit."""
+        failed_result = {
+            "workflow_status": "failed",
+            "query_success": False,
+            "errors": ["SQL generation failed: Request timeout after 3 attempts"],
+            "dependency_error": True,
+        }
+        breaker = circuit_breaker(ANALYSIS_CIRCUIT)
+        breaker.failure_threshold = 2
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
+            mock_agent_instance = MagicMock()
+            mock_agent_instance.workflow.astream = stream_of(failed_result, failed_result)
+            MockAgent.return_value = mock_agent_instance
+
+            for _ in range(2):
+                await run_analysis_adapter_node(base_unified_state, llm_client=mock_llm_client)
+            assert breaker.state == "open"
+
+            result = await run_analysis_adapter_node(base_unified_state, llm_client=mock_llm_client)
+
+        assert result["workflow_status"] == "failed"
+        assert "unavailable" in result["errors"][0]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query_error", [
+        "Table 'sales.orderz' doesn't exist",
+        "HTTP 400: canceling statement due to statement timeout",
+    ])
+    async def test_non_transient_failure_state_keeps_circuit_closed(
+        self, mock_llm_client, base_unified_state, query_error
+    ):
+        """Test that errors caused by the query (bad SQL, statement timeouts) are not outages."""
+        failed_result = {
+            "workflow_status": "failed",
+            "query_success": False,
+            "query_error": query_error,
+            "dependency_error": False,
+            "errors": [],
+        }
+        breaker = circuit_breaker(ANALYSIS_CIRCUIT)
+        breaker.failure_threshold = 1
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
+            mock_agent_instance = MagicMock()
+            mock_agent_instance.workflow.astream = stream_of(failed_result)
+            MockAgent.return_value = mock_agent_instance
+
+            await run_analysis_adapter_node(base_unified_state, llm_client=mock_llm_client)
+
+        assert breaker.state == "closed"
+
+
 class TestDecideVisualizationNode:
     """Tests for decide_visualization_node."""
 
@@ -177,6 +335,7 @@ class TestDecideVisualizationNode:
         """Test LLM decision to visualize."""
         state = base_unified_state.copy()
         state["query_success"] = True
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
         state["query_data"] = [
             {"region": "North", "sales": 1000},
             {"region": "South", "sales": 1500},
@@ -184,13 +343,11 @@ class TestDecideVisualizationNode:
         state["analysis_results"] = {"summary": "Sales vary by region"}
 
         # Mock LLM response
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": true,
-            "reasoning": "Chart would help compare regions",
-            "suggested_chart_type": "bar"
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True,
+            reasoning="Chart would help compare regions",
+            suggested_chart_type="bar",
+        )
 
         result = await decide_visualization_node(state, mock_llm_client)
 
@@ -198,15 +355,31 @@ class TestDecideVisualizationNode:
         assert "reasoning" in result["visualization_reasoning"]
         assert result.get("recommended_chart_type") == "bar"
 
+    @pytest.mark.asyncio
+    async def test_explicit_chart_type_skips_llm(self, mock_llm_client, base_unified_state):
+        """Test that a caller-specified chart type decides without the LLM."""
+        state = base_unified_state.copy()
+        state["query_success"] = True
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
+        state["query_data"] = [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}]
+        state["options"] = {"chart_type": "pie"}
+
+        result = await decide_visualization_node(state, mock_llm_client)
+
+        assert result["should_visualize"] is True
+        assert result["recommended_chart_type"] == "pie"
+        mock_llm_client.generate_structured.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_llm_failure_defaults_to_visualize(self, mock_llm_client, base_unified_state):
         """Test that LLM failure defaults to visualizing."""
         state = base_unified_state.copy()
         state["query_success"] = True
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
         state["query_data"] = [{"region": "North", "sales": 1000}]
 
         # Mock LLM failure
-        mock_llm_client.generate_text.side_effect = Exception("LLM timeout")
+        mock_llm_client.generate_structured.side_effect = Exception("LLM timeout")
 
         result = await decide_visualization_node(state, mock_llm_client)
 
@@ -215,6 +388,336 @@ class TestDecideVisualizationNode:
         assert len(result.get("warnings", [])) > 0
 
 
+    @pytest.mark.asyncio
+    async def test_repeat_query_uses_cached_decision(self, mock_llm_client, base_unified_state):
+        """Test that the same query shape reuses the LLM decision."""
+        state = base_unified_state.copy()
+        state["query_success"] = True
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
+        state["query_data"] = [
+            {"region": "North", "sales": 1000},
+            {"region": "South", "sales": 1500},
+        ]
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True, reasoning="Compare regions", suggested_chart_type="bar"
+        )
+
+        first = await decide_visualization_node(state, mock_llm_client)
+
+        repeat = state.copy()
+        repeat["user_query"] = "  sales PERFORMANCE for north and  south "
+        repeat["query_data"] = state["query_data"] + [{"region": "East", "sales": 900}]
+        second = await decide_visualization_node(repeat, mock_llm_client)
+
+        assert mock_llm_client.generate_structured.await_count == 1
+        assert second["should_visualize"] is True
+        assert second["recommended_chart_type"] == first["recommended_chart_type"] == "bar"
+
+    @pytest.mark.asyncio
+    async def test_decision_reads_query_schema(self, mock_llm_client, base_unified_state):
+        """Test that rules use the query_schema header, not the row payload."""
+        state = base_unified_state.copy()
+        state["query_success"] = True
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
+        state["query_data"] = [{"total": 42}]
+        state["query_schema"] = {
+            "columns": ["region", "sales"],
+            "row_count": 2,
+            "dtypes": {"region": "str", "sales": "int"},
+        }
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True, reasoning="Compare regions"
+        )
+
+        result = await decide_visualization_node(state, mock_llm_client)
+
+        # Would be skipped as a single scalar if query_data were inspected
+        assert result["should_visualize"] is True
+        prompt = mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert "region, sales" in prompt
+
+    @pytest.mark.asyncio
+    async def test_decision_prompt_has_static_system_prefix(self, mock_llm_client, base_unified_state):
+        """Test that only the user message varies between decisions."""
+        mock_llm_client.generate_structured.return_value = VizDecision(should_visualize=True, reasoning="ok")
+        for query, rows in (("Sales performance for each region", 2), ("Revenue for the last quarter", 40)):
+            state = base_unified_state.copy()
+            state["user_query"] = query
+            state["query_success"] = True
+            state["query_data"] = [{"month": i, "revenue": i * 10} for i in range(rows)]
+            await decide_visualization_node(state, mock_llm_client)
+
+        first, second = mock_llm_client.generate_structured.call_args_list
+        assert first.kwargs["system_prompt"] is VIZ_DECISION_SYSTEM_PREFIX
+        assert second.kwargs["system_prompt"] is VIZ_DECISION_SYSTEM_PREFIX
+        assert "Query: Revenue for the last quarter" in second.kwargs["prompt"]
+        assert "Rows: 40" in second.kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_decision_prompt_caps_summary(self, mock_llm_client, base_unified_state):
+        """Test that a verbose analysis summary is truncated in the prompt."""
+        mock_llm_client.generate_structured.return_value = VizDecision(should_visualize=True, reasoning="ok")
+        state = base_unified_state.copy()
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
+        state["query_success"] = True
+        state["query_data"] = [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}]
+        state["analysis_results"] = {"summary": "x" * 5000}
+
+        await decide_visualization_node(state, mock_llm_client)
+
+        prompt = mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert "Summary: " + "x" * 500 + "..." in prompt
+        assert "x" * 501 not in prompt
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query,rows,expected", [
+        ("Show sales by region", 2, True),
+        ("Compare revenue trend over time", 40, True),
+        ("Visualize revenue per product", 3, True),
+        ("How many customers signed up?", 1, False),
+        ("What is the total revenue", 3, False),
+    ])
+    async def test_keyword_decision_skips_llm(self, mock_llm_client, base_unified_state, query, rows, expected):
+        """Test that clear-cut queries are decided without calling the LLM."""
+        state = base_unified_state.copy()
+        state["user_query"] = query
+        state["query_success"] = True
+        state["query_data"] = [{"month": i, "revenue": i * 10} for i in range(rows)]
+
+        result = await decide_visualization_node(state, mock_llm_client)
+
+        assert result["should_visualize"] is expected
+        mock_llm_client.generate_structured.assert_not_called()
+
+    def test_heuristic_decision_defers_ambiguous_queries(self):
+        """Test that mixed or keyword-free queries are left to the LLM."""
+        by_region = _query_schema([{"region": "North", "value": 10.5}] * 5)
+        assert _heuristic_visualization_decision("Show the average order value by region", by_region) is None
+        assert _heuristic_visualization_decision("Revenue for the last quarter", by_region) is None
+        # Lookup keywords on large results are not conclusive
+        orders = _query_schema([{"order_id": 1, "customer": "Acme", "total": 10}] * 500)
+        assert _heuristic_visualization_decision("List the orders from March", orders) is None
+
+    @pytest.mark.parametrize("query,rows,expected", [
+        ("What is the average sales by store", [{"store": "A", "sales": 10.5}] * 5, False),
+        ("show regions", [{"region": "North", "manager": "Ann"}] * 2, True),
+    ])
+    def test_heuristic_decision_keeps_keyword_outcomes(self, query, rows, expected):
+        """Test that result-shape signals cannot pull keyword-decided queries into the LLM band."""
+        decision = _heuristic_visualization_decision(query, _query_schema(rows))
+
+        assert decision is not None
+        assert decision.should_visualize is expected
+
+    def test_heuristic_decision_uses_result_shape(self):
+        """Test that result shape alone can settle keyword-free queries."""
+        decision = _heuristic_visualization_decision(
+            "Revenue for the last quarter",
+            _query_schema([{"month": "Jan", "revenue": 100}] * 40),
+        )
+        assert decision.should_visualize is True
+        assert "numeric measures" in decision.reasoning
+
+        decision = _heuristic_visualization_decision(
+            "List the customer names",
+            _query_schema([{"name": "Acme"}, {"name": "Globex"}]),
+        )
+        assert decision.should_visualize is False
+
+    @pytest.mark.asyncio
+    async def test_plan_template_shared_across_queries(self, mock_llm_client, base_unified_state, monkeypatch):
+        """Test that queries with the same intent and result shape reuse the decision template."""
+        templates = {}
+
+        async def get(namespace, key):
+            return templates.get((namespace, key))
+
+        async def set_(namespace, key, value, ttl_seconds):
+            templates[(namespace, key)] = value
+
+        monkeypatch.setattr(execution_cache, "get", get)
+        monkeypatch.setattr(execution_cache, "set", set_)
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True, reasoning="Compare regions", suggested_chart_type="bar"
+        )
+
+        results = []
+        for query in ("Sales performance for North and South", "Revenue split across regions"):
+            state = base_unified_state.copy()
+            state["user_query"] = query
+            state["query_success"] = True
+            state["query_data"] = [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}]
+            results.append(await decide_visualization_node(state, mock_llm_client))
+
+        assert mock_llm_client.generate_structured.await_count == 1
+        assert list(templates.values()) == [{"should_visualize": True, "suggested_chart_type": "bar"}]
+        assert results[1]["should_visualize"] is True
+        assert results[1]["recommended_chart_type"] == "bar"
+
+    @pytest.mark.asyncio
+    async def test_speculative_decision_replaces_llm_call(self, mock_llm_client, base_unified_state):
+        """Test that a decision asked for during analysis is used when the result agrees."""
+        state = base_unified_state.copy()
+        state["user_query"] = "Sales performance for North and South"  # No decisive keywords
+        assert _should_speculate(state)
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True, reasoning="Compare regions", suggested_chart_type="bar"
+        )
+        analysis_result = {
+            "query_success": True,
+            "query_data": [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}],
+        }
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
+            MockAgent.return_value.workflow.astream = stream_of(analysis_result)
+            updates = await run_analysis_adapter_node(state, llm_client=mock_llm_client)
+        assert updates["speculative_viz_decision"]["suggested_chart_type"] == "bar"
+
+        result = await decide_visualization_node({**state, **updates}, mock_llm_client)
+
+        assert mock_llm_client.generate_structured.await_count == 1
+        assert "Rows: unknown" in mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert result["should_visualize"] is True
+        assert result["recommended_chart_type"] == "bar"
+
+    @pytest.mark.asyncio
+    async def test_speculative_decision_checked_against_result(self, mock_llm_client, base_unified_state):
+        """Test that a speculation contradicted by the result shape falls back to the LLM."""
+        state = base_unified_state.copy()
+        state["user_query"] = "Customer overview for March"  # No decisive keywords
+        mock_llm_client.generate_structured.side_effect = [
+            VizDecision(should_visualize=True, reasoning="Guess from the query"),
+            VizDecision(should_visualize=False, reasoning="Text columns only"),
+        ]
+        analysis_result = {
+            "query_success": True,
+            "query_data": [{"name": "Acme", "city": "Berlin"}, {"name": "Globex", "city": "Paris"}],
+        }
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
+            MockAgent.return_value.workflow.astream = stream_of(analysis_result)
+            updates = await run_analysis_adapter_node(state, llm_client=mock_llm_client)
+        assert "speculative_viz_decision" not in updates
+
+        with patch.object(execution_cache, "get", AsyncMock(return_value=None)), \
+                patch.object(execution_cache, "set", AsyncMock()):
+            result = await decide_visualization_node({**state, **updates}, mock_llm_client)
+
+        assert mock_llm_client.generate_structured.await_count == 2
+        assert result["should_visualize"] is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("outcome", [
+        {"query_success": True, "query_data": []},
+        Exception("Database connection failed"),
+    ])
+    async def test_speculation_cancelled_with_analysis_node(self, mock_llm_client, base_unified_state, outcome):
+        """Test that the speculation does not outlive the analysis node when it is not needed."""
+        state = base_unified_state.copy()
+        state["user_query"] = "Sales performance for North and South"
+        mock_llm_client.generate_structured.side_effect = lambda **kwargs: asyncio.Event().wait()
+        tasks = []
+        create_task = asyncio.create_task
+
+        def track(coro, **kwargs):
+            task = create_task(coro, **kwargs)
+            if coro.__name__ == "_speculative_decision":
+                tasks.append(task)
+            return task
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent, \
+                patch('app.workflows.coordination_nodes.asyncio.create_task', side_effect=track):
+            MockAgent.return_value.workflow.astream = stream_of(outcome)
+            updates = await run_analysis_adapter_node(state, llm_client=mock_llm_client)
+        await asyncio.sleep(0)
+
+        assert "speculative_viz_decision" not in updates
+        assert len(tasks) == 1 and tasks[0].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_speculation_failures_count_against_decision_circuit(self, mock_llm_client, base_unified_state):
+        """Test that a failed speculative call trips the decision circuit like a direct one."""
+        state = base_unified_state.copy()
+        state["user_query"] = "Sales performance for North and South"
+        mock_llm_client.generate_structured.side_effect = TimeoutError("no response")
+        breaker = circuit_breaker(VIZ_DECISION_CIRCUIT)
+        breaker.failure_threshold = 1
+
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAgent:
+            MockAgent.return_value.workflow.astream = stream_of({
+                "query_success": True,
+                "query_data": [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}],
+            })
+            updates = await run_analysis_adapter_node(state, llm_client=mock_llm_client)
+
+        assert "speculative_viz_decision" not in updates
+        assert breaker.state == "open"
+        assert not _should_speculate(state)
+
+    def test_no_speculation_for_keyword_queries(self, base_unified_state):
+        """Test that queries the heuristics can settle do not start a speculative call."""
+        state = base_unified_state.copy()
+        assert not _should_speculate(state)  # "Show sales by region"
+        state["user_query"] = "Sales performance for North and South"
+        state["options"] = {"chart_type": "bar"}
+        assert not _should_speculate(state)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_llm(self, mock_llm_client, base_unified_state):
+        """Test that an open decision circuit falls back without calling the LLM."""
+        state = base_unified_state.copy()
+        state["user_query"] = "Sales performance for North and South"
+        state["query_success"] = True
+        state["query_data"] = [{"region": "North", "sales": 1000}, {"region": "South", "sales": 1500}]
+        breaker = circuit_breaker(VIZ_DECISION_CIRCUIT)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+
+        with patch.object(execution_cache, "get", AsyncMock(return_value=None)):
+            result = await decide_visualization_node(state, mock_llm_client)
+
+        mock_llm_client.generate_structured.assert_not_called()
+        assert result["should_visualize"] is True
+        assert "unavailable" in result["warnings"][0]
+        assert not _should_speculate(state)
+
+    def test_query_intent_label(self):
+        """Test intent labels from decision keywords."""
+        assert _query_intent_label("Show the AVERAGE order value over time") == "average+over_time+show"
+        assert _query_intent_label("Revenue for the last quarter") == "generic"
+
+    def test_query_schema_summarizes_rows(self):
+        """Test query_schema columns, row count and dtypes."""
+        schema = _query_schema([{"region": "North", "sales": 1000}, {"region": "South", "sales": 1.5}])
+
+        assert schema == {
+            "columns": ["region", "sales"],
+            "row_count": 2,
+            "dtypes": {"region": "str", "sales": "int"},
+        }
+        assert _query_schema(None) == {"columns": [], "row_count": 0, "dtypes": {}}
+
+    def test_query_schema_skips_leading_nulls(self):
+        """Test that a NULL in the first row does not hide a column's type."""
+        rows = [
+            {"region": "North", "sales": None, "note": None},
+            {"region": "South", "sales": 1500, "note": None},
+        ]
+
+        schema = _query_schema(rows)
+
+        assert schema["dtypes"] == {"region": "str", "sales": "int", "note": "NoneType"}
+        _, reasons = _score_visualization("Sales performance for North and South", schema)
+        assert "categories paired with numeric measures" in reasons
+
+    def test_decision_cache_key_buckets_row_counts(self):
+        """Test that cache keys ignore column order and group similar row counts."""
+        key = decision_cache_key("Sales by region", ["sales", "region"], 40)
+
+        assert key == decision_cache_key("sales  by REGION", ["region", "sales"], 75)
+        assert key != decision_cache_key("Sales by region", ["region", "sales"], 400)
+
+
 class TestRunVisualizationAdapterNode:
     """Tests for run_visualization_adapter_node."""
 
@@ -281,6 +784,88 @@ class TestRunVisualizationAdapterNode:
             assert "Chart generation failed" in result["warnings"][0]
 
 
+class TestAgentPool:
+    """Tests for adapter agent pooling."""
+
+    def test_agent_reused_for_same_dependencies(self, mock_llm_client):
+        """Same dependencies return the same agent; new ones build another."""
+        agent = _get_visualization_agent(mock_llm_client)
+
+        assert _get_visualization_agent(mock_llm_client) is agent
+        assert _get_visualization_agent(MagicMock()) is not agent
+        assert len(_agent_pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_release_checkpoint_thread(self):
+        """Finished runs leave no checkpoints behind in a pooled agent."""
+        from typing import TypedDict
+        from langgraph.checkpoint.memory import MemorySaver
+        from langgraph.graph import StateGraph, START, END
+
+        class CounterState(TypedDict):
+            count: int
+
+        graph = StateGraph(CounterState)
+        graph.add_node("increment", lambda state: {"count": state["count"] + 1})
+        graph.add_edge(START, "increment")
+        graph.add_edge("increment", END)
+        agent = MagicMock()
+        agent.workflow = graph.compile(checkpointer=MemorySaver())
+        config = {"configurable": {"thread_id": "viz-1"}}
+
+        await agent.workflow.ainvoke({"count": 0}, config=config)
+        assert await agent.workflow.checkpointer.aget_tuple(config) is not None
+
+        await _release_checkpoint_thread(agent, config)
+        assert await agent.workflow.checkpointer.aget_tuple(config) is None
+
+
+class TestSubgraphConfig:
+    """Tests for subgraph RunnableConfig construction."""
+
+    def test_langfuse_fields_only_when_tracing(self, base_unified_state):
+        """Callbacks, metadata and tags are added only with a handler."""
+        handler = MagicMock()
+
+        config = _subgraph_config(base_unified_state, "viz-1", "visualization", "VisualizationAgent", handler)
+        untraced = _subgraph_config(base_unified_state, "viz-1", "visualization", "VisualizationAgent")
+
+        assert config["configurable"] == {"thread_id": "viz-1"}
+        assert config["callbacks"] == [handler]
+        assert config["run_name"] == "VisualizationAgent: Show sales by region"
+        assert config["metadata"]["workflow_id"] == "test-workflow-123"
+        assert config["tags"] == ["unified-workflow", "visualization-agent"]
+        assert untraced == {"configurable": {"thread_id": "viz-1"}}
+
+
+class TestExecutionCacheKeys:
+    """Tests for subgraph result cache keys."""
+
+    def test_caching_is_opt_in(self, base_unified_state):
+        """Results are only cached for requests that ask for it."""
+        state = base_unified_state.copy()
+        assert _cache_ttl(state) == 0
+
+        state["options"] = {"cache_results": True}
+        assert _cache_ttl(state) == settings.agent.execution_cache_ttl
+        state["options"] = {"refresh_cache": True, "cache_ttl": 30}
+        assert _cache_ttl(state) == 30
+
+    def test_visualization_key_ignores_row_payload(self, base_unified_state):
+        """The visualization key comes from the SQL and result shape, not each row."""
+        state = base_unified_state.copy()
+        state["options"] = {"cache_results": True}
+        state["generated_sql"] = "SELECT region, sales FROM sales"
+        state["query_schema"] = {"columns": ["region", "sales"], "row_count": 2, "dtypes": {}}
+        state["query_data"] = [{"region": "North", "sales": 1}, {"region": "South", "sales": 2}]
+        key = _visualization_cache_key(state)
+
+        state["query_data"] = [{"region": "North", "sales": 5}, {"region": "South", "sales": 6}]
+        assert _visualization_cache_key(state) == key
+        state["generated_sql"] = "SELECT region, profit FROM sales"
+        assert _visualization_cache_key(state) != key
+
+
 class TestAggregateResultsNode:
     """Tests for aggregate_results_node."""
 
@@ -298,8 +883,32 @@ class TestAggregateResultsNode:
         assert result["workflow_stage"] == "completed"
         assert result["execution_time_ms"] > 0
         assert result["completed_at"] is not None
-        # Insights should be combined
-        assert len(result["insights"]) == 2
+        # Chart insights are appended to the analysis insights by the state reducer
+        assert result["insights"] == ["Insight from chart"]
+
+    @pytest.mark.asyncio
+    async def test_execution_time_uses_monotonic_start(self, base_unified_state):
+        """Execution time is measured from the monotonic start, not created_at."""
+        state = base_unified_state.copy()
+        state["start_monotonic_ns"] = time.monotonic_ns() - 250_000_000
+        state["start_clock_id"] = MONOTONIC_CLOCK_ID
+
+        result = await aggregate_results_node(state)
+
+        assert 250 <= result["execution_time_ms"] < 10_000
+        assert datetime.fromisoformat(result["completed_at"]).tzinfo is not None
+
+    @pytest.mark.asyncio
+    async def test_execution_time_ignores_other_process_clock(self, base_unified_state):
+        """A monotonic start from another process (resumed checkpoint) is not used."""
+        state = base_unified_state.copy()
+        state["created_at"] = (datetime.now(timezone.utc) - timedelta(seconds=2)).isoformat()
+        state["start_monotonic_ns"] = time.monotonic_ns() + 10**12  # Another process's clock
+        state["start_clock_id"] = "other-process"
+
+        result = await aggregate_results_node(state)
+
+        assert 2000 <= result["execution_time_ms"] < 10_000
 
     @pytest.mark.asyncio
     async def test_aggregation_with_errors(self, base_unified_state):
@@ -324,6 +933,12 @@ class TestAggregateResultsNode:
         assert result["workflow_status"] == "partial_success"
 
 
+def test_append_agents_reducer_accepts_restored_lists():
+    """agents_executed concatenates into a tuple, also from checkpointed lists."""
+    assert append_agents((), ("analysis",)) == ("analysis",)
+    assert append_agents(["analysis"], ("visualization",)) == ("analysis", "visualization")
+
+
 class TestShouldVisualizeRouter:
     """Tests for should_visualize_router."""
 
@@ -121,3 +121,23 @@ async def test_correlation_analysis_significant_correlations():
     assert "correlation" in top_corr
     assert "strength" in top_corr
     assert "direction" in top_corr
+
+
+@pytest.mark.asyncio
+async def test_correlation_analysis_sparse_column_is_pairwise():
+    """Test that missing values in one column do not drop rows for other pairs."""
+    data = [
+        {"x": 1, "y": 2, "sparse": 5},
+        {"x": 2, "y": 4, "sparse": None},
+        {"x": 3, "y": 5, "sparse": 3},
+        {"x": 4, "y": 9, "sparse": None},
+        {"x": 5, "y": 10, "sparse": 1},
+        {"x": 6, "y": 11, "sparse": None},
+    ]
+
+    result = await correlation_analysis(data)
+
+    # x/y use all 6 rows (listwise deletion would keep only 3 of them)
+    assert result.correlation_matrix["x"]["y"] == pytest.approx(0.9796, abs=1e-3)
+    # x/sparse use the 3 rows where sparse has a value
+    assert result.correlation_matrix["x"]["sparse"] == pytest.approx(-1.0, abs=1e-3)
@@ -0,0 +1,107 @@
+"""
+Unit tests for workflow error recovery strategies.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from app.workflows.error_recovery import ErrorRecoveryStrategy, retry_policy
+
+
+@pytest.mark.parametrize("message,expected", [
+    ("Connection refused by host", "Database connection failed"),
+    ("SQL syntax error near SELECT", "SQL generation or execution failed"),
+    ("Syntax Error at line 1", "SQL generation or execution failed"),
+    ("Statement TIMEOUT exceeded", "Query timed out"),
+    ("Something unexpected", "Analysis failed"),
+])
+def test_analysis_failure_guidance(message, expected):
+    """Test that analysis errors are classified into specific guidance."""
+    result = ErrorRecoveryStrategy.handle_analysis_failure("wf-1", RuntimeError(message))
+
+    assert result["workflow_status"] == "failed"
+    assert result["errors"] == [f"Analysis failed: {message}"]
+    assert result["recommendations"][0].startswith(expected)
+
+
+@pytest.mark.parametrize("message,expected", [
+    ("Invalid DATA format", "Data format incompatible"),
+    ("Plotly figure could not be built", "Chart generation failed"),
+    ("Unknown failure", "Visualization unavailable"),
+])
+def test_visualization_failure_guidance(message, expected):
+    """Test that visualization errors are classified into specific guidance."""
+    result = ErrorRecoveryStrategy.handle_visualization_failure("wf-1", ValueError(message))
+
+    assert result["partial_success"] is True
+    assert result["recommendations"][0].startswith(expected)
+
+
+def test_error_response_timestamps():
+    """Test execution time from created_at and the completed_at fallback."""
+    created_at = (datetime.utcnow() - timedelta(seconds=2)).isoformat()
+
+    result = ErrorRecoveryStrategy.create_error_response("wf-1", "boom", created_at=created_at)
+    assert result["created_at"] == created_at
+    assert 2000 <= result["execution_time_ms"] < 10000
+
+    result = ErrorRecoveryStrategy.create_error_response("wf-1", "boom")
+    assert result["created_at"] == result["completed_at"]
+    assert result["execution_time_ms"] == 0
+
+    result = ErrorRecoveryStrategy.create_error_response("wf-1", "boom", created_at="not a date")
+    assert result["execution_time_ms"] == 0
+
+
+def test_error_response_monotonic_execution_time():
+    """Test that a monotonic start takes precedence over created_at."""
+    result = ErrorRecoveryStrategy.create_error_response(
+        "wf-1",
+        "boom",
+        created_at="2020-01-01T00:00:00",
+        start_monotonic_ns=time.monotonic_ns() - 1_500_000_000,
+    )
+
+    assert result["created_at"] == "2020-01-01T00:00:00"
+    assert 1500 <= result["execution_time_ms"] < 10000
+
+
+def test_retry_delay_backoff_with_jitter():
+    """Test exponential backoff bounds, including jitter and the cap."""
+    for retry_count, base in [(0, 1.0), (1, 2.0), (3, 8.0)]:
+        delay = retry_policy.get_retry_delay(retry_count)
+        assert base <= delay <= base * 1.5
+    assert retry_policy.get_retry_delay(10) == 30.0
+
+
+def _wrapped(cause: Exception) -> Exception:
+    try:
+        raise RuntimeError("MindsDB request failed") from cause
+    except RuntimeError as e:
+        return e
+
+
+@pytest.mark.parametrize("error,retry_count,expected", [
+    (TimeoutError("timed out"), 0, True),
+    (ConnectionResetError("reset"), 2, True),
+    (_wrapped(httpx.ConnectError("refused")), 0, True),
+    (TimeoutError("timed out"), 3, False),
+    (ValueError("bad SQL"), 0, False),
+    (_wrapped(ValueError("bad SQL")), 0, False),
+])
+def test_should_retry(error, retry_count, expected):
+    """Test transient error classification through the cause chain."""
+    assert retry_policy.should_retry(error, retry_count) is expected
+
+
+def test_error_response_with_aware_created_at():
+    """Test execution time for the orchestrator's timezone-aware created_at."""
+    created_at = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+
+    result = ErrorRecoveryStrategy.create_error_response("wf-1", "boom", created_at=created_at)
+
+    assert 1000 <= result["execution_time_ms"] < 10000
+    assert datetime.fromisoformat(result["completed_at"]).tzinfo is not None
@@ -0,0 +1,176 @@
+"""
+Tests for the agent subgraph execution cache.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.workflows.execution_cache import (
+    CACHED_AT_KEY,
+    execution_cache,
+    execution_cached,
+    execution_fingerprint,
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(execution_cache, "enabled", True)
+    monkeypatch.setattr(execution_cache, "_client", client)
+    monkeypatch.setattr(execution_cache, "_disabled_until", 0.0)
+    return client
+
+
+def _make_cached(calls, should_cache=lambda result: True, ttl=60):
+    @execution_cached(
+        "test",
+        key_fn=lambda query: (execution_fingerprint(query), ttl) if ttl else None,
+        should_cache=should_cache,
+    )
+    async def run(query):
+        calls.append(query)
+        return {"query": query, "rows": [1, 2, 3]}
+
+    return run
+
+
+def test_fingerprint_ignores_dict_key_order():
+    """Test that option dicts hash the same regardless of insertion order."""
+    assert execution_fingerprint({"a": 1, "b": 2}) == execution_fingerprint({"b": 2, "a": 1})
+    assert execution_fingerprint("q", {"a": 1}) != execution_fingerprint("q", {"a": 2})
+
+
+
+def test_fingerprint_handles_query_result_values():
+    """Test that rows with Decimal, datetime and numpy values fingerprint stably."""
+    rows = [{"sales": Decimal("10.50"), "day": datetime(2024, 1, 1), "qty": np.int64(3)}]
+
+    assert execution_fingerprint(rows) == execution_fingerprint(list(rows))
+    assert execution_fingerprint(rows) != execution_fingerprint([{**rows[0], "qty": np.int64(4)}])
+
+@pytest.mark.asyncio
+async def test_repeat_call_returns_stored_result(fake_redis):
+    """Test that an identical call is served from the cache."""
+    calls = []
+    run = _make_cached(calls)
+
+    first = await run("sales by region")
+    second = await run("sales by region")
+
+    assert calls == ["sales by region"]
+    assert second.pop(CACHED_AT_KEY)
+    assert second == first
+    assert list(fake_redis.ttls.values()) == [60]
+
+
+@pytest.mark.asyncio
+async def test_results_round_trip_as_json(fake_redis):
+    """Test that stored results are JSON and query values come back typed."""
+    rows = [{
+        "sales": Decimal("10.50"),
+        "day": date(2024, 1, 1),
+        "updated": datetime(2024, 1, 1, 12, 30),
+        "qty": np.int64(3),
+    }]
+
+    await execution_cache.set("test", "fp", {"rows": rows}, 60)
+    payload = fake_redis.store["test:fp"]
+
+    assert json.loads(payload)["rows"][0]["qty"] == 3
+    assert await execution_cache.get("test", "fp") == {
+        "rows": [{"sales": Decimal("10.50"), "day": date(2024, 1, 1),
+                  "updated": datetime(2024, 1, 1, 12, 30), "qty": 3}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_unsupported_values_are_not_stored(fake_redis):
+    """Test that results JSON cannot represent are skipped, not stringified."""
+    await execution_cache.set("test", "fp", {"handle": object()}, 60)
+
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_refresh_replaces_stored_result(fake_redis):
+    """Test that refresh skips the lookup and stores the new result."""
+    calls = []
+
+    @execution_cached(
+        "test",
+        key_fn=lambda query, refresh: (execution_fingerprint(query), 60),
+        refresh=lambda query, refresh: refresh,
+    )
+    async def run(query, refresh):
+        calls.append(query)
+        return {"call": len(calls)}
+
+    await run("sales", False)
+    assert (await run("sales", True))["call"] == 2
+    assert (await run("sales", False))["call"] == 2
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_results_rejected_by_predicate_are_not_stored(fake_redis):
+    """Test that should_cache=False results are re-computed next time."""
+    calls = []
+    run = _make_cached(calls, should_cache=lambda result: False)
+
+    await run("sales by region")
+    await run("sales by region")
+
+    assert len(calls) == 2
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_bypasses_cache(fake_redis):
+    """Test that a None key (e.g. cache_ttl=0) skips lookup and storage."""
+    calls = []
+    run = _make_cached(calls, ttl=0)
+
+    await run("sales by region")
+    await run("sales by region")
+
+    assert len(calls) == 2
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_a_miss(monkeypatch):
+    """Test that Redis errors fall back to running the function."""
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("connection refused")
+
+    monkeypatch.setattr(execution_cache, "enabled", True)
+    monkeypatch.setattr(execution_cache, "_client", BrokenRedis())
+    monkeypatch.setattr(execution_cache, "_disabled_until", 0.0)
+    calls = []
+    run = _make_cached(calls)
+
+    result = await run("sales by region")
+
+    assert result["rows"] == [1, 2, 3]
+    assert calls == ["sales by region"]
@@ -0,0 +1,77 @@
+"""
+Unit tests for HITLService request creation.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.hitl_service import HITLService
+
+OPTIONS = [{"action": "approve", "label": "Execute as-is"}]
+
+
+@pytest.fixture
+def hitl_service():
+    """Create HITL service with a mocked DB session and repository."""
+    service = HITLService(db_session=MagicMock())
+    service.enabled = True
+    requested_at = datetime.utcnow()
+    service.repository = MagicMock()
+    service.repository.create_request = AsyncMock(return_value=MagicMock(
+        request_id="req-1",
+        requested_at=requested_at,
+        timeout_at=requested_at + timedelta(seconds=60),
+    ))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_commit(hitl_service):
+    """Test that the WebSocket broadcast runs while the request commits."""
+    commit_done = asyncio.Event()
+    committed_before_broadcast = []
+
+    async def commit():
+        await asyncio.sleep(0)
+        commit_done.set()
+
+    async def broadcast(request, option_dicts=None):
+        committed_before_broadcast.append(commit_done.is_set())
+
+    hitl_service.db_session.commit = AsyncMock(side_effect=commit)
+    hitl_service._broadcast_intervention_request = AsyncMock(side_effect=broadcast)
+    hitl_service._wait_for_response = AsyncMock(return_value=None)
+    hitl_service._handle_timeout = AsyncMock(return_value=MagicMock(outcome="timeout"))
+
+    await hitl_service.request_human_input(
+        session_id="wf-1",
+        intervention_type="approve_query",
+        context={"generated_sql": "SELECT 1"},
+        options=OPTIONS,
+        timeout=60,
+    )
+
+    assert committed_before_broadcast == [False]
+    assert commit_done.is_set()
+    hitl_service._broadcast_intervention_request.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_drops_pending_request(hitl_service):
+    """Test that a request whose commit fails is not left pending."""
+    hitl_service.db_session.commit = AsyncMock(side_effect=RuntimeError("db down"))
+    hitl_service._broadcast_intervention_request = AsyncMock()
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await hitl_service.request_human_input(
+            session_id="wf-1",
+            intervention_type="approve_query",
+            context={},
+            options=OPTIONS,
+            timeout=60,
+        )
+
+    assert "req-1" not in hitl_service._pending_requests
@@ -0,0 +1,88 @@
+"""
+Unit tests for LLMClient structured generation.
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from openai import BadRequestError
+
+from app.core.llm import LLMClient, LLMError
+from app.schemas.visualization_schemas import VizDecision
+
+
+@pytest.fixture
+def llm_client():
+    """Create LLM client with a mocked OpenAI async client."""
+    client = LLMClient(enable_langfuse=False)
+    client._async_client = MagicMock()
+    client._async_client.chat.completions.parse = AsyncMock()
+    return client
+
+
+def _parsed_response(parsed, refusal=None):
+    message = MagicMock(parsed=parsed, refusal=refusal)
+    return MagicMock(choices=[MagicMock(message=message)])
+
+
+@pytest.mark.asyncio
+async def test_generate_structured_returns_parsed_model(llm_client):
+    """Test that the provider-parsed model is returned as is."""
+    decision = VizDecision(should_visualize=True, reasoning="Compare regions", suggested_chart_type="bar")
+    llm_client._async_client.chat.completions.parse.return_value = _parsed_response(decision)
+
+    result = await llm_client.generate_structured(
+        prompt="Query: sales by region", schema=VizDecision, system_prompt="You are an expert."
+    )
+
+    assert result is decision
+    kwargs = llm_client._async_client.chat.completions.parse.call_args.kwargs
+    assert kwargs["response_format"] is VizDecision
+    assert kwargs["messages"][0] == {"role": "system", "content": "You are an expert."}
+
+
+@pytest.mark.asyncio
+async def test_generate_structured_refusal_raises(llm_client):
+    """Test that a refusal surfaces as LLMError."""
+    llm_client._async_client.chat.completions.parse.return_value = _parsed_response(None, "Cannot help")
+
+    with pytest.raises(LLMError, match="refused"):
+        await llm_client.generate_structured(prompt="Query", schema=VizDecision)
+
+
+@pytest.mark.asyncio
+async def test_generate_structured_falls_back_to_json_mode(llm_client):
+    """Test fallback when the API version rejects structured outputs."""
+    request = httpx.Request("POST", "https://example.invalid")
+    llm_client._async_client.chat.completions.parse.side_effect = BadRequestError(
+        "response_format json_schema unsupported",
+        response=httpx.Response(400, request=request),
+        body=None,
+    )
+    fallback = VizDecision(should_visualize=False, reasoning="Single value")
+    llm_client.generate_with_schema = AsyncMock(return_value=fallback)
+
+    result = await llm_client.generate_structured(
+        prompt="Query", schema=VizDecision, system_prompt="Guidelines"
+    )
+
+    assert result is fallback
+    assert llm_client.generate_with_schema.call_args.kwargs["prompt"] == "Guidelines\n\nQuery"
+
+
+@pytest.mark.asyncio
+async def test_generate_with_schema_retries_invalid_json(llm_client):
+    """Test that JSON-mode output is validated and malformed output is retried."""
+    def completion(content):
+        message = MagicMock(content=content)
+        return MagicMock(choices=[MagicMock(message=message)], usage=MagicMock(total_tokens=10))
+
+    llm_client._async_client.chat.completions.create = AsyncMock(side_effect=[
+        completion('{"should_visualize": true, "reasoning": '),
+        completion('{"should_visualize": true, "reasoning": "Compare regions"}'),
+    ])
+
+    result = await llm_client.generate_with_schema(prompt="Query", schema=VizDecision)
+
+    assert result == VizDecision(should_visualize=True, reasoning="Compare regions")
+    assert llm_client._async_client.chat.completions.create.await_count == 2
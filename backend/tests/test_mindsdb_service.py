@@ -0,0 +1,102 @@
+"""
+Unit tests for MindsDBService retries.
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.mindsdb_service import MindsDBError, MindsDBService
+
+
+def _service(handler) -> MindsDBService:
+    service = MindsDBService(api_url="http://mindsdb.test")
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_tables_retries_connection_errors():
+    """Test that a dropped connection is retried with backoff."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            raise httpx.ConnectError("reset", request=request)
+        return httpx.Response(200, json=[{"name": "orders"}])
+
+    with patch("app.services.mindsdb_service.asyncio.sleep", new=AsyncMock()) as sleep, \
+            patch("app.core.errors.random.random", return_value=0.0):
+        tables = await _service(handler).get_tables("sales")
+
+    assert tables == [{"name": "orders"}]
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_get_tables_gives_up_after_max_retries():
+    """Test that a persistent outage surfaces as MindsDBError."""
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    service = _service(handler)
+    with patch("app.services.mindsdb_service.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(MindsDBError, match="Request error") as exc_info:
+            await service.get_tables("sales")
+
+    assert isinstance(exc_info.value.__cause__, httpx.ReadTimeout)
+
+
+@pytest.mark.asyncio
+async def test_get_tables_does_not_retry_http_errors():
+    """Test that an HTTP error response fails on the first attempt."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    with pytest.raises(MindsDBError, match="HTTP 500"):
+        await _service(handler).get_tables("sales")
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response,transient", [
+    (httpx.Response(400, text="canceling statement due to statement timeout"), False),
+    (httpx.Response(503, text="Service Unavailable"), True),
+    (httpx.ReadTimeout("timed out"), True),
+])
+async def test_execute_query_marks_transient_failures(response, transient):
+    """Test that only MindsDB transport failures are marked transient, not query errors."""
+    def handler(request):
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with patch("app.services.mindsdb_service.asyncio.sleep", new=AsyncMock()):
+        result = await _service(handler).execute_query("SELECT * FROM sales.orders")
+
+    assert result.success is False
+    assert result.transient is transient
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status,attempts", [(503, 3), (400, 1)])
+async def test_execute_query_retries_only_unavailable_mindsdb(status, attempts):
+    """Test that 5xx responses are retried with the retry policy, rejected queries are not."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(status, text="failed")
+
+    with patch("app.services.mindsdb_service.asyncio.sleep", new=AsyncMock()) as sleep, \
+            patch("app.core.errors.random.random", return_value=0.0):
+        result = await _service(handler).execute_query("SELECT 1")
+
+    assert result.success is False
+    assert len(calls) == attempts
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0][:attempts - 1]
@@ -2,8 +2,10 @@
 Tests for trend_analysis statistical tool.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
-from app.tools.statistical_tools import trend_analysis
+from app.tools.statistical_tools import trend_analysis, trend_analysis_many
 
 
 @pytest.mark.asyncio
@@ -188,3 +190,77 @@ async def test_trend_weak_relationship():
     assert result.trend_direction in ["increasing", "stable"]  # Might be either due to noise
     assert 0.0 <= result.r_squared <= 1.0
     assert 0.0 <= result.confidence <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_trend_missing_values_keep_time_alignment():
+    """Test that rows with missing values are dropped together with their time."""
+    data = [
+        {"time": 1, "value": 10},
+        {"time": 2, "value": None},  # Missing value
+        {"time": 4, "value": 40},
+        {"time": 8, "value": 80},
+        {"time": 16, "value": 160},
+    ]
+
+    result = await trend_analysis(data, time_column="time", value_column="value")
+
+    assert result.sample_size == 4
+    assert result.slope == pytest.approx(10.0)
+    assert result.r_squared == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_trend_analysis_many_pairs():
+    """Test analyzing several value columns against the same time column."""
+    data = [
+        {"year": 2020 + i, "sales": 1000 + i * 200, "costs": 900 - i * 50, "flat": 7}
+        for i in range(6)
+    ]
+
+    results = await trend_analysis_many(
+        data,
+        pairs=[("year", "sales"), ("year", "costs"), ("year", "flat")],
+    )
+
+    assert [r.value_column for r in results] == ["sales", "costs", "flat"]
+    assert results[0].trend_direction == "increasing"
+    assert results[0].slope == pytest.approx(200.0)
+    assert results[1].trend_direction == "decreasing"
+    assert results[1].slope == pytest.approx(-50.0)
+    assert results[2].trend_direction == "stable"
+
+
+@pytest.mark.asyncio
+async def test_trend_analysis_many_matches_single():
+    """Test that batched results match individual trend_analysis calls."""
+    data = [
+        {"t": i, "a": (i * 7) % 5 + i, "b": None if i == 3 else 50 - 2 * i}
+        for i in range(8)
+    ]
+
+    batched = await trend_analysis_many(data, pairs=[("t", "a"), ("t", "b")])
+    single = [
+        await trend_analysis(data, time_column="t", value_column="a"),
+        await trend_analysis(data, time_column="t", value_column="b"),
+    ]
+
+    for b, s in zip(batched, single):
+        assert b.trend_direction == s.trend_direction
+        assert b.sample_size == s.sample_size
+        assert b.slope == pytest.approx(s.slope)
+        assert b.r_squared == pytest.approx(s.r_squared)
+
+
+@pytest.mark.asyncio
+async def test_trend_with_datetime_time_column():
+    """Test that DATE/TIMESTAMP values from SQL drivers are fitted by row position."""
+    start = datetime(2024, 1, 1)
+    data = [{"day": start + timedelta(days=i), "revenue": 100 + 10 * i} for i in range(12)]
+
+    single = await trend_analysis(data, time_column="day", value_column="revenue")
+    batched = await trend_analysis_many(data, pairs=[("day", "revenue")])
+
+    for result in (single, batched[0]):
+        assert result.trend_direction == "increasing"
+        assert result.slope == pytest.approx(10.0)
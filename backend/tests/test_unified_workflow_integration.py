@@ -10,15 +10,33 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
 from app.workflows.orchestrator import UnifiedWorkflowOrchestrator
+from app.schemas.visualization_schemas import VizDecision
 
 logger = logging.getLogger(__name__)
 
 
+def stream_of(*outcomes):
+    """Mock CompiledStateGraph.astream: each call streams one final state (or raises)."""
+    remaining = iter(outcomes)
+
+    def astream(*args, **kwargs):
+        outcome = next(remaining)
+
+        async def run():
+            if isinstance(outcome, Exception):
+                raise outcome
+            yield "values", outcome
+
+        return run()
+
+    return MagicMock(side_effect=astream)
+
+
 @pytest.fixture
 def mock_llm_client():
     """Create mock LLM client."""
     client = MagicMock()
-    client.generate_text = AsyncMock()
+    client.generate_structured = AsyncMock()
     return client
 
 
@@ -81,20 +99,18 @@ class TestUnifiedWorkflowOrchestrator:
         }
 
         # Mock LLM decision to visualize
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": true,
-            "reasoning": "Data is suitable for comparison chart",
-            "suggested_chart_type": "bar"
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True,
+            reasoning="Data is suitable for comparison chart",
+            suggested_chart_type="bar",
+        )
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent, \
-             patch('app.agents.visualization_agent.VisualizationAgent') as MockVizAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent, \
+             patch('app.workflows.coordination_nodes.VisualizationAgent') as MockVizAgent:
 
             # Setup mocks
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_analysis_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAnalysisAgent.return_value = mock_analysis_instance
 
             mock_viz_instance = MagicMock()
@@ -133,7 +149,10 @@ class TestUnifiedWorkflowOrchestrator:
             assert result["chart_type"] == "bar"
 
             # Verify combined insights
-            assert len(result["insights"]) >= 2  # From both agents
+            assert result["insights"] == [
+                "South region has highest sales",
+                "Bar chart clearly shows South's lead",
+            ]  # From both agents, each once
 
             # Verify both agents executed
             assert "analysis" in result["agents_executed"]
@@ -166,19 +185,17 @@ class TestUnifiedWorkflowOrchestrator:
         }
 
         # Mock LLM decision to NOT visualize
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": false,
-            "reasoning": "Single scalar value doesn't need visualization",
-            "suggested_chart_type": null
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=False,
+            reasoning="Single scalar value doesn't need visualization",
+            suggested_chart_type=None,
+        )
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent:
 
             # Setup mock
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_analysis_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAnalysisAgent.return_value = mock_analysis_instance
 
             # Create orchestrator
@@ -231,20 +248,18 @@ class TestUnifiedWorkflowOrchestrator:
         }
 
         # Mock LLM decision to visualize
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": true,
-            "reasoning": "Should visualize",
-            "suggested_chart_type": "bar"
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=True,
+            reasoning="Should visualize",
+            suggested_chart_type="bar",
+        )
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent, \
-             patch('app.agents.visualization_agent.VisualizationAgent') as MockVizAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent, \
+             patch('app.workflows.coordination_nodes.VisualizationAgent') as MockVizAgent:
 
             # Setup mocks
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_analysis_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAnalysisAgent.return_value = mock_analysis_instance
 
             # VisualizationAgent fails
@@ -284,12 +299,12 @@ class TestUnifiedWorkflowOrchestrator:
     ):
         """Test workflow with analysis failure (total failure)."""
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent:
 
             # AnalysisAgent fails
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(
-                side_effect=Exception("Database connection failed")
+            mock_analysis_instance.workflow.astream = stream_of(
+                Exception("Database connection failed")
             )
             MockAnalysisAgent.return_value = mock_analysis_instance
 
@@ -332,10 +347,10 @@ class TestUnifiedWorkflowOrchestrator:
             "errors": [],
         }
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent:
 
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_analysis_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAnalysisAgent.return_value = mock_analysis_instance
 
             # Create orchestrator
@@ -394,20 +409,18 @@ class TestUnifiedWorkflowOrchestrator:
         }
 
         # Mock LLM to not visualize (simple test)
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": false,
-            "reasoning": "Simple test",
-            "suggested_chart_type": null
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=False,
+            reasoning="Simple test",
+            suggested_chart_type=None,
+        )
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent:
 
             # Setup mock
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(
-                side_effect=[mock_analysis_result_1, mock_analysis_result_2]
+            mock_analysis_instance.workflow.astream = stream_of(
+                mock_analysis_result_1, mock_analysis_result_2
             )
             MockAnalysisAgent.return_value = mock_analysis_instance
 
@@ -471,18 +484,16 @@ class TestUnifiedWorkflowOrchestrator:
             "errors": [],
         }
 
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "should_visualize": false,
-            "reasoning": "Simple test",
-            "suggested_chart_type": null
-        }
-        '''
+        mock_llm_client.generate_structured.return_value = VizDecision(
+            should_visualize=False,
+            reasoning="Simple test",
+            suggested_chart_type=None,
+        )
 
-        with patch('app.agents.analysis_agent_langgraph.AnalysisAgentLangGraph') as MockAnalysisAgent:
+        with patch('app.workflows.coordination_nodes.AnalysisAgentLangGraph') as MockAnalysisAgent:
 
             mock_analysis_instance = MagicMock()
-            mock_analysis_instance.workflow.ainvoke = AsyncMock(return_value=mock_analysis_result)
+            mock_analysis_instance.workflow.astream = stream_of(mock_analysis_result)
             MockAnalysisAgent.return_value = mock_analysis_instance
 
             orchestrator = UnifiedWorkflowOrchestrator(
@@ -0,0 +1,78 @@
+"""
+Tests for the VisualizationAgent workflow graph.
+"""
+
+import asyncio
+
+import plotly.graph_objects as go
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.agents.visualization_agent import VisualizationAgent
+
+
+DATA = [
+    {"region": "North", "sales": 1000},
+    {"region": "South", "sales": 1500},
+]
+
+
+def _llm_with_insights(chat_completion):
+    client = MagicMock()
+    client.chat_completion = chat_completion
+    return client
+
+
+@pytest.mark.asyncio
+async def test_insights_run_in_parallel_with_figure_creation():
+    """Test that insight generation does not wait for the figure branch."""
+    insights_started = asyncio.Event()
+
+    async def chat_completion(**kwargs):
+        insights_started.set()
+        response = MagicMock()
+        response.content = '{"insights": ["South leads North"]}'
+        return response
+
+    async def slow_create_figure(**kwargs):
+        # Completes only once the insights LLM call has started
+        await insights_started.wait()
+        return go.Figure(go.Bar(x=["North", "South"], y=[1000, 1500]))
+
+    agent = VisualizationAgent(llm_client=_llm_with_insights(chat_completion))
+
+    with patch("app.agents.visualization_nodes.create_plotly_figure", slow_create_figure):
+        result = await asyncio.wait_for(
+            agent.create_visualization(
+                session_id="session-1",
+                data=DATA,
+                user_query="Sales by region",
+                chart_type="bar",
+            ),
+            timeout=5,
+        )
+
+    assert result["workflow_status"] == "completed"
+    assert result["chart_insights"] == ["South leads North"]
+    assert result["plotly_figure"]["data"][0]["type"] == "bar"
+
+
+@pytest.mark.asyncio
+async def test_skips_insights_when_disabled():
+    """Test that the figure branch completes the workflow without insights."""
+    async def chat_completion(**kwargs):
+        raise AssertionError("insights should not be requested")
+
+    agent = VisualizationAgent(llm_client=_llm_with_insights(chat_completion))
+
+    result = await agent.create_visualization(
+        session_id="session-1",
+        data=DATA,
+        user_query="Sales by region",
+        chart_type="bar",
+        include_insights=False,
+    )
+
+    assert result["workflow_status"] == "completed"
+    assert result["chart_insights"] == []
+    assert result["completed_at"] is not None
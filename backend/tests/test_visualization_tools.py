@@ -2,10 +2,12 @@
 Tests for visualization tools.
 """
 
+import pandas as pd
 import pytest
 import plotly.graph_objects as go
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.tools import visualization_tools
 from app.tools.visualization_tools import (
     recommend_chart_type,
     create_plotly_figure,
@@ -19,6 +21,17 @@ from app.schemas.visualization_schemas import ChartRecommendation
 # Chart Recommendation Tests
 # ============================================
 
+def test_data_characteristics_cache_sees_middle_rows():
+    """Result sets with the same first and last rows are not conflated."""
+    before = [{"sales": 1}, {"sales": 2}, {"sales": 3}]
+    after = [{"sales": 1}, {"sales": 500}, {"sales": 3}]
+
+    visualization_tools._get_data_characteristics(before)
+    characteristics = visualization_tools._get_data_characteristics(after)
+
+    assert characteristics["columns_summary"]["sales"]["max"] == 500.0
+
+
 @pytest.mark.asyncio
 async def test_recommend_bar_chart_for_categorical_data():
     """Test bar chart recommendation for categorical comparisons."""
@@ -89,6 +102,54 @@ async def test_recommend_chart_empty_data():
     assert result.confidence == 1.0
 
 
+@pytest.mark.asyncio
+async def test_recommend_chart_reuses_data_characteristics():
+    """Test that repeat recommendations for the same data skip re-analysis."""
+    data = [
+        {"warehouse": f"WH-{i}", "stock_units": i * 37}
+        for i in range(12)
+    ]
+
+    mock_llm = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.content = '{"recommended_type": "bar", "reasoning": "Comparison", "confidence": 0.9, "alternatives": []}'
+    mock_llm.chat_completion.return_value = mock_response
+
+    with patch.object(
+        visualization_tools,
+        "_analyze_data_characteristics",
+        wraps=visualization_tools._analyze_data_characteristics,
+    ) as analyze:
+        first = await recommend_chart_type(data, "Stock by warehouse", None, mock_llm)
+        second = await recommend_chart_type(data, "Compare warehouses", None, mock_llm)
+
+    assert analyze.call_count == 1
+    assert first.data_characteristics == second.data_characteristics
+    assert second.data_characteristics["row_count"] == 12
+
+
+@pytest.mark.asyncio
+async def test_recommend_chart_samples_large_data():
+    """Test that large result sets are profiled on a sample but report full row count."""
+    data = [
+        {"order_id": i, "channel": ["web", "store", "phone"][i % 3]}
+        for i in range(5000)
+    ]
+
+    mock_llm = AsyncMock()
+    mock_response = MagicMock()
+    mock_response.content = '{"recommended_type": "bar", "reasoning": "Comparison", "confidence": 0.8, "alternatives": []}'
+    mock_llm.chat_completion.return_value = mock_response
+
+    result = await recommend_chart_type(data, "Orders by channel", None, mock_llm)
+
+    assert result.data_characteristics["row_count"] == 5000
+    assert result.data_characteristics["sampled_rows"] < 5000
+    prompt = mock_llm.chat_completion.call_args.kwargs["messages"][0]["content"]
+    assert "Rows: 5000" in prompt
+    assert "from first" in prompt
+
+
 # ============================================
 # Chart Creation Tests
 # ============================================
@@ -189,6 +250,82 @@ async def test_create_table():
     assert fig.data[0].type == "table"
 
 
+@pytest.mark.asyncio
+async def test_create_correlation_heatmap():
+    """Test correlation heatmap over numeric columns."""
+    data = [
+        {"store": "A", "visits": 120, "orders": 30, "returns": 4},
+        {"store": "B", "visits": 200, "orders": 52, "returns": 3},
+        {"store": "C", "visits": 90, "orders": 21, "returns": 6},
+        {"store": "D", "visits": 160, "orders": 44, "returns": 2},
+    ]
+
+    fig = await create_plotly_figure(
+        data=data,
+        chart_type="heatmap",
+        user_query="Correlation between store metrics",
+    )
+
+    assert fig.data[0].type == "heatmap"
+    assert list(fig.data[0].x) == ["visits", "orders", "returns"]
+    assert fig.data[0].z[0][0] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_correlation_heatmap_skips_constant_columns():
+    """Test that zero-variance columns are left out of the correlation matrix."""
+    data = [
+        {"visits": 120, "orders": 30, "is_active": 1},
+        {"visits": 200, "orders": 52, "is_active": 1},
+        {"visits": 90, "orders": 21, "is_active": 1},
+    ]
+
+    fig = await create_plotly_figure(data, "heatmap", "Metric correlation")
+
+    assert list(fig.data[0].x) == ["visits", "orders"]
+
+
+@pytest.mark.asyncio
+async def test_create_pivot_heatmap_matches_pivot_table():
+    """Test pivot heatmap averages values like DataFrame.pivot_table."""
+    data = [
+        {"region": "West", "quarter": "Q2", "revenue": 40},
+        {"region": "East", "quarter": "Q1", "revenue": 10},
+        {"region": "East", "quarter": "Q1", "revenue": 30},
+        {"region": "West", "quarter": "Q1", "revenue": 25},
+    ]
+
+    fig = await create_plotly_figure(
+        data=data,
+        chart_type="heatmap",
+        user_query="Revenue by region and quarter",
+    )
+
+    expected = pd.DataFrame(data).pivot_table(
+        values="revenue", index="region", columns="quarter", fill_value=0
+    )
+    assert list(fig.data[0].y) == expected.index.tolist()
+    assert list(fig.data[0].x) == expected.columns.tolist()
+    assert [list(row) for row in fig.data[0].z] == expected.to_numpy().tolist()
+
+
+@pytest.mark.asyncio
+async def test_create_chart_from_columnar_and_dataframe_input():
+    """Test that column-oriented dicts and DataFrames chart like row dicts."""
+    columns = {"category": ["A", "B", "C"], "value": [10, 20, 15]}
+    frame = pd.DataFrame(columns)
+
+    from_columns = await create_plotly_figure(columns, "bar", "Values by category")
+    from_frame = await create_plotly_figure(frame, "bar", "Values by category")
+    table = await create_plotly_figure(columns, "table", "Values by category")
+
+    for fig in (from_columns, from_frame):
+        assert list(fig.data[0].x) == ["A", "B", "C"]
+        assert list(fig.data[0].y) == [10, 20, 15]
+    assert list(table.data[0].header.values) == ["category", "value"]
+    assert frame["value"].dtype == "int64"  # caller's frame is not modified
+
+
 @pytest.mark.asyncio
 async def test_create_chart_empty_data_raises_error():
     """Test that empty data raises ValueError."""
@@ -215,6 +352,22 @@ async def test_create_chart_invalid_type_raises_error():
         )
 
 
+def test_downcast_numeric_columns_is_lossless():
+    """Test that numeric columns shrink only when values are preserved exactly."""
+    df = pd.DataFrame({
+        "units": [3, 12, 250],
+        "share": [0.5, 0.25, 0.125],
+        "price": [19.99, 5.49, 120.1],
+    })
+
+    visualization_tools._downcast_numeric_columns(df, ["units", "share", "price"])
+
+    assert df["units"].dtype.itemsize < 8
+    assert df["share"].dtype == "float32"
+    assert df["price"].dtype == "float64"
+    assert df["price"].tolist() == [19.99, 5.49, 120.1]
+
+
 # ============================================
 # Theme Application Tests
 # ============================================
@@ -284,6 +437,34 @@ async def test_apply_theme_with_logo():
     assert styled_fig.layout.images[0].source == custom_profile["logo_url"]
 
 
+@pytest.mark.asyncio
+async def test_apply_theme_customizations_override_profile():
+    """Test that ad-hoc customizations win over profile styling."""
+    data = [{"x": 1, "y": 10}, {"x": 2, "y": 20}]
+    fig = await create_plotly_figure(data, "bar", "Test")
+
+    styled_fig = await apply_plotly_theme(
+        fig,
+        custom_profile={
+            "base_theme": "plotly_white",
+            "color_palette": ["#FF6B35", "#004E89"],
+            "text_color": "#222222",
+            "margin_config": {"l": 40, "r": 40},
+        },
+        customizations={
+            "colors": ["#1A936F"],
+            "margin": {"r": 10},
+            "showlegend": False,
+        },
+    )
+
+    assert styled_fig.layout.colorway == ("#1A936F",)
+    assert styled_fig.layout.margin.l == 40
+    assert styled_fig.layout.margin.r == 10
+    assert styled_fig.layout.font.color == "#222222"
+    assert styled_fig.layout.showlegend is False
+
+
 # ============================================
 # Insights Generation Tests
 # ============================================
@@ -311,7 +492,7 @@ async def test_generate_insights():
     )
 
     assert isinstance(insights, list)
-    assert len(insights) > 0
+    assert insights == ["South has highest sales at 2000", "North has lowest sales at 1000"]
 
 
 @pytest.mark.asyncio
@@ -4,6 +4,9 @@ Unit tests for WebSocket ConnectionManager.
 Tests connection lifecycle, subscription management, and event broadcasting.
 """
 
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from app.websocket.connection_manager import ConnectionManager
@@ -23,6 +26,7 @@ class TestConnectionManager:
         ws = AsyncMock()
         ws.accept = AsyncMock()
         ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         return ws
 
     @pytest.mark.asyncio
@@ -85,13 +89,27 @@ class TestConnectionManager:
         workflow_id = "workflow-456"
 
         manager.active_connections[user_id] = {mock_websocket}
-        manager.workflow_subscriptions[workflow_id] = {mock_websocket}
+        manager.subscribe_to_workflow(mock_websocket, workflow_id)
 
         manager.disconnect(mock_websocket, user_id)
 
         # Verify workflow subscription was cleaned up
         assert workflow_id not in manager.workflow_subscriptions
 
+    def test_disconnect_keeps_other_subscribers(self, manager, mock_websocket):
+        """Test that disconnect only touches the disconnecting socket's workflows."""
+        ws2 = AsyncMock()
+        manager.subscribe_to_workflow(mock_websocket, "workflow-1")
+        manager.subscribe_to_workflow(mock_websocket, "workflow-2")
+        manager.subscribe_to_workflow(ws2, "workflow-2")
+        manager.subscribe_to_workflow(ws2, "workflow-3")
+
+        manager.disconnect(mock_websocket, "user-123")
+
+        assert "workflow-1" not in manager.workflow_subscriptions
+        assert manager.workflow_subscriptions["workflow-2"] == {ws2}
+        assert manager.workflow_subscriptions["workflow-3"] == {ws2}
+
     def test_subscribe_to_workflow(self, manager, mock_websocket):
         """Test subscribing a WebSocket to a workflow."""
         workflow_id = "workflow-123"
@@ -126,7 +144,7 @@ class TestConnectionManager:
         await manager.broadcast_to_workflow(workflow_id, message)
 
         # Verify message was sent
-        mock_websocket.send_json.assert_called_once_with(message)
+        mock_websocket.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
 
     @pytest.mark.asyncio
     async def test_broadcast_to_workflow_no_subscribers(self, manager):
@@ -146,13 +164,13 @@ class TestConnectionManager:
         message = {"event": "test"}
 
         # Simulate send failure
-        mock_websocket.send_json = AsyncMock(side_effect=Exception("Send failed"))
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Send failed"))
         manager.workflow_subscriptions[workflow_id] = {mock_websocket}
 
         await manager.broadcast_to_workflow(workflow_id, message)
 
-        # Verify failed connection was removed
-        assert mock_websocket not in manager.workflow_subscriptions[workflow_id]
+        # Verify failed connection was removed (and the emptied subscription dropped)
+        assert workflow_id not in manager.workflow_subscriptions
 
     @pytest.mark.asyncio
     async def test_broadcast_to_user(self, manager, mock_websocket):
@@ -165,14 +183,14 @@ class TestConnectionManager:
         await manager.broadcast_to_user(user_id, message)
 
         # Verify message was sent
-        mock_websocket.send_json.assert_called_once_with(message)
+        mock_websocket.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
 
     @pytest.mark.asyncio
     async def test_broadcast_to_user_multiple_connections(self, manager, mock_websocket):
         """Test broadcasting to user with multiple connections."""
         user_id = "user-123"
         ws2 = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
         message = {"event": "test"}
 
         manager.active_connections[user_id] = {mock_websocket, ws2}
@@ -180,8 +198,8 @@ class TestConnectionManager:
         await manager.broadcast_to_user(user_id, message)
 
         # Verify message was sent to both connections
-        mock_websocket.send_json.assert_called_once_with(message)
-        ws2.send_json.assert_called_once_with(message)
+        mock_websocket.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
+        ws2.send_text.assert_called_once_with(json.dumps(message, separators=(",", ":")))
 
     @pytest.mark.asyncio
     async def test_broadcast_to_user_no_connections(self, manager):
@@ -201,10 +219,78 @@ class TestConnectionManager:
         message = {"event": "test"}
 
         # Simulate send failure
-        mock_websocket.send_json = AsyncMock(side_effect=Exception("Send failed"))
+        mock_websocket.send_text = AsyncMock(side_effect=Exception("Send failed"))
         manager.active_connections[user_id] = {mock_websocket}
 
         await manager.broadcast_to_user(user_id, message)
 
-        # Verify failed connection was removed
-        assert mock_websocket not in manager.active_connections[user_id]
+        # Verify failed connection was removed (and the emptied entry dropped)
+        assert user_id not in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_broadcast_to_workflow_sends_concurrently(self, manager):
+        """Test that a slow subscriber does not delay sends to the others."""
+        workflow_id = "workflow-123"
+        message = {"event": "test"}
+        fast_sent = asyncio.Event()
+
+        async def slow_send(_):
+            # Only completes once the fast subscriber has already been sent to
+            await asyncio.wait_for(fast_sent.wait(), timeout=1)
+
+        async def fast_send(_):
+            fast_sent.set()
+
+        slow_ws = AsyncMock()
+        slow_ws.send_text = AsyncMock(side_effect=slow_send)
+        fast_ws = AsyncMock()
+        fast_ws.send_text = AsyncMock(side_effect=fast_send)
+        manager.workflow_subscriptions[workflow_id] = {slow_ws, fast_ws}
+
+        await manager.broadcast_to_workflow(workflow_id, message)
+
+        slow_ws.send_text.assert_awaited_once()
+        fast_ws.send_text.assert_awaited_once()
+        assert manager.workflow_subscriptions[workflow_id] == {slow_ws, fast_ws}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_message_once(self, manager):
+        """Test that all subscribers receive the same pre-serialized JSON text."""
+        workflow_id = "workflow-123"
+        message = {"event_type": "progress", "data": {"progress": 0.5, "label": "Schritt"}}
+        sockets = [AsyncMock() for _ in range(3)]
+        manager.workflow_subscriptions[workflow_id] = set(sockets)
+
+        await manager.broadcast_to_workflow(workflow_id, message)
+
+        payloads = [ws.send_text.call_args.args[0] for ws in sockets]
+        assert len(set(payloads)) == 1
+        assert json.loads(payloads[0]) == message
+
+    @pytest.mark.asyncio
+    async def test_broadcast_many_sends_in_order(self, manager):
+        """Test that batched messages reach every subscriber in order."""
+        workflow_id = "workflow-123"
+        messages = [{"event_type": "stage.started"}, {"event_type": "agent.started"}]
+        sockets = [AsyncMock() for _ in range(2)]
+        manager.workflow_subscriptions[workflow_id] = set(sockets)
+
+        await manager.broadcast_many_to_workflow(workflow_id, messages)
+
+        for ws in sockets:
+            sent = [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
+            assert sent == messages
+
+    @pytest.mark.asyncio
+    async def test_broadcast_keeps_healthy_subscribers_after_failure(
+        self, manager, mock_websocket
+    ):
+        """Test that only failed sockets are removed from a workflow subscription."""
+        workflow_id = "workflow-123"
+        failing_ws = AsyncMock()
+        failing_ws.send_text = AsyncMock(side_effect=Exception("Send failed"))
+        manager.workflow_subscriptions[workflow_id] = {mock_websocket, failing_ws}
+
+        await manager.broadcast_to_workflow(workflow_id, {"event": "test"})
+
+        assert manager.workflow_subscriptions[workflow_id] == {mock_websocket}
@@ -17,7 +17,7 @@ from datetime import datetime
 import uuid
 
 from app.main import app
-from app.websocket.events import WorkflowEventType
+from app.websocket.events import WorkflowEvent, WorkflowEventType, create_workflow_event
 from app.workflows.event_emitter import event_emitter
 
 
@@ -46,9 +46,11 @@ async def test_workflow_event_emission():
         await event_emitter.emit_workflow_started(
             workflow_id=workflow_id,
             conversation_id=conversation_id,
-            user_query="Test query",
+            query_preview="Test query",
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event was broadcasted
         assert mock_manager.broadcast_to_workflow.called
         call_args = mock_manager.broadcast_to_workflow.call_args
@@ -58,6 +60,7 @@ async def test_workflow_event_emission():
         assert event["workflow_id"] == workflow_id
         assert event["conversation_id"] == conversation_id
         assert event["progress"] == 0.0
+        assert event["message"] == "Processing: Test query"
 
 
 @pytest.mark.asyncio
@@ -76,6 +79,8 @@ async def test_stage_event_emission():
             progress=0.1,
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event
         call_args = mock_manager.broadcast_to_workflow.call_args
         event = call_args[0][1]
@@ -84,6 +89,32 @@ async def test_stage_event_emission():
         assert event["progress"] == 0.1
 
 
+@pytest.mark.asyncio
+async def test_stage_and_agent_event_emission():
+    """Test that a stage starting with an agent is emitted as one event."""
+    workflow_id = str(uuid.uuid4())
+
+    with patch("app.workflows.event_emitter.connection_manager") as mock_manager:
+        mock_manager.broadcast_to_workflow = AsyncMock()
+
+        await event_emitter.emit_stage_and_agent_started(
+            workflow_id=workflow_id,
+            stage="visualizing",
+            agent="visualization",
+            message="Creating visualization...",
+            progress=0.55,
+        )
+
+        await event_emitter.drain(workflow_id)
+
+        mock_manager.broadcast_to_workflow.assert_awaited_once()
+        event = mock_manager.broadcast_to_workflow.call_args[0][1]
+        assert event["event_type"] == WorkflowEventType.STAGE_AND_AGENT_STARTED
+        assert event["stage"] == "visualizing"
+        assert event["agent"] == "visualization"
+        assert event["progress"] == 0.55
+
+
 @pytest.mark.asyncio
 async def test_agent_event_emission():
     """Test that agent events are emitted correctly."""
@@ -99,6 +130,8 @@ async def test_agent_event_emission():
             progress=0.15,
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event
         call_args = mock_manager.broadcast_to_workflow.call_args
         event = call_args[0][1]
@@ -122,6 +155,8 @@ async def test_workflow_completed_emission():
             conversation_id=conversation_id,
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event
         call_args = mock_manager.broadcast_to_workflow.call_args
         event = call_args[0][1]
@@ -145,6 +180,8 @@ async def test_workflow_failed_emission():
             error="Test error",
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event
         call_args = mock_manager.broadcast_to_workflow.call_args
         event = call_args[0][1]
@@ -180,7 +217,7 @@ async def test_event_order_during_workflow():
         # Simulate workflow event sequence
         await event_emitter.emit_workflow_started(
             workflow_id=workflow_id,
-            user_query="Test query",
+            query_preview="Test query",
         )
 
         await event_emitter.emit_stage_started(
@@ -213,6 +250,8 @@ async def test_event_order_during_workflow():
             workflow_id=workflow_id,
         )
 
+        await event_emitter.drain(workflow_id)
+
         # Verify event order
         assert len(emitted_events) == 6
         assert emitted_events[0]["event_type"] == WorkflowEventType.WORKFLOW_STARTED
@@ -234,6 +273,38 @@ async def test_event_order_during_workflow():
         assert progress_values == sorted(progress_values)
 
 
+@pytest.mark.asyncio
+async def test_emit_does_not_wait_for_broadcast():
+    """Test that emitting returns before a slow broadcast, keeping event order."""
+    workflow_id = str(uuid.uuid4())
+    emitted_events = []
+    release = asyncio.Event()
+
+    with patch("app.workflows.event_emitter.connection_manager") as mock_manager:
+        async def slow_broadcast(wf_id, event):
+            await release.wait()
+            emitted_events.append(event["event_type"])
+
+        async def failing_broadcast(wf_id, events):
+            raise RuntimeError("client gone")
+
+        mock_manager.broadcast_to_workflow = slow_broadcast
+        mock_manager.broadcast_many_to_workflow = failing_broadcast
+
+        await event_emitter.emit_workflow_started(workflow_id=workflow_id, query_preview="Test query")
+        await event_emitter.emit_many(workflow_id, [])
+        await event_emitter.emit_workflow_completed(workflow_id=workflow_id)
+        assert emitted_events == []
+
+        release.set()
+        await event_emitter.drain(workflow_id)
+
+        assert emitted_events == [
+            WorkflowEventType.WORKFLOW_STARTED,
+            WorkflowEventType.WORKFLOW_COMPLETED,
+        ]
+
+
 @pytest.mark.asyncio
 async def test_multiple_workflows_isolated_events():
     """
@@ -260,15 +331,18 @@ async def test_multiple_workflows_isolated_events():
         # Emit events for workflow 1
         await event_emitter.emit_workflow_started(
             workflow_id=workflow_1,
-            user_query="Query 1",
+            query_preview="Query 1",
         )
 
         # Emit events for workflow 2
         await event_emitter.emit_workflow_started(
             workflow_id=workflow_2,
-            user_query="Query 2",
+            query_preview="Query 2",
         )
 
+        await event_emitter.drain(workflow_1)
+        await event_emitter.drain(workflow_2)
+
         # Verify isolation
         assert len(workflow_1_events) == 1
         assert len(workflow_2_events) == 1
@@ -286,8 +360,9 @@ async def test_event_timestamp_format():
 
         await event_emitter.emit_workflow_started(
             workflow_id=workflow_id,
-            user_query="Test",
+            query_preview="Test",
         )
+        await event_emitter.drain(workflow_id)
 
         call_args = mock_manager.broadcast_to_workflow.call_args
         event = call_args[0][1]
@@ -296,3 +371,34 @@ async def test_event_timestamp_format():
         assert "timestamp" in event
         timestamp = datetime.fromisoformat(event["timestamp"])
         assert isinstance(timestamp, datetime)
+
+
+def test_create_workflow_event_matches_schema():
+    """Test that hand-built events carry the same fields as WorkflowEvent."""
+    event = create_workflow_event(
+        WorkflowEventType.STAGE_STARTED,
+        workflow_id="wf-1",
+        stage="analysis",
+        progress=0.25,
+    )
+    expected = WorkflowEvent(
+        event_type=WorkflowEventType.STAGE_STARTED,
+        workflow_id="wf-1",
+        stage="analysis",
+        progress=0.25,
+        timestamp=event["timestamp"],
+    ).model_dump()
+
+    assert event == expected
+    assert list(event) == list(expected)
+
+
+def test_event_timestamp_is_cached_per_second():
+    """Test that events in the same second share one UTC timestamp string."""
+    with patch("app.websocket.events.time.time", return_value=1_700_000_000.25):
+        first = create_workflow_event(WorkflowEventType.PROGRESS_UPDATE, workflow_id="wf-1")
+    with patch("app.websocket.events.time.time", return_value=1_700_000_000.75):
+        second = create_workflow_event(WorkflowEventType.PROGRESS_UPDATE, workflow_id="wf-1")
+
+    assert first["timestamp"] == "2023-11-14T22:13:20Z"
+    assert second["timestamp"] is first["timestamp"]
@@ -27,6 +27,7 @@ export enum WorkflowEventType {
   // Agent events
   AGENT_STARTED = 'agent.started',
   AGENT_COMPLETED = 'agent.completed',
+  STAGE_AND_AGENT_STARTED = 'stage_and_agent.started',  // stage.started + agent.started in one event
 
   // Connection events
   CONNECTION_ACK = 'connection.ack',
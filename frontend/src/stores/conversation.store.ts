@@ -178,6 +178,7 @@ export const useConversationStore = create<ConversationState>((set, get) => ({
             progressMessage = event.message || getStageMessage(event.stage);
             break;
           case WorkflowEventType.AGENT_STARTED:
+          case WorkflowEventType.STAGE_AND_AGENT_STARTED:
             stage = event.agent || 'agent';
             // Use our detailed agent message (more informative than backend's generic message)
             progressMessage = getAgentMessage(event.agent);